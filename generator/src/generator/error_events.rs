@@ -1,45 +1,42 @@
+use std::fmt::Write as _;
+
 use super::get_ns_name_prefix;
 use super::output::Output;
 
 pub(super) fn generate(out: &mut Output, module: &xcbgen::defs::Module) {
-    generate_errors(out, module);
+    let namespaces: Vec<_> = module
+        .sorted_namespaces()
+        .into_iter()
+        .map(NsInfo::new)
+        .collect();
+    let xproto = namespaces
+        .iter()
+        .find(|ns_info| ns_info.ns.header == "xproto")
+        .unwrap();
+
+    generate_errors(out, &namespaces, xproto);
     outln!(out, "");
-    generate_events(out, module);
+    generate_events(out, &namespaces, xproto);
     outln!(out, "");
     outln!(
         out,
-        "/// Get the response type out of the raw bytes of an X11 error or event."
-    );
-    outln!(
-        out,
-        "fn response_type(raw_bytes: &[u8]) -> Result<u8, ParseError> {{"
-    );
-    out.indented(|out| {
-        outln!(out, "raw_bytes.first()");
-        outln!(out.indent(), ".map(|x| x & 0x7f)");
-        outln!(out.indent(), ".ok_or(ParseError::InsufficientData)");
-    });
-    outln!(out, "}}");
-    outln!(out, "");
-    outln!(out, "/// Get the sequence number out of an X11 packet.");
-    outln!(
-        out,
-        "fn sequence_number(raw_bytes: &[u8]) -> Result<u16, ParseError> {{"
+        r"/// Get the response type out of the raw bytes of an X11 error or event.
+fn response_type(raw_bytes: &[u8]) -> Result<u8, ParseError> {{
+    raw_bytes.first()
+        .map(|x| x & 0x7f)
+        .ok_or(ParseError::InsufficientData)
+}}
+
+/// Get the sequence number out of an X11 packet.
+fn sequence_number(raw_bytes: &[u8]) -> Result<u16, ParseError> {{
+    raw_bytes.get(2..4)
+        .map(|b| u16::from_ne_bytes(b.try_into().unwrap()))
+        .ok_or(ParseError::InsufficientData)
+}}"
     );
-    out.indented(|out| {
-        outln!(out, "raw_bytes.get(2..4)");
-        outln!(
-            out.indent(),
-            ".map(|b| u16::from_ne_bytes(b.try_into().unwrap()))"
-        );
-        outln!(out.indent(), ".ok_or(ParseError::InsufficientData)");
-    });
-    outln!(out, "}}");
 }
 
-fn generate_errors(out: &mut Output, module: &xcbgen::defs::Module) {
-    let namespaces = module.sorted_namespaces();
-
+fn generate_errors(out: &mut Output, namespaces: &[NsInfo], xproto: &NsInfo) {
     outln!(out, "/// Enumeration of all possible X11 error kinds.");
     outln!(
         out,
@@ -49,16 +46,11 @@ fn generate_errors(out: &mut Output, module: &xcbgen::defs::Module) {
     outln!(out, "pub enum ErrorKind {{");
     out.indented(|out| {
         outln!(out, "Unknown(u8),");
-        for ns in namespaces.iter() {
-            let has_feature = super::ext_has_feature(&ns.header);
-            let error_defs = sorted_errors(ns);
-
-            for err_name in error_defs.iter().map(|def| def.name()) {
-                if has_feature {
-                    outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
-                }
-                outln!(out, "{}{},", get_ns_name_prefix(ns), err_name);
-            }
+        for ns_info in namespaces.iter() {
+            let block = render_block(&ns_info.errors, |block, error| {
+                writeln!(block, "{}{},", ns_info.cfg, error.variant)
+            });
+            out!(out, "{}", block);
         }
     });
     outln!(out, "}}");
@@ -74,14 +66,12 @@ fn generate_errors(out: &mut Output, module: &xcbgen::defs::Module) {
             outln!(out, "// Check if this is a core protocol error");
             outln!(out, "match error_code {{");
             out.indented(|out| {
-                let xproto_ns = module.namespace("xproto").unwrap();
-                let error_defs = sorted_errors(&xproto_ns);
-                for err_name in error_defs.iter().map(|def| def.name()) {
+                for error in xproto.errors.iter() {
                     outln!(
                         out,
-                        "xproto::{}_ERROR => return Self::{},",
-                        super::camel_case_to_upper_snake(err_name),
-                        err_name,
+                        "xproto::{} => return Self::{},",
+                        error.const_name,
+                        error.name,
                     );
                 }
                 outln!(out, "_ => {{}}");
@@ -93,37 +83,57 @@ fn generate_errors(out: &mut Output, module: &xcbgen::defs::Module) {
                 out,
                 "let ext_info = ext_info_provider.get_from_error_code(error_code);",
             );
+            // The extension is found by comparing its name against every
+            // known extension. A perfect hash (e.g. phf) would add a dependency
+            // to x11rb-protocol to replace a few dozen string comparisons that
+            // mostly already fail on the length check.
             outln!(out, "match ext_info {{");
             out.indented(|out| {
-                for ns in namespaces.iter() {
-                    // skip xproto
-                    if ns.ext_info.is_none() {
-                        continue;
-                    }
-
-                    let error_defs = sorted_errors(ns);
-                    if error_defs.is_empty() {
-                        continue;
-                    }
-                    let has_feature = super::ext_has_feature(&ns.header);
-                    if has_feature {
-                        outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
-                    }
+                // skip xproto and extensions without errors
+                let ext_namespaces = namespaces
+                    .iter()
+                    .filter(|ns_info| ns_info.is_extension() && !ns_info.errors.is_empty());
+                for ns_info in ext_namespaces {
                     outln!(
                         out,
-                        "Some(({}::X11_EXTENSION_NAME, ext_info)) => {{",
-                        ns.header
+                        "{}Some(({}::X11_EXTENSION_NAME, ext_info)) => {{",
+                        ns_info.cfg,
+                        ns_info.ns.header,
                     );
                     out.indented(|out| {
+                        let errors = ns_info.errors.iter().collect();
+                        if let Some(by_number) = dense_by_number(errors, |error| error.number.into()) {
+                            outln!(
+                                out,
+                                "// Indexed by the error codes of {}, which are dense and start at zero",
+                                ns_info.ns.header,
+                            );
+                            outln!(
+                                out,
+                                "const KINDS: [ErrorKind; {}] = [",
+                                by_number.len()
+                            );
+                            for error in by_number.iter() {
+                                outln!(out.indent(), "ErrorKind::{},", error.variant);
+                            }
+                            outln!(out, "];");
+                            outln!(out, "KINDS");
+                            outln!(
+                                out.indent(),
+                                ".get(usize::from(error_code - ext_info.first_error))"
+                            );
+                            outln!(out.indent(), ".copied()");
+                            outln!(out.indent(), ".unwrap_or(Self::Unknown(error_code))");
+                            return;
+                        }
                         outln!(out, "match error_code - ext_info.first_error {{");
-                        for err_name in error_defs.iter().map(|def| def.name()) {
+                        for error in ns_info.errors.iter() {
                             outln!(
                                 out.indent(),
-                                "{}::{}_ERROR => Self::{}{},",
-                                ns.header,
-                                super::camel_case_to_upper_snake(err_name),
-                                get_ns_name_prefix(ns),
-                                err_name,
+                                "{}::{} => Self::{},",
+                                ns_info.ns.header,
+                                error.const_name,
+                                error.variant,
                             );
                         }
                         outln!(out.indent(), "_ => Self::Unknown(error_code),");
@@ -141,9 +151,7 @@ fn generate_errors(out: &mut Output, module: &xcbgen::defs::Module) {
     outln!(out, "");
 }
 
-fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
-    let namespaces = module.sorted_namespaces();
-
+fn generate_events(out: &mut Output, namespaces: &[NsInfo], xproto: &NsInfo) {
     outln!(out, "/// Enumeration of all possible X11 events.");
     outln!(out, "#[derive(Debug, Clone)]");
     outln!(out, "#[non_exhaustive]");
@@ -152,26 +160,33 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
         outln!(out, "Unknown(Vec<u8>),");
         outln!(out, "Error(X11Error),");
 
-        for ns in namespaces.iter() {
-            let has_feature = super::ext_has_feature(&ns.header);
-            let event_defs = sorted_events(ns);
-            for event_name in event_defs.iter().map(|def| def.name()) {
-                if has_feature {
-                    outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
-                }
-                outln!(
-                    out,
+        for ns_info in namespaces.iter() {
+            let block = render_block(&ns_info.events, |block, event| {
+                writeln!(
+                    block,
                     "{}{}({}::{}Event),",
-                    get_ns_name_prefix(ns),
-                    event_name,
-                    ns.header,
-                    event_name,
-                );
-            }
+                    ns_info.cfg, event.variant, ns_info.ns.header, event.name,
+                )
+            });
+            out!(out, "{}", block);
         }
     });
     outln!(out, "}}");
     outln!(out, "");
+    outln!(
+        out,
+        "/// A function that parses the raw bytes of one specific kind of event."
+    );
+    outln!(
+        out,
+        "// Only used if an extension with dense event codes is enabled."
+    );
+    outln!(out, "#[allow(dead_code)]");
+    outln!(
+        out,
+        "type EventParser = fn(&[u8]) -> Result<Event, ParseError>;"
+    );
+    outln!(out, "");
     outln!(out, "impl Event {{");
     out.indented(|out| {
         outln!(
@@ -201,18 +216,16 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
                     "0 => return Ok({}),",
                     "Self::Error(X11Error::try_parse(event, ext_info_provider)?)",
                 );
-                let xproto_ns = module.namespace("xproto").unwrap();
-                let event_defs = sorted_events(&xproto_ns);
-                for event_name in event_defs.iter().map(|def| def.name()) {
-                    if event_name == "GeGeneric" {
+                for event in xproto.events.iter() {
+                    if event.name == "GeGeneric" {
                         // This does not really count and is parsed as an extension's event
                         continue;
                     }
                     outln!(
                         out,
-                        "xproto::{}_EVENT => return Ok(Self::{}(TryParse::try_parse(event)?.0)),",
-                        super::camel_case_to_upper_snake(event_name),
-                        event_name,
+                        "xproto::{} => return Ok(Self::{}(TryParse::try_parse(event)?.0)),",
+                        event.const_name,
+                        event.name,
                     );
                 }
                 outln!(
@@ -231,27 +244,49 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
             );
             outln!(out, "match ext_info {{");
             out.indented(|out| {
-                for ns in namespaces.iter() {
-                    // skip xproto
-                    if ns.ext_info.is_none() {
-                        continue;
-                    }
-                    let event_defs = sorted_events(ns);
-                    if event_defs.iter().all(|event_def| event_def.is_xge()) {
-                        continue;
-                    }
-
-                    let has_feature = super::ext_has_feature(&ns.header);
-                    if has_feature {
-                        outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
-                    }
+                // skip xproto and extensions with only XGE events
+                let ext_namespaces = namespaces
+                    .iter()
+                    .filter(|ns_info| ns_info.is_extension() && ns_info.has_non_xge_events);
+                for ns_info in ext_namespaces {
                     outln!(
                         out,
-                        "Some(({}::X11_EXTENSION_NAME, ext_info)) => {{",
-                        ns.header
+                        "{}Some(({}::X11_EXTENSION_NAME, ext_info)) => {{",
+                        ns_info.cfg,
+                        ns_info.ns.header,
                     );
                     out.indented(|out| {
-                        if ns.header == "xkb" {
+                        let events = ns_info.events.iter().filter(|event| !event.xge).collect();
+                        let dense = dense_by_number(events, |event| event.number.into());
+                        if let Some(by_number) = dense.filter(|_| ns_info.ns.header != "xkb") {
+                            outln!(
+                                out,
+                                "// Indexed by the event codes of {}, which are dense and start at zero",
+                                ns_info.ns.header,
+                            );
+                            outln!(
+                                out,
+                                "const PARSERS: [EventParser; {}] = [",
+                                by_number.len()
+                            );
+                            for event in by_number.iter() {
+                                outln!(
+                                    out.indent(),
+                                    "|event| Ok(Event::{}(TryParse::try_parse(event)?.0)),",
+                                    event.variant,
+                                );
+                            }
+                            outln!(out, "];");
+                            outln!(
+                                out,
+                                "match PARSERS.get(usize::from(event_code - ext_info.first_event)) {{"
+                            );
+                            outln!(out.indent(), "Some(parse) => parse(event),");
+                            outln!(out.indent(), "None => Ok(Self::Unknown(event.to_vec())),");
+                            outln!(out, "}}");
+                            return;
+                        }
+                        if ns_info.ns.header == "xkb" {
                             outln!(out, "if event_code != ext_info.first_event {{");
                             outln!(out.indent(), "return Ok(Self::Unknown(event.to_vec()));");
                             outln!(out, "}}");
@@ -262,17 +297,16 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
                         } else {
                             outln!(out, "match event_code - ext_info.first_event {{");
                         }
-                        for event_def in event_defs.iter() {
-                            if event_def.is_xge() {
+                        for event in ns_info.events.iter() {
+                            if event.xge {
                                 continue;
                             }
                             outln!(
                                 out.indent(),
-                                "{}::{}_EVENT => Ok(Self::{}{}(TryParse::try_parse(event)?.0)),",
-                                ns.header,
-                                super::camel_case_to_upper_snake(event_def.name()),
-                                get_ns_name_prefix(ns),
-                                event_def.name(),
+                                "{}::{} => Ok(Self::{}(TryParse::try_parse(event)?.0)),",
+                                ns_info.ns.header,
+                                event.const_name,
+                                event.variant,
                             );
                         }
                         outln!(out.indent(), "_ => Ok(Self::Unknown(event.to_vec())),");
@@ -302,34 +336,29 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
             outln!(out.indent(), ".map(|(name, _)| name);");
             outln!(out, "match ext_name {{");
             out.indented(|out| {
-                for ns in namespaces.iter() {
-                    // skip xproto
-                    if ns.ext_info.is_none() {
-                        continue;
-                    }
-                    let event_defs = sorted_events(ns);
-                    if event_defs.iter().all(|event_def| !event_def.is_xge()) {
-                        continue;
-                    }
-
-                    let has_feature = super::ext_has_feature(&ns.header);
-                    if has_feature {
-                        outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
-                    }
-                    outln!(out, "Some({}::X11_EXTENSION_NAME) => {{", ns.header);
+                // skip xproto and extensions without XGE events
+                let ext_namespaces = namespaces
+                    .iter()
+                    .filter(|ns_info| ns_info.is_extension() && ns_info.has_xge_events);
+                for ns_info in ext_namespaces {
+                    outln!(
+                        out,
+                        "{}Some({}::X11_EXTENSION_NAME) => {{",
+                        ns_info.cfg,
+                        ns_info.ns.header,
+                    );
                     out.indented(|out| {
                         outln!(out, "match ge_event.event_type {{");
-                        for event_def in event_defs.iter() {
-                            if !event_def.is_xge() {
+                        for event in ns_info.events.iter() {
+                            if !event.xge {
                                 continue;
                             }
                             outln!(
                                 out.indent(),
-                                "{}::{}_EVENT => Ok(Self::{}{}(TryParse::try_parse(event)?.0)),",
-                                ns.header,
-                                super::camel_case_to_upper_snake(event_def.name()),
-                                get_ns_name_prefix(ns),
-                                event_def.name(),
+                                "{}::{} => Ok(Self::{}(TryParse::try_parse(event)?.0)),",
+                                ns_info.ns.header,
+                                event.const_name,
+                                event.variant,
                             );
                         }
                         outln!(out.indent(), "_ => Ok(Self::Unknown(event.to_vec())),");
@@ -344,6 +373,38 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
         outln!(out, "}}");
         outln!(out, "");
 
+        // wire_sequence_number() and raw_response_type() both have one arm
+        // per event, so render the arms of both in a single pass.
+        // Rust has no syntax to put a group of match arms behind a single
+        // #[cfg], so every arm of a feature-gated extension needs its own.
+        let mut sequence_arms = String::new();
+        let mut response_type_arms = String::new();
+        for ns_info in namespaces.iter() {
+            for event in ns_info.events.iter() {
+                if event.has_sequence {
+                    writeln!(
+                        sequence_arms,
+                        "{}Event::{}(value) => Some(value.sequence),",
+                        ns_info.cfg, event.variant,
+                    )
+                    .unwrap();
+                } else {
+                    writeln!(
+                        sequence_arms,
+                        "{}Event::{}(_) => None,",
+                        ns_info.cfg, event.variant,
+                    )
+                    .unwrap();
+                }
+                writeln!(
+                    response_type_arms,
+                    "{}Event::{}(value) => value.response_type,",
+                    ns_info.cfg, event.variant,
+                )
+                .unwrap();
+            }
+        }
+
         outln!(
             out,
             "/// Get the sequence number contained in this X11 event",
@@ -356,30 +417,7 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
                 "Event::Unknown(value) => sequence_number(value).ok(),",
             );
             outln!(out.indent(), "Event::Error(value) => Some(value.sequence),");
-            for ns in namespaces.iter() {
-                let event_defs = sorted_events(ns);
-                let has_feature = super::ext_has_feature(&ns.header);
-                for event_def in event_defs.iter() {
-                    if has_feature {
-                        outln!(out.indent(), "#[cfg(feature = \"{}\")]", ns.header);
-                    }
-                    if event_def.get_original_full_def().no_sequence_number {
-                        outln!(
-                            out.indent(),
-                            "Event::{}{}(_) => None,",
-                            get_ns_name_prefix(ns),
-                            event_def.name(),
-                        );
-                    } else {
-                        outln!(
-                            out.indent(),
-                            "Event::{}{}(value) => Some(value.sequence),",
-                            get_ns_name_prefix(ns),
-                            event_def.name(),
-                        );
-                    }
-                }
-            }
+            out!(out.indent(), "{}", sequence_arms);
             outln!(out, "}}");
         });
         outln!(out, "}}");
@@ -409,21 +447,7 @@ fn generate_events(out: &mut Output, module: &xcbgen::defs::Module) {
                 "Event::Unknown(value) => response_type(value).unwrap(),",
             );
             outln!(out.indent(), "Event::Error(_) => 0,");
-            for ns in namespaces.iter() {
-                let event_defs = sorted_events(ns);
-                let has_feature = super::ext_has_feature(&ns.header);
-                for event_def in event_defs.iter() {
-                    if has_feature {
-                        outln!(out.indent(), "#[cfg(feature = \"{}\")]", ns.header);
-                    }
-                    outln!(
-                        out.indent(),
-                        "Event::{}{}(value) => value.response_type,",
-                        get_ns_name_prefix(ns),
-                        event_def.name(),
-                    );
-                }
-            }
+            out!(out.indent(), "{}", response_type_arms);
             outln!(out, "}}");
         });
         outln!(out, "}}");
@@ -456,33 +480,179 @@ pub fn sent_event(&self) -> bool {{
     outln!(out, "}}");
 }
 
+/// A namespace together with the values derived from it that are needed by
+/// both the error and the event code.
+struct NsInfo {
+    ns: std::rc::Rc<xcbgen::defs::Namespace>,
+    /// The `#[cfg]` line for items of this namespace, see [`feature_cfg`].
+    cfg: String,
+    errors: Vec<ErrorInfo>,
+    events: Vec<EventInfo>,
+    /// Whether any of `events` is not an XGE event.
+    has_non_xge_events: bool,
+    /// Whether any of `events` is an XGE event.
+    has_xge_events: bool,
+}
+
+impl NsInfo {
+    fn new(ns: std::rc::Rc<xcbgen::defs::Namespace>) -> Self {
+        let events = event_infos(&ns);
+        Self {
+            cfg: feature_cfg(&ns),
+            errors: error_infos(&ns),
+            has_non_xge_events: events.iter().any(|event| !event.xge),
+            has_xge_events: events.iter().any(|event| event.xge),
+            events,
+            ns,
+        }
+    }
+
+    fn is_extension(&self) -> bool {
+        self.ns.ext_info.is_some()
+    }
+}
+
+/// An error of a namespace, with the names derived from it precomputed.
+///
+/// The same errors are visited by several emission passes, so this avoids
+/// converting the names again in every pass.
+struct ErrorInfo {
+    /// The name of the error, e.g. `Request`.
+    name: String,
+    /// The name of the `ErrorKind` variant, e.g. `Request` or `GlxBadContext`.
+    variant: String,
+    /// The name of the constant with the error code, e.g. `REQUEST_ERROR`.
+    const_name: String,
+    /// The error code, relative to the first error of the extension.
+    number: i16,
+}
+
+/// An event of a namespace, with the values derived from it precomputed.
+///
+/// See [`ErrorInfo`].
+struct EventInfo {
+    /// The name of the event, e.g. `KeyPress`.
+    name: String,
+    /// The name of the `Event` variant, e.g. `KeyPress` or `XkbBellNotify`.
+    variant: String,
+    /// The name of the constant with the event code, e.g. `KEY_PRESS_EVENT`.
+    const_name: String,
+    /// Whether this is an event of the generic event extension.
+    xge: bool,
+    /// Whether the event contains a sequence number.
+    has_sequence: bool,
+    /// The event code, relative to the first event of the extension.
+    number: u16,
+}
+
+/// Render one line per item of `items` into a single string.
+///
+/// This allows writing all enum variants of a namespace to `Output` at once,
+/// instead of passing every line through its indentation logic separately.
+fn render_block<T>(
+    items: &[T],
+    mut render_line: impl FnMut(&mut String, &T) -> std::fmt::Result,
+) -> String {
+    let mut block = String::new();
+    for item in items.iter() {
+        render_line(&mut block, item).unwrap();
+    }
+    block
+}
+
+/// Get the `#[cfg]` line that has to precede items from `ns`.
+///
+/// The returned string includes the trailing newline, so that it can be
+/// emitted in the same write as the item itself. It is empty if the
+/// namespace is not behind a feature.
+fn feature_cfg(ns: &xcbgen::defs::Namespace) -> String {
+    if super::ext_has_feature(&ns.header) {
+        format!("#[cfg(feature = \"{}\")]\n", ns.header)
+    } else {
+        String::new()
+    }
+}
+
+fn error_infos(ns: &xcbgen::defs::Namespace) -> Vec<ErrorInfo> {
+    let prefix = get_ns_name_prefix(ns);
+    sorted_errors(ns)
+        .iter()
+        .map(|error_def| ErrorInfo {
+            name: error_def.name().to_string(),
+            variant: format!("{}{}", prefix, error_def.name()),
+            const_name: format!(
+                "{}_ERROR",
+                super::camel_case_to_upper_snake(error_def.name())
+            ),
+            number: match error_def {
+                xcbgen::defs::ErrorDef::Full(error_full_def) => error_full_def.number,
+                xcbgen::defs::ErrorDef::Copy(error_copy_def) => error_copy_def.number,
+            },
+        })
+        .collect()
+}
+
+/// If the codes of `items` are exactly `0..items.len()`, get the items sorted
+/// by their code.
+///
+/// The errors or events of such an extension are dispatched with a lookup
+/// table instead of a `match`. This is not done for a single item, where the
+/// `match` is simpler.
+fn dense_by_number<T>(items: Vec<&T>, number: impl Fn(&T) -> i32) -> Option<Vec<&T>> {
+    if items.len() < 2 {
+        return None;
+    }
+    let mut by_number = items;
+    by_number.sort_by_key(|item| number(item));
+    let is_dense = by_number
+        .iter()
+        .enumerate()
+        .all(|(i, item)| usize::try_from(number(item)) == Ok(i));
+    is_dense.then_some(by_number)
+}
+
+fn event_infos(ns: &xcbgen::defs::Namespace) -> Vec<EventInfo> {
+    let prefix = get_ns_name_prefix(ns);
+    sorted_events(ns)
+        .iter()
+        .map(|event_def| {
+            let full_def = event_def.get_original_full_def();
+            EventInfo {
+                name: event_def.name().to_string(),
+                variant: format!("{}{}", prefix, event_def.name()),
+                const_name: format!(
+                    "{}_EVENT",
+                    super::camel_case_to_upper_snake(event_def.name())
+                ),
+                xge: full_def.xge,
+                has_sequence: !full_def.no_sequence_number,
+                number: match event_def {
+                    xcbgen::defs::EventDef::Full(event_full_def) => event_full_def.number,
+                    xcbgen::defs::EventDef::Copy(event_copy_def) => event_copy_def.number,
+                },
+            }
+        })
+        .collect()
+}
+
 fn sorted_errors(ns: &xcbgen::defs::Namespace) -> Vec<xcbgen::defs::ErrorDef> {
+    // The XML for GLX has a comment saying "fake number"
+    let skip_generic = ns.header == "glx";
     let mut errors: Vec<_> = ns
         .error_defs
         .borrow()
         .values()
-        .filter(|error_def| {
-            let (ns, name) = match error_def {
-                xcbgen::defs::ErrorDef::Full(error_full_def) => (
-                    error_full_def.namespace.upgrade().unwrap(),
-                    &error_full_def.name,
-                ),
-                xcbgen::defs::ErrorDef::Copy(error_copy_def) => (
-                    error_copy_def.namespace.upgrade().unwrap(),
-                    &error_copy_def.name,
-                ),
-            };
-            // The XML for GLX has a comment saying "fake number"
-            ns.header != "glx" || name != "Generic"
-        })
+        .filter(|error_def| !skip_generic || error_def.name() != "Generic")
         .cloned()
         .collect();
-    errors.sort_by(|a, b| a.name().cmp(b.name()));
+    // Names are unique since they are the keys of error_defs
+    errors.sort_unstable_by(|a, b| a.name().cmp(b.name()));
     errors
 }
 
 fn sorted_events(ns: &xcbgen::defs::Namespace) -> Vec<xcbgen::defs::EventDef> {
     let mut events: Vec<_> = ns.event_defs.borrow().values().cloned().collect();
-    events.sort_by(|a, b| a.name().cmp(b.name()));
+    // Names are unique since they are the keys of event_defs
+    events.sort_unstable_by(|a, b| a.name().cmp(b.name()));
     events
 }
@@ -19,9 +19,15 @@ pub(crate) struct Generated {
     pub(crate) async_: String,
 }
 
-pub(crate) fn generate(module: &xcbgen::defs::Module) -> Vec<Generated> {
-    let mut out_map = Vec::new();
-
+/// Generates the code for all namespaces of `module`.
+///
+/// Each generated file is passed to `write` as soon as it is complete, so
+/// that only the output of one namespace (plus the main module) needs to be
+/// kept in memory at a time.
+pub(crate) fn generate<E>(
+    module: &xcbgen::defs::Module,
+    mut write: impl FnMut(Generated) -> Result<(), E>,
+) -> Result<(), E> {
     let mut main_proto_out = Output::new();
     let mut main_x11rb_out = Output::new();
     let mut main_async_out = Output::new();
@@ -112,12 +118,12 @@ pub(crate) fn generate(module: &xcbgen::defs::Module) -> Vec<Generated> {
             &mut enum_cases,
             wrapper_info,
         );
-        out_map.push(Generated {
+        write(Generated {
             file_name: PathBuf::from(format!("{}.rs", ns.header)),
             proto: ns_proto_out.into_data(),
             x11rb: ns_x11rb_out.into_data(),
             async_: ns_async_out.into_data(),
-        });
+        })?;
 
         for out in [
             &mut main_proto_out,
@@ -143,13 +149,12 @@ pub(crate) fn generate(module: &xcbgen::defs::Module) -> Vec<Generated> {
         outln!(out, "pub use x11rb_protocol::protocol::Event;");
     }
 
-    out_map.push(Generated {
+    write(Generated {
         file_name: PathBuf::from("mod.rs"),
         proto: main_proto_out.into_data(),
         x11rb: main_x11rb_out.into_data(),
         async_: main_async_out.into_data(),
-    });
-    out_map
+    })
 }
 
 fn ext_has_feature(name: &str) -> bool {
@@ -251,7 +256,9 @@ fn camel_case_to_snake(arg: &str) -> String {
         }
     }
 
-    let mut r = String::new();
+    // Every character is either kept or preceded by an underscore, so this
+    // never needs to reallocate.
+    let mut r = String::with_capacity(2 * arg.len());
     for match_str in Matcher::new(arg) {
         if !r.is_empty() {
             r.push('_');
@@ -3,6 +3,47 @@ use crate::generator::output::Output;
 
 use xcbgen::defs as xcbdefs;
 
+// The attributes and imports that start every module. They are the same
+// for all modules, so they are written out in one go.
+const PROTOCOL_PREAMBLE: &str = "
+#![allow(clippy::too_many_arguments)]
+// The code generator is simpler if it can always use conversions
+#![allow(clippy::useless_conversion)]
+
+#[allow(unused_imports)]
+use alloc::borrow::Cow;
+#[allow(unused_imports)]
+use core::convert::TryInto;
+use alloc::vec;
+use alloc::vec::Vec;
+use core::convert::TryFrom;
+use crate::errors::ParseError;
+#[allow(unused_imports)]
+use crate::x11_utils::TryIntoUSize;
+use crate::BufWithFds;
+#[allow(unused_imports)]
+use crate::utils::{RawFdContainer, pretty_print_bitmask, pretty_print_enum};
+#[allow(unused_imports)]
+use crate::x11_utils::{Request, RequestHeader, Serialize, TryParse, TryParseFd};";
+
+const X11RB_PREAMBLE: &str = "
+#![allow(clippy::too_many_arguments)]
+
+#[allow(unused_imports)]
+use std::borrow::Cow;
+#[allow(unused_imports)]
+use std::convert::TryInto;
+#[allow(unused_imports)]
+use crate::utils::RawFdContainer;
+#[allow(unused_imports)]
+use crate::x11_utils::{Request, RequestHeader, Serialize, TryParse, TryParseFd};
+use std::io::IoSlice;
+use crate::connection::RequestConnection;
+#[allow(unused_imports)]
+use crate::connection::Connection as X11Connection;
+#[allow(unused_imports)]
+use crate::cookie::{Cookie, CookieWithFds, VoidCookie};";
+
 #[derive(Debug, PartialEq, Copy, Clone)]
 pub(super) enum Mode {
     Protocol,
@@ -35,70 +76,24 @@ pub(super) fn write_header(
         outln!(out, "//! specific errors, events, or requests.");
     }
 
-    let (alloc_name, core_name) = match mode {
-        Mode::Protocol => ("alloc", "core"),
-        Mode::X11rb => ("std", "std"),
-    };
-
-    outln!(out, "");
-    outln!(out, "#![allow(clippy::too_many_arguments)]");
-    if mode == Mode::Protocol {
-        outln!(
-            out,
-            "// The code generator is simpler if it can always use conversions"
-        );
-        outln!(out, "#![allow(clippy::useless_conversion)]");
-    }
-    outln!(out, "");
-    outln!(out, "#[allow(unused_imports)]");
-    outln!(out, "use {}::borrow::Cow;", alloc_name);
-    outln!(out, "#[allow(unused_imports)]");
-    outln!(out, "use {}::convert::TryInto;", core_name);
-    if mode == Mode::Protocol {
-        outln!(out, "use alloc::vec;");
-        outln!(out, "use alloc::vec::Vec;");
-        outln!(out, "use core::convert::TryFrom;");
-        outln!(out, "use crate::errors::ParseError;");
-        outln!(out, "#[allow(unused_imports)]");
-        outln!(out, "use crate::x11_utils::TryIntoUSize;");
-        outln!(out, "use crate::BufWithFds;");
-    }
-    outln!(out, "#[allow(unused_imports)]");
     match mode {
-        Mode::Protocol => outln!(
-            out,
-            "use crate::utils::{{RawFdContainer, pretty_print_bitmask, pretty_print_enum}};"
-        ),
-        Mode::X11rb => outln!(out, "use crate::utils::RawFdContainer;"),
-    }
-    outln!(out, "#[allow(unused_imports)]");
-    outln!(
-        out,
-        "use crate::x11_utils::{{Request, RequestHeader, Serialize, TryParse, TryParseFd}};"
-    );
-    if mode == Mode::X11rb {
-        outln!(out, "use std::io::IoSlice;");
-        outln!(out, "use crate::connection::RequestConnection;");
-        outln!(out, "#[allow(unused_imports)]");
-        outln!(out, "use crate::connection::Connection as X11Connection;");
-        outln!(out, "#[allow(unused_imports)]");
-        outln!(
-            out,
-            "use crate::cookie::{{Cookie, CookieWithFds, VoidCookie}};"
-        );
-        if ns.header == "xproto" {
-            outln!(out, "use crate::cookie::ListFontsWithInfoCookie;");
-        }
-        if ns.header == "record" {
-            outln!(out, "use crate::cookie::RecordEnableContextCookie;");
-        }
-        outln!(out, "use crate::errors::ConnectionError;");
-        outln!(out, "#[allow(unused_imports)]");
-        outln!(out, "use crate::errors::ReplyOrIdError;");
+        Mode::Protocol => outln!(out, "{}", PROTOCOL_PREAMBLE),
+        Mode::X11rb => {
+            outln!(out, "{}", X11RB_PREAMBLE);
+            if ns.header == "xproto" {
+                outln!(out, "use crate::cookie::ListFontsWithInfoCookie;");
+            }
+            if ns.header == "record" {
+                outln!(out, "use crate::cookie::RecordEnableContextCookie;");
+            }
+            outln!(out, "use crate::errors::ConnectionError;");
+            outln!(out, "#[allow(unused_imports)]");
+            outln!(out, "use crate::errors::ReplyOrIdError;");
 
-        if poll_mode == ImplMode::Async {
-            outln!(out, "use std::future::Future;");
-            outln!(out, "use std::pin::Pin;");
+            if poll_mode == ImplMode::Async {
+                outln!(out, "use std::future::Future;");
+                outln!(out, "use std::pin::Pin;");
+            }
         }
     }
 
@@ -1,5 +1,5 @@
 use std::collections::hash_map::Entry as HashMapEntry;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 
 use xcbgen::defs as xcbdefs;
 
@@ -27,6 +27,7 @@ pub(crate) struct Caches {
     enum_infos: HashMap<usize, EnumInfo>,
     pub(super) derives: HashMap<usize, Derives>,
     pub(super) rust_type_names: HashMap<usize, String>,
+    pub(super) enum_rust_names: HashMap<usize, String>,
 }
 
 impl Caches {
@@ -409,6 +410,10 @@ pub(super) fn gather_deducible_fields(
         }
     }
 
+    // Names of the fields in `fields`. Length expressions can also refer to
+    // external parameters, which cannot be deduced here.
+    let field_names: HashSet<_> = fields.iter().filter_map(|field| field.name()).collect();
+
     let mut deducible_fields = HashMap::new();
     for field in fields.iter() {
         let deducible_field = match field {
@@ -496,11 +501,7 @@ pub(super) fn gather_deducible_fields(
         };
 
         if let Some((field_name, deducible_field)) = deducible_field {
-            let is_not_ext_param = fields
-                .iter()
-                .any(|field| field.name() == Some(field_name.as_str()));
-
-            if is_not_ext_param {
+            if field_names.contains(field_name.as_str()) {
                 // If the field is used more than once, deduce it from the first use
                 // (do not replace entry).
                 deducible_fields
@@ -522,24 +523,46 @@ pub(super) enum FieldContainer {
     Other,
 }
 
+/// Returns the Rust type that is used for `builtin_type`.
+pub(super) fn builtin_to_rust_type(builtin_type: xcbdefs::BuiltInType) -> &'static str {
+    match builtin_type {
+        xcbdefs::BuiltInType::Card8 => "u8",
+        xcbdefs::BuiltInType::Card16 => "u16",
+        xcbdefs::BuiltInType::Card32 => "u32",
+        xcbdefs::BuiltInType::Card64 => "u64",
+        xcbdefs::BuiltInType::Int8 => "i8",
+        xcbdefs::BuiltInType::Int16 => "i16",
+        xcbdefs::BuiltInType::Int32 => "i32",
+        xcbdefs::BuiltInType::Int64 => "i64",
+        xcbdefs::BuiltInType::Byte => "u8",
+        xcbdefs::BuiltInType::Bool => "bool",
+        xcbdefs::BuiltInType::Char => "u8",
+        xcbdefs::BuiltInType::Float => "f32",
+        xcbdefs::BuiltInType::Double => "f64",
+        xcbdefs::BuiltInType::Void => "u8",
+    }
+}
+
 /// Converts a type name from the XML to a rust
 /// type name (in CamelCase).
 ///
 /// If the name is all uppercase, all but the first
 /// letter are converter to lowercase.
 pub(super) fn to_rust_type_name(name: &str) -> String {
-    let mut name = String::from(name);
-    if name.bytes().all(|c| !c.is_ascii_lowercase()) {
-        name.make_ascii_lowercase();
-    }
+    let all_uppercase = name.bytes().all(|c| !c.is_ascii_lowercase());
 
-    // Convert to camel case
-    let mut r = String::new();
+    // Convert to camel case in a single pass over `name`, without first
+    // copying it to lowercase it.
+    let mut r = String::with_capacity(name.len());
     for chunk in name.split('_') {
         r.push_str(&chunk[..1]);
         let r_len = r.len();
         r[(r_len - 1)..].make_ascii_uppercase();
-        r.push_str(&chunk[1..]);
+        if all_uppercase {
+            r.extend(chunk[1..].chars().map(|c| c.to_ascii_lowercase()));
+        } else {
+            r.push_str(&chunk[1..]);
+        }
     }
     r
 }
@@ -29,10 +29,10 @@ mod switch;
 use expr_to_str::{expr_to_str, expr_type};
 
 use helpers::{
-    ename_to_camel_case, ename_to_rust, gather_deducible_fields, postfix_var_name, prefix_var_name,
-    to_rust_enum_type_name, to_rust_type_name, to_rust_variable_name, Caches, CaseInfo,
-    DeducibleField, DeducibleFieldOp, DeducibleLengthFieldOp, Derives, FieldContainer,
-    StructSizeConstraint,
+    builtin_to_rust_type, ename_to_camel_case, ename_to_rust, gather_deducible_fields,
+    postfix_var_name, prefix_var_name, to_rust_enum_type_name, to_rust_type_name,
+    to_rust_variable_name, Caches, CaseInfo, DeducibleField, DeducibleFieldOp,
+    DeducibleLengthFieldOp, Derives, FieldContainer, StructSizeConstraint,
 };
 
 /// Generate a Rust module for namespace `ns`.
@@ -357,9 +357,7 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
                 }
                 assert!(result_bytes.len() <= 32);
                 outln!(out, "[");
-                for result_byte in result_bytes.iter() {
-                    outln!(out.indent(), "{},", result_byte);
-                }
+                serialize::emit_byte_array_elements(&result_bytes, out);
                 if result_bytes.len() != 32 {
                     outln!(out.indent(), "// trailing padding");
                     for _ in result_bytes.len()..32 {
@@ -372,13 +370,15 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
         });
         outln!(out, "}}");
 
-        outln!(out, "impl From<{}> for [u8; 32] {{", name);
-        out.indented(|out| {
-            outln!(out, "fn from(input: {}) -> Self {{", name);
-            outln!(out.indent(), "Self::from(&input)");
-            outln!(out, "}}");
-        });
-        outln!(out, "}}");
+        outln!(
+            out,
+            r"impl From<{name}> for [u8; 32] {{
+    fn from(input: {name}) -> Self {{
+        Self::from(&input)
+    }}
+}}",
+            name = name,
+        );
     }
 
     fn generate_struct_def(&self, struct_def: &xcbdefs::StructDef, out: &mut Output) {
@@ -431,16 +431,26 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
         outln!(out, "pub struct {}([u8; {}]);", rust_name, union_size);
 
         let fields = union_def.fields.as_slice();
+        // The Rust type and name of each field, needed by both the accessors
+        // and the `From` impls
+        let rust_fields: Vec<_> = fields
+            .iter()
+            .map(|field| {
+                (
+                    self.field_to_rust_type(field, &rust_name),
+                    to_rust_variable_name(field.name().unwrap()),
+                )
+            })
+            .collect();
 
         outln!(out, "impl {} {{", rust_name);
         out.indented(|out| {
-            for field in fields.iter() {
-                let rust_field_type = self.field_to_rust_type(field, &rust_name);
-                let rust_field_name = to_rust_variable_name(field.name().unwrap());
+            for (field, (rust_field_type, rust_field_name)) in fields.iter().zip(rust_fields.iter())
+            {
                 outln!(
                     out,
                     "pub fn {}(&self) -> {} {{",
-                    prefix_var_name(&rust_field_name, "as"),
+                    prefix_var_name(rust_field_name, "as"),
                     rust_field_type,
                 );
                 out.indented(|out| {
@@ -506,7 +516,7 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
 
         let mut seen_field_types = HashSet::new();
 
-        for field in fields.iter() {
+        for (field, (rust_field_type, rust_field_name)) in fields.iter().zip(rust_fields.iter()) {
             // Get the original type (without type aliases)
             // to make sure there are not repeated `From`s.
             let orig_rust_field_type = match field {
@@ -548,8 +558,6 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
                 continue;
             }
 
-            let rust_field_type = self.field_to_rust_type(field, &rust_name);
-            let rust_field_name = to_rust_variable_name(field.name().unwrap());
             outln!(out, "impl From<{}> for {} {{", rust_field_type, rust_name);
             out.indented(|out| {
                 outln!(
@@ -573,9 +581,7 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
                         outln!(out, "Self({})", bytes_name.unwrap());
                     } else {
                         outln!(out, "let value = [");
-                        for result_byte in result_bytes.iter() {
-                            outln!(out.indent(), "{},", result_byte);
-                        }
+                        serialize::emit_byte_array_elements(&result_bytes, out);
                         // This is needed to handle cases such as Behavior.type or
                         // Action.type from the XKB extension.
                         //
@@ -791,74 +797,59 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
         }
         outln!(out, "}}");
 
-        outln!(out, "impl From<{}> for {} {{", rust_name, raw_type);
-        out.indented(|out| {
-            outln!(out, "#[inline]");
-            outln!(out, "fn from(input: {}) -> Self {{", rust_name);
-            outln!(out.indent(), "input.0");
-            outln!(out, "}}");
-        });
-        outln!(out, "}}");
-
         outln!(
             out,
-            "impl From<{}> for {}<{}> {{",
-            rust_name,
-            self.option_name,
-            raw_type,
+            r"impl From<{name}> for {raw} {{
+    #[inline]
+    fn from(input: {name}) -> Self {{
+        input.0
+    }}
+}}
+impl From<{name}> for {option}<{raw}> {{
+    #[inline]
+    fn from(input: {name}) -> Self {{
+        Some(input.0)
+    }}
+}}",
+            name = rust_name,
+            raw = raw_type,
+            option = self.option_name,
         );
-        out.indented(|out| {
-            outln!(out, "#[inline]");
-            outln!(out, "fn from(input: {}) -> Self {{", rust_name);
-            outln!(out.indent(), "Some(input.0)");
-            outln!(out, "}}");
-        });
-        outln!(out, "}}");
 
-        for larger_type in larger_types.iter() {
-            outln!(out, "impl From<{}> for {} {{", rust_name, larger_type);
-            out.indented(|out| {
-                outln!(out, "#[inline]");
-                outln!(out, "fn from(input: {}) -> Self {{", rust_name);
-                outln!(out.indent(), "{}::from(input.0)", larger_type);
-                outln!(out, "}}");
-            });
-            outln!(out, "}}");
+        if !larger_types.is_empty() {
             outln!(
                 out,
-                "impl From<{}> for {}<{}> {{",
+                "enum_into_larger!({}, {});",
                 rust_name,
-                self.option_name,
-                larger_type,
+                larger_types.join(", "),
             );
-            out.indented(|out| {
-                outln!(out, "#[inline]");
-                outln!(out, "fn from(input: {}) -> Self {{", rust_name);
-                outln!(out.indent(), "Some({}::from(input.0))", larger_type);
-                outln!(out, "}}");
-            });
-            outln!(out, "}}");
         }
 
         for smaller_type in smaller_types.iter() {
-            outln!(out, "impl From<{}> for {} {{", smaller_type, rust_name);
-            out.indented(|out| {
-                outln!(out, "#[inline]");
-                outln!(out, "fn from(value: {}) -> Self {{", smaller_type);
-                outln!(out.indent(), "Self(value.into())");
-                outln!(out, "}}");
-            });
-            outln!(out, "}}");
+            outln!(
+                out,
+                r"impl From<{smaller}> for {name} {{
+    #[inline]
+    fn from(value: {smaller}) -> Self {{
+        Self(value.into())
+    }}
+}}",
+                name = rust_name,
+                smaller = smaller_type,
+            );
         }
 
-        outln!(out, "impl From<{}> for {} {{", raw_type, rust_name);
-        out.indented(|out| {
-            outln!(out, "#[inline]");
-            outln!(out, "fn from(value: {}) -> Self {{", raw_type);
-            outln!(out.indent(), "Self(value)");
-            outln!(out, "}}");
-        });
-        outln!(out, "}}");
+        outln!(
+            out,
+            r"impl From<{raw}> for {name} {{
+    #[inline]
+    fn from(value: {raw}) -> Self {{
+        Self(value)
+    }}
+}}",
+            name = rust_name,
+            raw = raw_type,
+        );
 
         // An enum is ok for bitmask if all its values are <bit>
         // or have value zero (but not if all values are zero)
@@ -1148,7 +1139,12 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
                 );
                 let mut prefix_char = '*';
                 for line in text.split('\n') {
-                    outln!(out, "/// {} {}", prefix_char, line.trim_end());
+                    let line = line.trim_end();
+                    if line.is_empty() {
+                        outln!(out, "///");
+                    } else {
+                        outln!(out, "/// {} {}", prefix_char, line);
+                    }
                     prefix_char = ' ';
                 }
             }
@@ -1259,12 +1255,26 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
     }
 
     fn get_enum_rust_name(&self, enum_def: &xcbdefs::EnumDef) -> String {
-        let ns = enum_def.namespace.upgrade().unwrap();
-        let mut name = to_rust_enum_type_name(&enum_def.name);
-        if self.name_is_used_by_non_enum(&name, &ns) {
-            name.push_str("Enum");
+        let id = enum_def as *const xcbdefs::EnumDef as usize;
+
+        let caches = self.caches.borrow();
+        if let Some(name) = caches.enum_rust_names.get(&id).cloned() {
+            name
+        } else {
+            drop(caches);
+            // Checking for a conflict walks all types of the namespace, so
+            // only do it once per enum.
+            let ns = enum_def.namespace.upgrade().unwrap();
+            let mut name = to_rust_enum_type_name(&enum_def.name);
+            if self.name_is_used_by_non_enum(&name, &ns) {
+                name.push_str("Enum");
+            }
+            self.caches
+                .borrow_mut()
+                .enum_rust_names
+                .insert(id, name.clone());
+            name
         }
-        name
     }
 
     fn get_type_alias_rust_name(&self, type_alias_def: &xcbdefs::TypeAliasDef) -> String {
@@ -1301,10 +1311,10 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
                 s.push_str(", ");
             }
             let wire_type = match ext_param.type_ {
-                xcbdefs::TypeRef::BuiltIn(_) => Some(self.type_to_rust_type(&ext_param.type_)),
+                xcbdefs::TypeRef::BuiltIn(builtin_type) => Some(builtin_to_rust_type(builtin_type)),
                 _ => None,
             };
-            if let Some(ref type_) = wire_type {
+            if let Some(type_) = wire_type {
                 write!(s, "{}::from(", type_).unwrap();
             }
             s.push_str(&wrap_name(&ext_param.name));
@@ -1343,22 +1353,7 @@ impl<'ns, 'c> NamespaceGenerator<'ns, 'c> {
     /// Returns the Rust type for `type_`.
     fn type_to_rust_type(&self, type_: &xcbdefs::TypeRef) -> String {
         match type_ {
-            xcbdefs::TypeRef::BuiltIn(builtin_type) => match builtin_type {
-                xcbdefs::BuiltInType::Card8 => "u8".into(),
-                xcbdefs::BuiltInType::Card16 => "u16".into(),
-                xcbdefs::BuiltInType::Card32 => "u32".into(),
-                xcbdefs::BuiltInType::Card64 => "u64".into(),
-                xcbdefs::BuiltInType::Int8 => "i8".into(),
-                xcbdefs::BuiltInType::Int16 => "i16".into(),
-                xcbdefs::BuiltInType::Int32 => "i32".into(),
-                xcbdefs::BuiltInType::Int64 => "i64".into(),
-                xcbdefs::BuiltInType::Byte => "u8".into(),
-                xcbdefs::BuiltInType::Bool => "bool".into(),
-                xcbdefs::BuiltInType::Char => "u8".into(),
-                xcbdefs::BuiltInType::Float => "f32".into(),
-                xcbdefs::BuiltInType::Double => "f64".into(),
-                xcbdefs::BuiltInType::Void => "u8".into(),
-            },
+            xcbdefs::TypeRef::BuiltIn(builtin_type) => builtin_to_rust_type(*builtin_type).into(),
             xcbdefs::TypeRef::Struct(struct_def) => {
                 let struct_def = struct_def.upgrade().unwrap();
                 let ns = struct_def.namespace.upgrade().unwrap();
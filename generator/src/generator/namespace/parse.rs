@@ -1,8 +1,8 @@
 use xcbgen::defs as xcbdefs;
 
 use super::{
-    expr_to_str, to_rust_type_name, to_rust_variable_name, FieldContainer, NamespaceGenerator,
-    Output,
+    builtin_to_rust_type, expr_to_str, to_rust_type_name, to_rust_variable_name, FieldContainer,
+    NamespaceGenerator, Output,
 };
 
 pub(super) fn emit_field_parse(
@@ -128,22 +128,33 @@ pub(super) fn emit_field_parse(
                     ),
                 );
             } else if let Some(list_len) = list_field.length() {
-                for i in 0..list_len {
-                    let tmp_name = format!("{}_{}", rust_field_name, i);
+                if can_use_array_parsing(&list_field.element_type) {
+                    let rust_element_type =
+                        generator.type_to_rust_type(list_field.element_type.type_.get_resolved());
                     outln!(
                         out,
-                        "let ({}_{}, remaining) = {};",
+                        "let ({}, remaining) = crate::x11_utils::parse_array::<{}, {}>({})?;",
                         rust_field_name,
-                        i,
-                        emit_value_parse(generator, &list_field.element_type, from),
+                        rust_element_type,
+                        list_len,
+                        from,
                     );
-                    emit_value_post_parse(&list_field.element_type, &tmp_name, out);
-                }
-                outln!(out, "let {} = [", rust_field_name);
-                for i in 0..list_len {
-                    outln!(out.indent(), "{}_{},", rust_field_name, i);
+                } else {
+                    // Every element is parsed the same way
+                    let element_parse = emit_value_parse(generator, &list_field.element_type, from);
+                    for i in 0..list_len {
+                        let tmp_name = format!("{}_{}", rust_field_name, i);
+                        outln!(out, "let ({}, remaining) = {};", tmp_name, element_parse);
+                        emit_value_post_parse(&list_field.element_type, &tmp_name, out);
+                    }
+                    outln!(out, "let {} = [", rust_field_name);
+                    out.indented(|out| {
+                        out.write_lines(
+                            (0..list_len).map(|i| format!("{}_{},", rust_field_name, i)),
+                        )
+                    });
+                    outln!(out, "];");
                 }
-                outln!(out, "];");
             } else {
                 outln!(out, "let mut remaining = {};", from);
                 if let Some(ref length_expr) = list_field.length_expr {
@@ -193,12 +204,9 @@ pub(super) fn emit_field_parse(
             let mut parse_params = vec![String::from("remaining")];
             for ext_param in switch_field.external_params.borrow().iter() {
                 let mut variable = to_rust_variable_name(&ext_param.name);
-                if let xcbdefs::TypeRef::BuiltIn(_) = ext_param.type_ {
-                    variable = format!(
-                        "{}::from({})",
-                        generator.type_to_rust_type(&ext_param.type_),
-                        variable
-                    );
+                if let xcbdefs::TypeRef::BuiltIn(builtin_type) = ext_param.type_ {
+                    variable =
+                        format!("{}::from({})", builtin_to_rust_type(builtin_type), variable);
                 }
                 parse_params.push(variable);
             }
@@ -270,6 +278,92 @@ pub(super) fn emit_field_parse(
     }
 }
 
+/// Emits the parsing code for the leading fields of `fields` that are
+/// primitive values at a fixed offset.
+///
+/// Instead of calling `try_parse` for each of them, which checks the length of
+/// the remaining input every time, the whole prefix is split off with a single
+/// length check and the values are read from constant offsets.
+///
+/// Returns the number of fields that were parsed.
+pub(super) fn emit_fixed_prefix_parse(
+    generator: &NamespaceGenerator<'_, '_>,
+    fields: &[xcbdefs::FieldDef],
+    out: &mut Output,
+) -> usize {
+    const BYTES_NAME: &str = "fixed_bytes";
+
+    // (field, offset) of each value in the prefix
+    let mut values = Vec::new();
+    let mut num_fields = 0;
+    let mut prefix_size = 0;
+    for field in fields.iter() {
+        match field {
+            xcbdefs::FieldDef::Pad(xcbdefs::PadField {
+                kind: xcbdefs::PadKind::Bytes(pad_size),
+                ..
+            }) => prefix_size += u32::from(*pad_size),
+            xcbdefs::FieldDef::Normal(normal_field)
+                if is_primitive(normal_field.type_.type_.get_resolved())
+                    && to_rust_variable_name(&normal_field.name) != BYTES_NAME =>
+            {
+                values.push((normal_field, prefix_size));
+                prefix_size += normal_field.type_.size().unwrap();
+            }
+            _ => break,
+        }
+        num_fields += 1;
+    }
+    if values.len() < 2 {
+        // Nothing to gain over the regular parsing code
+        return 0;
+    }
+
+    outln!(
+        out,
+        "let ({}, remaining) = crate::x11_utils::parse_u8_array_ref::<{}>(remaining)?;",
+        BYTES_NAME,
+        prefix_size,
+    );
+    for (normal_field, offset) in values {
+        let type_ = normal_field.type_.type_.get_resolved();
+        let bytes = (offset..offset + normal_field.type_.size().unwrap())
+            .map(|i| format!("{}[{}]", BYTES_NAME, i))
+            .collect::<Vec<_>>()
+            .join(", ");
+        let value = match type_.get_original_type() {
+            xcbdefs::TypeRef::BuiltIn(xcbdefs::BuiltInType::Bool) => format!("{} != 0", bytes),
+            xcbdefs::TypeRef::BuiltIn(
+                xcbdefs::BuiltInType::Card8
+                | xcbdefs::BuiltInType::Byte
+                | xcbdefs::BuiltInType::Char,
+            ) => bytes,
+            _ => format!(
+                "{}::from_ne_bytes([{}])",
+                generator.type_to_rust_type(type_),
+                bytes
+            ),
+        };
+        outln!(
+            out,
+            "let {} = {};",
+            to_rust_variable_name(&normal_field.name),
+            value
+        );
+    }
+    num_fields
+}
+
+/// Whether values of `type_` are plain numbers that can be read with
+/// `from_ne_bytes`.
+fn is_primitive(type_: &xcbdefs::TypeRef) -> bool {
+    match type_.get_original_type() {
+        xcbdefs::TypeRef::BuiltIn(builtin_type) => builtin_type != xcbdefs::BuiltInType::Void,
+        xcbdefs::TypeRef::Xid(_) | xcbdefs::TypeRef::XidUnion(_) => true,
+        _ => false,
+    }
+}
+
 pub(super) fn emit_field_post_parse(field: &xcbdefs::FieldDef, out: &mut Output) {
     match field {
         xcbdefs::FieldDef::Normal(normal_field) => {
@@ -316,6 +410,15 @@ fn needs_post_parse(type_: &xcbdefs::FieldValueType) -> bool {
     )
 }
 
+/// Whether a fixed-length list of `type_` can be parsed with
+/// `parse_array`, which needs `Copy + Default` elements.
+fn can_use_array_parsing(type_: &xcbdefs::FieldValueType) -> bool {
+    matches!(
+        type_.type_.get_resolved(),
+        xcbdefs::TypeRef::BuiltIn(_) | xcbdefs::TypeRef::Xid(_) | xcbdefs::TypeRef::XidUnion(_)
+    ) && !needs_post_parse(type_)
+}
+
 pub(super) fn can_use_simple_list_parsing(
     generator: &NamespaceGenerator<'_, '_>,
     type_: &xcbdefs::FieldValueType,
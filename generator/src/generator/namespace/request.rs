@@ -125,6 +125,7 @@ pub(super) fn generate_request(
     enum_cases: &mut PerModuleEnumCases,
 ) {
     let name = to_rust_type_name(&request_def.name);
+    let opcode_name = super::super::camel_case_to_upper_snake(&name);
 
     let mut function_name = super::super::camel_case_to_lower_snake(&name);
     if function_name == "await" {
@@ -166,7 +167,7 @@ pub(super) fn generate_request(
     outln!(
         proto_out,
         "pub const {}_REQUEST: u8 = {};",
-        super::super::camel_case_to_upper_snake(&name),
+        opcode_name,
         request_def.opcode,
     );
 
@@ -199,7 +200,7 @@ pub(super) fn generate_request(
              Ok(Request::{ns_prefix}{name}({header}::{name}Request::\
              try_parse_request_fd(header, remaining, fds)?)),",
             header = generator.ns.header,
-            opcode_name = super::super::camel_case_to_upper_snake(&name),
+            opcode_name = opcode_name,
             ns_prefix = ns_prefix,
             name = name,
         ));
@@ -209,7 +210,7 @@ pub(super) fn generate_request(
              Ok(Request::{ns_prefix}{name}({header}::{name}Request::try_parse_request(header, \
              remaining)?)),",
             header = generator.ns.header,
-            opcode_name = super::super::camel_case_to_upper_snake(&name),
+            opcode_name = opcode_name,
             ns_prefix = ns_prefix,
             name = name,
         ));
@@ -553,9 +554,7 @@ fn emit_request_struct(
                 match field {
                     xcbdefs::FieldDef::Pad(pad_field) => match pad_field.kind {
                         xcbdefs::PadKind::Bytes(bytes) => {
-                            for _ in 0..bytes {
-                                fixed_fields_bytes.push(String::from("0"));
-                            }
+                            fixed_fields_bytes.extend((0..bytes).map(|_| String::from("0")));
                         }
                         xcbdefs::PadKind::Align(align) => {
                             outln!(
@@ -638,9 +637,7 @@ fn emit_request_struct(
                                         was_deduced,
                                     ),
                                 );
-                                for i in 0..field_size {
-                                    fixed_fields_bytes.push(format!("{}[{}]", bytes_name, i));
-                                }
+                                serialize::push_byte_refs(&mut fixed_fields_bytes, &bytes_name, field_size);
                             } else {
                                 outln!(
                                     tmp_out,
@@ -718,9 +715,7 @@ fn emit_request_struct(
                             )
                         );
                         if let Some(field_size) = switch_field.size() {
-                            for i in 0..field_size {
-                                fixed_fields_bytes.push(format!("{}[{}]", bytes_name, i));
-                            }
+                            serialize::push_byte_refs(&mut fixed_fields_bytes, &bytes_name, field_size);
                         } else {
                             next_slice = Some((bytes_name, IovecConversion::Into));
                         }
@@ -761,9 +756,7 @@ fn emit_request_struct(
                                 false,
                             ),
                         );
-                        for i in 0..field_size {
-                            fixed_fields_bytes.push(format!("{}[{}]", bytes_name, i));
-                        }
+                        serialize::push_byte_refs(&mut fixed_fields_bytes, &bytes_name, field_size);
                     }
                     xcbdefs::FieldDef::VirtualLen(_) => {}
                 }
@@ -775,9 +768,7 @@ fn emit_request_struct(
                         let req_size_rem = *request_size % 4;
                         if req_size_rem != 0 {
                             let pad_size = 4 - req_size_rem;
-                            for _ in 0..pad_size {
-                                fixed_fields_bytes.push(String::from("0"));
-                            }
+                            fixed_fields_bytes.extend((0..pad_size).map(|_| String::from("0")));
                             *request_size += pad_size;
                         }
                     }
@@ -797,9 +788,7 @@ fn emit_request_struct(
                             maybe_mut,
                             num_fixed_len_slices,
                         );
-                        for byte in fixed_fields_bytes.iter() {
-                            outln!(out.indent(), "{},", byte);
-                        }
+                        serialize::emit_byte_array_elements(&fixed_fields_bytes, out);
                         outln!(out, "];");
                         outln!(
                             out,
@@ -902,20 +891,12 @@ fn emit_request_struct(
 
             num_slices = request_slices.len();
             num_slices_opt = Some(num_slices);
-            let mut slices_arg = String::new();
-            for (i, request_slices) in request_slices.iter().enumerate() {
-                if i != 0 {
-                    slices_arg.push_str(", ");
-                }
-                slices_arg.push_str(request_slices);
-            }
-
-            let result = format!(
+            outln!(
+                out,
                 "([{slices}], {fds})",
-                slices = slices_arg,
+                slices = request_slices.join(", "),
                 fds = fds_arg,
             );
-            outln!(out, "{}", result);
         };
         outln!(
             out,
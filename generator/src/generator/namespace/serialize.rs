@@ -25,9 +25,7 @@ pub(super) fn emit_field_serialize(
         xcbdefs::FieldDef::Pad(pad_field) => {
             match pad_field.kind {
                 xcbdefs::PadKind::Bytes(pad_size) => {
-                    for _ in 0..pad_size {
-                        result_bytes.push(String::from("0"));
-                    }
+                    result_bytes.extend((0..pad_size).map(|_| String::from("0")));
                 }
                 // not fixed length
                 xcbdefs::PadKind::Align(_) => unreachable!(),
@@ -62,24 +60,22 @@ pub(super) fn emit_field_serialize(
                     emit_value_serialize(generator, &normal_field.type_, &src_value, false),
                 );
             }
-            for i in 0..field_size {
-                result_bytes.push(format!("{}[{}]", bytes_name, i));
-            }
+            push_byte_refs(result_bytes, &bytes_name, field_size);
             Some(bytes_name)
         }
         xcbdefs::FieldDef::List(list_field) => {
             let list_length = list_field.length().unwrap();
             if generator.rust_value_type_is_u8(&list_field.element_type) {
                 // Fixed-sized list with `u8` members
-                for i in 0..list_length {
-                    result_bytes.push(format!("{}[{}]", wrap_field_ref(&list_field.name), i));
-                }
-                Some(wrap_field_ref(&list_field.name))
+                let list_ref = wrap_field_ref(&list_field.name);
+                push_byte_refs(result_bytes, &list_ref, list_length);
+                Some(list_ref)
             } else {
                 let element_size = list_field.element_type.size().unwrap();
+                let list_ref = wrap_field_ref(&list_field.name);
+                let rust_field_name = to_rust_variable_name(&list_field.name);
                 for i in 0..list_length {
-                    let src_value = format!("{}[{}]", wrap_field_ref(&list_field.name), i);
-                    let rust_field_name = to_rust_variable_name(&list_field.name);
+                    let src_value = format!("{}[{}]", list_ref, i);
                     let bytes_name = postfix_var_name(&rust_field_name, &format!("{}_bytes", i));
                     outln!(
                         out,
@@ -92,9 +88,7 @@ pub(super) fn emit_field_serialize(
                             false,
                         ),
                     );
-                    for j in 0..element_size {
-                        result_bytes.push(format!("{}[{}]", bytes_name, j));
-                    }
+                    push_byte_refs(result_bytes, &bytes_name, element_size);
                 }
                 None
             }
@@ -109,9 +103,7 @@ pub(super) fn emit_field_serialize(
                 bytes_name,
                 wrap_field_ref(&switch_field.name),
             );
-            for i in 0..field_size {
-                result_bytes.push(format!("{}[{}]", bytes_name, i));
-            }
+            push_byte_refs(result_bytes, &bytes_name, field_size);
             Some(bytes_name)
         }
         xcbdefs::FieldDef::Expr(xcbdefs::ExprField {
@@ -125,7 +117,7 @@ pub(super) fn emit_field_serialize(
             let bytes_name = postfix_var_name(&rust_field_name, "bytes");
 
             outln!(out, "let {} = &[{}];", bytes_name, v,);
-            result_bytes.push(format!("{}[{}]", bytes_name, 0));
+            push_byte_refs(result_bytes, &bytes_name, 1);
             Some(bytes_name)
         }
         xcbdefs::FieldDef::Fd(..) | xcbdefs::FieldDef::FdList(..) => {
@@ -144,9 +136,7 @@ pub(super) fn emit_field_serialize(
             );
             outln!(out, "let {0} = {0}.to_ne_bytes();", bytes_name);
 
-            for i in 0..4 {
-                result_bytes.push(format!("{}[{}]", bytes_name, i));
-            }
+            push_byte_refs(result_bytes, &bytes_name, 4);
 
             Some(bytes_name)
         }
@@ -154,6 +144,25 @@ pub(super) fn emit_field_serialize(
     }
 }
 
+/// Emits the elements of an array literal holding `bytes`, one per line.
+///
+/// The elements are rendered into one string first, so that the whole
+/// array body is written to `out` at once.
+pub(super) fn emit_byte_array_elements(bytes: &[String], out: &mut Output) {
+    let mut elements = String::with_capacity(bytes.iter().map(|byte| byte.len() + 2).sum());
+    for byte in bytes.iter() {
+        elements.push_str(byte);
+        elements.push_str(",\n");
+    }
+    out!(out.indent(), "{}", elements);
+}
+
+/// Pushes the expressions for the first `count` bytes of the array
+/// `bytes_name` to `result_bytes`.
+pub(super) fn push_byte_refs(result_bytes: &mut Vec<String>, bytes_name: &str, count: u32) {
+    result_bytes.extend((0..count).map(|i| format!("{}[{}]", bytes_name, i)));
+}
+
 pub(super) fn emit_field_serialize_into(
     generator: &NamespaceGenerator<'_, '_>,
     field: &xcbdefs::FieldDef,
@@ -133,7 +133,8 @@ pub(super) fn emit_struct_type(
                     outln!(out, "let remaining = initial_value;");
                 }
                 NamespaceGenerator::emit_let_value_for_dynamic_align(fields, out);
-                for field in fields.iter() {
+                let num_prefix_fields = parse::emit_fixed_prefix_parse(generator, fields, out);
+                for field in fields[num_prefix_fields..].iter() {
                     parse::emit_field_parse(
                         generator,
                         field,
@@ -395,9 +396,7 @@ fn emit_fixed_size_struct_serialize(
                 );
             }
             outln!(out, "[");
-            for result_byte in result_bytes.iter() {
-                outln!(out.indent(), "{},", result_byte);
-            }
+            serialize::emit_byte_array_elements(&result_bytes, out);
             outln!(out, "]");
         });
         outln!(out, "}}");
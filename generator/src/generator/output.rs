@@ -1,6 +1,8 @@
 pub(super) struct Output {
     data: String,
-    indent: usize,
+    // The whitespace for the current indentation level, kept up to date so
+    // that it doesn't have to be rebuilt for every line.
+    indent: String,
 }
 
 impl Output {
@@ -8,24 +10,24 @@ impl Output {
     pub(super) fn new() -> Self {
         Self {
             data: String::new(),
-            indent: 0,
+            indent: String::new(),
         }
     }
 
     #[inline]
     pub(super) fn into_data(self) -> String {
-        assert_eq!(self.indent, 0);
+        assert!(self.indent.is_empty());
         self.data
     }
 
     #[inline]
     fn incr_indent(&mut self) {
-        self.indent += 1;
+        self.indent.push_str("    ");
     }
 
     #[inline]
     fn decr_indent(&mut self) {
-        self.indent -= 1;
+        self.indent.truncate(self.indent.len() - 4);
     }
 
     #[inline]
@@ -39,19 +41,39 @@ impl Output {
     pub(super) fn indent(&mut self) -> Indented<'_> {
         Indented { out: self }
     }
+
+    /// Write every item of `lines` as a separate line.
+    ///
+    /// This avoids going through the formatting machinery of `outln!` for
+    /// lines that are already rendered.
+    pub(super) fn write_lines<S: AsRef<str>>(&mut self, lines: impl IntoIterator<Item = S>) {
+        for line in lines {
+            std::fmt::Write::write_str(self, line.as_ref()).unwrap();
+            std::fmt::Write::write_str(self, "\n").unwrap();
+        }
+    }
 }
 
 impl std::fmt::Write for Output {
     fn write_str(&mut self, s: &str) -> std::fmt::Result {
+        // Pieces of a formatted line (like the values of its arguments) do
+        // not start a new line, so they can be appended as they are.
+        if !s.contains('\n') && !self.data.ends_with('\n') {
+            self.data.push_str(s);
+            return Ok(());
+        }
+
+        // Grow the buffer once for the whole chunk instead of once per line.
+        self.data.reserve(s.len());
         for (i, line) in s.split('\n').enumerate() {
             if i != 0 {
                 self.data.push('\n');
             }
+            // Empty lines are not indented, so that the output never has
+            // trailing whitespace that would need to be stripped later.
             if !line.is_empty() {
                 if self.data.ends_with('\n') {
-                    for _ in 0..self.indent {
-                        self.data.push_str("    ");
-                    }
+                    self.data.push_str(&self.indent);
                 }
                 self.data.push_str(line);
             }
@@ -71,6 +93,15 @@ impl std::fmt::Write for Indented<'_> {
         self.out.decr_indent();
         r
     }
+
+    // Adjust the indentation once for a whole formatted write instead of
+    // once for every piece it is split into.
+    fn write_fmt(&mut self, args: std::fmt::Arguments<'_>) -> std::fmt::Result {
+        self.out.incr_indent();
+        let r = std::fmt::Write::write_fmt(&mut self.out, args);
+        self.out.decr_indent();
+        r
+    }
 }
 
 macro_rules! out {
@@ -1,4 +1,5 @@
 use std::collections::HashMap;
+use std::rc::Rc;
 
 use xcbgen::defs as xcbdefs;
 
@@ -22,6 +23,13 @@ pub(super) struct PerModuleEnumCases {
 
 pub(super) type EnumCases = HashMap<String, PerModuleEnumCases>;
 
+/// The enum cases of a namespace, together with whether they need a `#[cfg]`.
+struct NsCases {
+    ns: Rc<xcbdefs::Namespace>,
+    has_feature: bool,
+    cases: PerModuleEnumCases,
+}
+
 fn generate_request_naming_internal(out: &mut Output, module: &xcbdefs::Module) {
     outln!(
         out,
@@ -165,7 +173,17 @@ fn generate_request_naming(out: &mut Output) {
 
 /// Generate the Request and Reply enums containing all possible requests and replies, respectively.
 pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_cases: EnumCases) {
-    let namespaces = module.sorted_namespaces();
+    // Look up the enum cases and the feature of every namespace once, instead
+    // of in each of the passes below.
+    let mut namespaces: Vec<_> = module
+        .sorted_namespaces()
+        .into_iter()
+        .map(|ns| NsCases {
+            has_feature: super::ext_has_feature(&ns.header),
+            cases: enum_cases.remove(&ns.header).unwrap(),
+            ns,
+        })
+        .collect();
 
     generate_request_naming_internal(out, module);
     generate_request_naming(out);
@@ -178,17 +196,11 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
     outln!(out, "pub enum Request<'input> {{");
     out.indented(|out| {
         outln!(out, "Unknown(RequestHeader, Cow<'input, [u8]>),");
-        for ns in namespaces.iter() {
-            let has_feature = super::ext_has_feature(&ns.header);
-
-            let request_cases = enum_cases
-                .get_mut(&ns.header)
-                .unwrap()
-                .request_variants
-                .drain(..);
+        for ns_cases in namespaces.iter_mut() {
+            let request_cases = ns_cases.cases.request_variants.drain(..);
             for case in request_cases {
-                if has_feature {
-                    outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
+                if ns_cases.has_feature {
+                    outln!(out, "#[cfg(feature = \"{}\")]", ns_cases.ns.header);
                 }
                 outln!(out, "{}", case);
             }
@@ -222,15 +234,14 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
             outln!(out, "// Check if this is a core protocol request.");
             outln!(out, "match header.major_opcode {{");
             out.indented(|out| {
-                let xproto_ns = module.namespace("xproto").unwrap();
-                let xproto_cases = enum_cases
-                    .get_mut(&xproto_ns.header)
+                let xproto_cases = namespaces
+                    .iter_mut()
+                    .find(|ns_cases| ns_cases.ns.header == "xproto")
                     .unwrap()
+                    .cases
                     .request_parse_cases
                     .drain(..);
-                for case in xproto_cases {
-                    outln!(out, "{}", case);
-                }
+                out.write_lines(xproto_cases);
                 outln!(out, "_ => (),");
             });
             outln!(out, "}}");
@@ -244,25 +255,25 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
             );
             outln!(out, "match ext_info {{");
             out.indented(|out| {
-                for ns in namespaces.iter() {
-                    let parse_cases =
-                        &mut enum_cases.get_mut(&ns.header).unwrap().request_parse_cases;
+                for ns_cases in namespaces.iter_mut() {
+                    let parse_cases = &mut ns_cases.cases.request_parse_cases;
                     if parse_cases.is_empty() {
                         continue;
                     }
 
-                    let has_feature = super::ext_has_feature(&ns.header);
-                    if has_feature {
-                        outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
+                    if ns_cases.has_feature {
+                        outln!(out, "#[cfg(feature = \"{}\")]", ns_cases.ns.header);
                     }
-                    outln!(out, "Some(({}::X11_EXTENSION_NAME, _)) => {{", ns.header);
+                    outln!(
+                        out,
+                        "Some(({}::X11_EXTENSION_NAME, _)) => {{",
+                        ns_cases.ns.header
+                    );
 
                     out.indented(|out| {
                         let parse_cases = parse_cases.drain(..);
                         outln!(out, "match header.minor_opcode {{");
-                        for case in parse_cases {
-                            outln!(out.indent(), "{}", case);
-                        }
+                        out.indented(|out| out.write_lines(parse_cases));
                         outln!(out.indent(), "_ => (),");
                         outln!(out, "}}");
                     });
@@ -290,17 +301,11 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
             outln!(out, "match self {{");
             out.indented(|out| {
                 outln!(out, "Request::Unknown(_, _) => None,");
-                for ns in namespaces.iter() {
-                    let has_feature = super::ext_has_feature(&ns.header);
-
-                    let reply_parse_cases = enum_cases
-                        .get_mut(&ns.header)
-                        .unwrap()
-                        .reply_parse_cases
-                        .drain(..);
+                for ns_cases in namespaces.iter_mut() {
+                    let reply_parse_cases = ns_cases.cases.reply_parse_cases.drain(..);
                     for case in reply_parse_cases {
-                        if has_feature {
-                            outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
+                        if ns_cases.has_feature {
+                            outln!(out, "#[cfg(feature = \"{}\")]", ns_cases.ns.header);
                         }
                         outln!(out, "{}", case);
                     }
@@ -322,17 +327,12 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
                     "Request::Unknown(header, body) => Request::Unknown(header, \
                      Cow::Owned(body.into_owned())),"
                 );
-                for ns in namespaces.iter() {
-                    let has_feature = super::ext_has_feature(&ns.header);
-
-                    let request_into_owned_cases = enum_cases
-                        .get_mut(&ns.header)
-                        .unwrap()
-                        .request_into_owned_cases
-                        .drain(..);
+                for ns_cases in namespaces.iter_mut() {
+                    let request_into_owned_cases =
+                        ns_cases.cases.request_into_owned_cases.drain(..);
                     for case in request_into_owned_cases {
-                        if has_feature {
-                            outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
+                        if ns_cases.has_feature {
+                            outln!(out, "#[cfg(feature = \"{}\")]", ns_cases.ns.header);
                         }
                         outln!(out, "{}", case);
                     }
@@ -352,17 +352,11 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
     outln!(out, "pub enum Reply {{");
     out.indented(|out| {
         outln!(out, "Void,");
-        for ns in namespaces.iter() {
-            let has_feature = super::ext_has_feature(&ns.header);
-
-            let reply_cases = enum_cases
-                .get_mut(&ns.header)
-                .unwrap()
-                .reply_variants
-                .drain(..);
+        for ns_cases in namespaces.iter_mut() {
+            let reply_cases = ns_cases.cases.reply_variants.drain(..);
             for case in reply_cases {
-                if has_feature {
-                    outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
+                if ns_cases.has_feature {
+                    outln!(out, "#[cfg(feature = \"{}\")]", ns_cases.ns.header);
                 }
                 outln!(out, "{}", case);
             }
@@ -376,17 +370,11 @@ pub(super) fn generate(out: &mut Output, module: &xcbdefs::Module, mut enum_case
         outln!(out, "}}");
     });
     outln!(out, "}}");
-    for ns in namespaces.iter() {
-        let has_feature = super::ext_has_feature(&ns.header);
-
-        let reply_from_cases = enum_cases
-            .get_mut(&ns.header)
-            .unwrap()
-            .reply_from_cases
-            .drain(..);
+    for ns_cases in namespaces.iter_mut() {
+        let reply_from_cases = ns_cases.cases.reply_from_cases.drain(..);
         for case in reply_from_cases {
-            if has_feature {
-                outln!(out, "#[cfg(feature = \"{}\")]", ns.header);
+            if ns_cases.has_feature {
+                outln!(out, "#[cfg(feature = \"{}\")]", ns_cases.ns.header);
             }
             outln!(out, "{}", case);
         }
@@ -95,8 +95,17 @@ fn load_namespace(path: &Path, parser: &mut xcbgen::Parser) -> Result<(), Error>
 /// Writes `data` to `file_path` if the file does not exist or
 /// its current contents are different. This avoids updating the timestamps
 /// if the contents have not changed.
+///
+/// This is what keeps a no-op regeneration from invalidating cargo's caches.
+/// The generator itself always runs in full: comparing the output is what
+/// catches generated files that were edited by hand or went stale.
 fn replace_file_if_different(file_path: &Path, data: &[u8]) -> Result<(), Error> {
-    if file_path.exists() {
+    // A file with a different size cannot have the same contents, so only
+    // read it when the sizes match.
+    let same_len = std::fs::metadata(file_path)
+        .map(|metadata| u64::try_from(data.len()) == Ok(metadata.len()))
+        .unwrap_or(false);
+    if same_len {
         let existing_data = std::fs::read(file_path).map_err(|e| Error::FileReadFailed {
             _path: file_path.to_path_buf(),
             _error: e,
@@ -129,6 +138,10 @@ fn main() -> Result<ExitCode, Error> {
     let x11rb_output_dir_path = Path::new(&args[3]);
     let async_output_dir_path = Path::new(&args[4]);
 
+    // The XMLs are parsed and resolved from scratch on every run. The
+    // definitions are a graph of `Rc`/`Weak` references that cannot be
+    // stored on disk without adding serialization support to xcbgen, and
+    // `replace_file_if_different` already keeps unchanged outputs untouched.
     let xml_files = list_xmls(input_dir_path)?;
     let module = xcbgen::defs::Module::new();
     let mut parser = xcbgen::Parser::new(module.clone());
@@ -143,8 +156,7 @@ fn main() -> Result<ExitCode, Error> {
     xcbgen::resolve(&module).map_err(|e| Error::XcbResolveFailed { _error: e })?;
     println!("Resolved successfully");
 
-    let generated = generator::generate(&module);
-    for generated in generated.iter() {
+    generator::generate(&module, |generated| {
         let mut proto_file_path = PathBuf::from(proto_output_dir_path);
         let mut x11rb_file_path = PathBuf::from(x11rb_output_dir_path);
         proto_file_path.push(&generated.file_name);
@@ -152,8 +164,8 @@ fn main() -> Result<ExitCode, Error> {
         let async_file_path = async_output_dir_path.join(&generated.file_name);
         replace_file_if_different(&proto_file_path, generated.proto.as_bytes())?;
         replace_file_if_different(&x11rb_file_path, generated.x11rb.as_bytes())?;
-        replace_file_if_different(&async_file_path, generated.async_.as_bytes())?;
-    }
+        replace_file_if_different(&async_file_path, generated.async_.as_bytes())
+    })?;
     println!("Code generated successfully");
 
     Ok(ExitCode::SUCCESS)
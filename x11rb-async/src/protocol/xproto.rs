@@ -267,11 +267,11 @@ where
 /// # Errors
 ///
 /// * `Match` - The new parent window is not on the same screen as the old parent window.
-///   
+///
 ///   The new parent window is the specified window or an inferior of the specified window.
-///   
+///
 ///   The new parent is InputOnly and the window is not.
-///   
+///
 ///   The specified window has a ParentRelative background and the new parent window is not the same depth as the specified window.
 /// * `Window` - The specified window does not exist.
 ///
@@ -3469,11 +3469,11 @@ pub trait ConnectionExt: RequestConnection {
     /// # Errors
     ///
     /// * `Match` - The new parent window is not on the same screen as the old parent window.
-    ///   
+    ///
     ///   The new parent window is the specified window or an inferior of the specified window.
-    ///   
+    ///
     ///   The new parent is InputOnly and the window is not.
-    ///   
+    ///
     ///   The specified window has a ParentRelative background and the new parent window is not the same depth as the specified window.
     /// * `Window` - The specified window does not exist.
     ///
@@ -57,30 +57,7 @@ impl From<Redirect> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Redirect> for u16 {
-    #[inline]
-    fn from(input: Redirect) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Redirect> for Option<u16> {
-    #[inline]
-    fn from(input: Redirect) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Redirect> for u32 {
-    #[inline]
-    fn from(input: Redirect) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Redirect> for Option<u32> {
-    #[inline]
-    fn from(input: Redirect) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Redirect, u16, u32);
 impl From<u8> for Redirect {
     #[inline]
     fn from(value: u8) -> Self {
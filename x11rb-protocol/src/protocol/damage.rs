@@ -61,30 +61,7 @@ impl From<ReportLevel> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ReportLevel> for u16 {
-    #[inline]
-    fn from(input: ReportLevel) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ReportLevel> for Option<u16> {
-    #[inline]
-    fn from(input: ReportLevel) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ReportLevel> for u32 {
-    #[inline]
-    fn from(input: ReportLevel) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ReportLevel> for Option<u32> {
-    #[inline]
-    fn from(input: ReportLevel) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ReportLevel, u16, u32);
 impl From<u8> for ReportLevel {
     #[inline]
     fn from(value: u8) -> Self {
@@ -636,12 +613,13 @@ impl_debug_if_no_extra_traits!(NotifyEvent, "NotifyEvent");
 impl TryParse for NotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (level, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (drawable, remaining) = xproto::Drawable::try_parse(remaining)?;
-        let (damage, remaining) = Damage::try_parse(remaining)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let level = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let drawable = xproto::Drawable::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let damage = Damage::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let (area, remaining) = xproto::Rectangle::try_parse(remaining)?;
         let (geometry, remaining) = xproto::Rectangle::try_parse(remaining)?;
         let level = level.into();
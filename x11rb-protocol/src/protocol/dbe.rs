@@ -67,30 +67,7 @@ impl From<SwapAction> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SwapAction> for u16 {
-    #[inline]
-    fn from(input: SwapAction) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SwapAction> for Option<u16> {
-    #[inline]
-    fn from(input: SwapAction) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SwapAction> for u32 {
-    #[inline]
-    fn from(input: SwapAction) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SwapAction> for Option<u32> {
-    #[inline]
-    fn from(input: SwapAction) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SwapAction, u16, u32);
 impl From<u8> for SwapAction {
     #[inline]
     fn from(value: u8) -> Self {
@@ -119,9 +96,9 @@ pub struct SwapInfo {
 impl_debug_if_no_extra_traits!(SwapInfo, "SwapInfo");
 impl TryParse for SwapInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (swap_action, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let swap_action = fixed_bytes[4];
         let swap_action = swap_action.into();
         let result = SwapInfo { window, swap_action };
         Ok((result, remaining))
@@ -193,10 +170,10 @@ pub struct VisualInfo {
 impl_debug_if_no_extra_traits!(VisualInfo, "VisualInfo");
 impl TryParse for VisualInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (visual_id, remaining) = xproto::Visualid::try_parse(remaining)?;
-        let (depth, remaining) = u8::try_parse(remaining)?;
-        let (perf_level, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let visual_id = xproto::Visualid::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let depth = fixed_bytes[4];
+        let perf_level = fixed_bytes[5];
         let result = VisualInfo { visual_id, depth, perf_level };
         Ok((result, remaining))
     }
@@ -612,18 +612,7 @@ impl From<DPMSMode> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<DPMSMode> for u32 {
-    #[inline]
-    fn from(input: DPMSMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DPMSMode> for Option<u32> {
-    #[inline]
-    fn from(input: DPMSMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DPMSMode, u32);
 impl From<u8> for DPMSMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -962,16 +951,15 @@ impl_debug_if_no_extra_traits!(InfoNotifyEvent, "InfoNotifyEvent");
 impl TryParse for InfoNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (power_level, remaining) = u16::try_parse(remaining)?;
-        let (state, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(21..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let power_level = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let state = fixed_bytes[18] != 0;
         let power_level = power_level.into();
         let result = InfoNotifyEvent { response_type, extension, sequence, length, event_type, timestamp, power_level, state };
         let _ = remaining;
@@ -168,18 +168,7 @@ impl From<EventType> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<EventType> for u32 {
-    #[inline]
-    fn from(input: EventType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<EventType> for Option<u32> {
-    #[inline]
-    fn from(input: EventType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(EventType, u32);
 impl From<u8> for EventType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -216,11 +205,12 @@ pub struct DRI2Buffer {
 impl_debug_if_no_extra_traits!(DRI2Buffer, "DRI2Buffer");
 impl TryParse for DRI2Buffer {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (attachment, remaining) = u32::try_parse(remaining)?;
-        let (name, remaining) = u32::try_parse(remaining)?;
-        let (pitch, remaining) = u32::try_parse(remaining)?;
-        let (cpp, remaining) = u32::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let attachment = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let name = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let pitch = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let cpp = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let attachment = attachment.into();
         let result = DRI2Buffer { attachment, name, pitch, cpp, flags };
         Ok((result, remaining))
@@ -277,8 +267,9 @@ pub struct AttachFormat {
 impl_debug_if_no_extra_traits!(AttachFormat, "AttachFormat");
 impl TryParse for AttachFormat {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (attachment, remaining) = u32::try_parse(remaining)?;
-        let (format, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let attachment = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let format = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let attachment = attachment.into();
         let result = AttachFormat { attachment, format };
         Ok((result, remaining))
@@ -2210,17 +2201,16 @@ impl_debug_if_no_extra_traits!(BufferSwapCompleteEvent, "BufferSwapCompleteEvent
 impl TryParse for BufferSwapCompleteEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (drawable, remaining) = xproto::Drawable::try_parse(remaining)?;
-        let (ust_hi, remaining) = u32::try_parse(remaining)?;
-        let (ust_lo, remaining) = u32::try_parse(remaining)?;
-        let (msc_hi, remaining) = u32::try_parse(remaining)?;
-        let (msc_lo, remaining) = u32::try_parse(remaining)?;
-        let (sbc, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let drawable = xproto::Drawable::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let ust_hi = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let ust_lo = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let msc_hi = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let msc_lo = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let sbc = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
         let event_type = event_type.into();
         let result = BufferSwapCompleteEvent { response_type, sequence, event_type, drawable, ust_hi, ust_lo, msc_hi, msc_lo, sbc };
         let _ = remaining;
@@ -2358,10 +2348,10 @@ impl_debug_if_no_extra_traits!(InvalidateBuffersEvent, "InvalidateBuffersEvent")
 impl TryParse for InvalidateBuffersEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (drawable, remaining) = xproto::Drawable::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let drawable = xproto::Drawable::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = InvalidateBuffersEvent { response_type, sequence, drawable };
         let _ = remaining;
         let remaining = initial_value.get(32..)
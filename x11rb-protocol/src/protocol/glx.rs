@@ -122,20 +122,19 @@ impl_debug_if_no_extra_traits!(PbufferClobberEvent, "PbufferClobberEvent");
 impl TryParse for PbufferClobberEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (draw_type, remaining) = u16::try_parse(remaining)?;
-        let (drawable, remaining) = Drawable::try_parse(remaining)?;
-        let (b_mask, remaining) = u32::try_parse(remaining)?;
-        let (aux_buffer, remaining) = u16::try_parse(remaining)?;
-        let (x, remaining) = u16::try_parse(remaining)?;
-        let (y, remaining) = u16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (count, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let draw_type = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let drawable = Drawable::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let b_mask = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let aux_buffer = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let x = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let y = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let width = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let height = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let count = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
         let result = PbufferClobberEvent { response_type, sequence, event_type, draw_type, drawable, b_mask, aux_buffer, x, y, width, height, count };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -287,17 +286,16 @@ impl_debug_if_no_extra_traits!(BufferSwapCompleteEvent, "BufferSwapCompleteEvent
 impl TryParse for BufferSwapCompleteEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (drawable, remaining) = Drawable::try_parse(remaining)?;
-        let (ust_hi, remaining) = u32::try_parse(remaining)?;
-        let (ust_lo, remaining) = u32::try_parse(remaining)?;
-        let (msc_hi, remaining) = u32::try_parse(remaining)?;
-        let (msc_lo, remaining) = u32::try_parse(remaining)?;
-        let (sbc, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let drawable = Drawable::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let ust_hi = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let ust_lo = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let msc_hi = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let msc_lo = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let sbc = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
         let result = BufferSwapCompleteEvent { response_type, sequence, event_type, drawable, ust_hi, ust_lo, msc_hi, msc_lo, sbc };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -439,18 +437,7 @@ impl From<PBCET> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<PBCET> for u32 {
-    #[inline]
-    fn from(input: PBCET) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PBCET> for Option<u32> {
-    #[inline]
-    fn from(input: PBCET) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PBCET, u32);
 impl From<u8> for PBCET {
     #[inline]
     fn from(value: u8) -> Self {
@@ -492,18 +479,7 @@ impl From<PBCDT> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<PBCDT> for u32 {
-    #[inline]
-    fn from(input: PBCDT) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PBCDT> for Option<u32> {
-    #[inline]
-    fn from(input: PBCDT) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PBCDT, u32);
 impl From<u8> for PBCDT {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4701,18 +4677,7 @@ impl From<RM> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<RM> for u32 {
-    #[inline]
-    fn from(input: RM) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<RM> for Option<u32> {
-    #[inline]
-    fn from(input: RM) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(RM, u32);
 impl From<u8> for RM {
     #[inline]
     fn from(value: u8) -> Self {
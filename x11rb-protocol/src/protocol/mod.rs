@@ -8240,33 +8240,41 @@ impl ErrorKind {
             }
             #[cfg(feature = "glx")]
             Some((glx::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    glx::BAD_CONTEXT_ERROR => Self::GlxBadContext,
-                    glx::BAD_CONTEXT_STATE_ERROR => Self::GlxBadContextState,
-                    glx::BAD_CONTEXT_TAG_ERROR => Self::GlxBadContextTag,
-                    glx::BAD_CURRENT_DRAWABLE_ERROR => Self::GlxBadCurrentDrawable,
-                    glx::BAD_CURRENT_WINDOW_ERROR => Self::GlxBadCurrentWindow,
-                    glx::BAD_DRAWABLE_ERROR => Self::GlxBadDrawable,
-                    glx::BAD_FB_CONFIG_ERROR => Self::GlxBadFBConfig,
-                    glx::BAD_LARGE_REQUEST_ERROR => Self::GlxBadLargeRequest,
-                    glx::BAD_PBUFFER_ERROR => Self::GlxBadPbuffer,
-                    glx::BAD_PIXMAP_ERROR => Self::GlxBadPixmap,
-                    glx::BAD_RENDER_REQUEST_ERROR => Self::GlxBadRenderRequest,
-                    glx::BAD_WINDOW_ERROR => Self::GlxBadWindow,
-                    glx::GLX_BAD_PROFILE_ARB_ERROR => Self::GlxGLXBadProfileARB,
-                    glx::UNSUPPORTED_PRIVATE_REQUEST_ERROR => Self::GlxUnsupportedPrivateRequest,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of glx, which are dense and start at zero
+                const KINDS: [ErrorKind; 14] = [
+                    ErrorKind::GlxBadContext,
+                    ErrorKind::GlxBadContextState,
+                    ErrorKind::GlxBadDrawable,
+                    ErrorKind::GlxBadPixmap,
+                    ErrorKind::GlxBadContextTag,
+                    ErrorKind::GlxBadCurrentWindow,
+                    ErrorKind::GlxBadRenderRequest,
+                    ErrorKind::GlxBadLargeRequest,
+                    ErrorKind::GlxUnsupportedPrivateRequest,
+                    ErrorKind::GlxBadFBConfig,
+                    ErrorKind::GlxBadPbuffer,
+                    ErrorKind::GlxBadCurrentDrawable,
+                    ErrorKind::GlxBadWindow,
+                    ErrorKind::GlxGLXBadProfileARB,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "randr")]
             Some((randr::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    randr::BAD_CRTC_ERROR => Self::RandrBadCrtc,
-                    randr::BAD_MODE_ERROR => Self::RandrBadMode,
-                    randr::BAD_OUTPUT_ERROR => Self::RandrBadOutput,
-                    randr::BAD_PROVIDER_ERROR => Self::RandrBadProvider,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of randr, which are dense and start at zero
+                const KINDS: [ErrorKind; 4] = [
+                    ErrorKind::RandrBadOutput,
+                    ErrorKind::RandrBadCrtc,
+                    ErrorKind::RandrBadMode,
+                    ErrorKind::RandrBadProvider,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "record")]
             Some((record::X11_EXTENSION_NAME, ext_info)) => {
@@ -8277,14 +8285,18 @@ impl ErrorKind {
             }
             #[cfg(feature = "render")]
             Some((render::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    render::GLYPH_ERROR => Self::RenderGlyph,
-                    render::GLYPH_SET_ERROR => Self::RenderGlyphSet,
-                    render::PICT_FORMAT_ERROR => Self::RenderPictFormat,
-                    render::PICT_OP_ERROR => Self::RenderPictOp,
-                    render::PICTURE_ERROR => Self::RenderPicture,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of render, which are dense and start at zero
+                const KINDS: [ErrorKind; 5] = [
+                    ErrorKind::RenderPictFormat,
+                    ErrorKind::RenderPicture,
+                    ErrorKind::RenderPictOp,
+                    ErrorKind::RenderGlyphSet,
+                    ErrorKind::RenderGlyph,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "shm")]
             Some((shm::X11_EXTENSION_NAME, ext_info)) => {
@@ -8295,24 +8307,32 @@ impl ErrorKind {
             }
             #[cfg(feature = "sync")]
             Some((sync::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    sync::ALARM_ERROR => Self::SyncAlarm,
-                    sync::COUNTER_ERROR => Self::SyncCounter,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of sync, which are dense and start at zero
+                const KINDS: [ErrorKind; 2] = [
+                    ErrorKind::SyncCounter,
+                    ErrorKind::SyncAlarm,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "xf86vidmode")]
             Some((xf86vidmode::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    xf86vidmode::BAD_CLOCK_ERROR => Self::Xf86vidmodeBadClock,
-                    xf86vidmode::BAD_H_TIMINGS_ERROR => Self::Xf86vidmodeBadHTimings,
-                    xf86vidmode::BAD_V_TIMINGS_ERROR => Self::Xf86vidmodeBadVTimings,
-                    xf86vidmode::CLIENT_NOT_LOCAL_ERROR => Self::Xf86vidmodeClientNotLocal,
-                    xf86vidmode::EXTENSION_DISABLED_ERROR => Self::Xf86vidmodeExtensionDisabled,
-                    xf86vidmode::MODE_UNSUITABLE_ERROR => Self::Xf86vidmodeModeUnsuitable,
-                    xf86vidmode::ZOOM_LOCKED_ERROR => Self::Xf86vidmodeZoomLocked,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of xf86vidmode, which are dense and start at zero
+                const KINDS: [ErrorKind; 7] = [
+                    ErrorKind::Xf86vidmodeBadClock,
+                    ErrorKind::Xf86vidmodeBadHTimings,
+                    ErrorKind::Xf86vidmodeBadVTimings,
+                    ErrorKind::Xf86vidmodeModeUnsuitable,
+                    ErrorKind::Xf86vidmodeExtensionDisabled,
+                    ErrorKind::Xf86vidmodeClientNotLocal,
+                    ErrorKind::Xf86vidmodeZoomLocked,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "xfixes")]
             Some((xfixes::X11_EXTENSION_NAME, ext_info)) => {
@@ -8323,14 +8343,18 @@ impl ErrorKind {
             }
             #[cfg(feature = "xinput")]
             Some((xinput::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    xinput::CLASS_ERROR => Self::XinputClass,
-                    xinput::DEVICE_ERROR => Self::XinputDevice,
-                    xinput::DEVICE_BUSY_ERROR => Self::XinputDeviceBusy,
-                    xinput::EVENT_ERROR => Self::XinputEvent,
-                    xinput::MODE_ERROR => Self::XinputMode,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of xinput, which are dense and start at zero
+                const KINDS: [ErrorKind; 5] = [
+                    ErrorKind::XinputDevice,
+                    ErrorKind::XinputEvent,
+                    ErrorKind::XinputMode,
+                    ErrorKind::XinputDeviceBusy,
+                    ErrorKind::XinputClass,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "xkb")]
             Some((xkb::X11_EXTENSION_NAME, ext_info)) => {
@@ -8341,20 +8365,28 @@ impl ErrorKind {
             }
             #[cfg(feature = "xprint")]
             Some((xprint::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    xprint::BAD_CONTEXT_ERROR => Self::XprintBadContext,
-                    xprint::BAD_SEQUENCE_ERROR => Self::XprintBadSequence,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of xprint, which are dense and start at zero
+                const KINDS: [ErrorKind; 2] = [
+                    ErrorKind::XprintBadContext,
+                    ErrorKind::XprintBadSequence,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             #[cfg(feature = "xv")]
             Some((xv::X11_EXTENSION_NAME, ext_info)) => {
-                match error_code - ext_info.first_error {
-                    xv::BAD_CONTROL_ERROR => Self::XvBadControl,
-                    xv::BAD_ENCODING_ERROR => Self::XvBadEncoding,
-                    xv::BAD_PORT_ERROR => Self::XvBadPort,
-                    _ => Self::Unknown(error_code),
-                }
+                // Indexed by the error codes of xv, which are dense and start at zero
+                const KINDS: [ErrorKind; 3] = [
+                    ErrorKind::XvBadPort,
+                    ErrorKind::XvBadEncoding,
+                    ErrorKind::XvBadControl,
+                ];
+                KINDS
+                    .get(usize::from(error_code - ext_info.first_error))
+                    .copied()
+                    .unwrap_or(Self::Unknown(error_code))
             }
             _ => Self::Unknown(error_code),
         }
@@ -8574,6 +8606,11 @@ pub enum Event {
     XvVideoNotify(xv::VideoNotifyEvent),
 }
 
+/// A function that parses the raw bytes of one specific kind of event.
+// Only used if an extension with dense event codes is enabled.
+#[allow(dead_code)]
+type EventParser = fn(&[u8]) -> Result<Event, ParseError>;
+
 impl Event {
     /// Parse a generic X11 event into a concrete event type.
     #[allow(clippy::cognitive_complexity, clippy::match_single_binding)]
@@ -8634,18 +8671,26 @@ impl Event {
             }
             #[cfg(feature = "dri2")]
             Some((dri2::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    dri2::BUFFER_SWAP_COMPLETE_EVENT => Ok(Self::Dri2BufferSwapComplete(TryParse::try_parse(event)?.0)),
-                    dri2::INVALIDATE_BUFFERS_EVENT => Ok(Self::Dri2InvalidateBuffers(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of dri2, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::Dri2BufferSwapComplete(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::Dri2InvalidateBuffers(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "glx")]
             Some((glx::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    glx::BUFFER_SWAP_COMPLETE_EVENT => Ok(Self::GlxBufferSwapComplete(TryParse::try_parse(event)?.0)),
-                    glx::PBUFFER_CLOBBER_EVENT => Ok(Self::GlxPbufferClobber(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of glx, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::GlxPbufferClobber(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::GlxBufferSwapComplete(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "present")]
@@ -8657,10 +8702,14 @@ impl Event {
             }
             #[cfg(feature = "randr")]
             Some((randr::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    randr::NOTIFY_EVENT => Ok(Self::RandrNotify(TryParse::try_parse(event)?.0)),
-                    randr::SCREEN_CHANGE_NOTIFY_EVENT => Ok(Self::RandrScreenChangeNotify(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of randr, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::RandrScreenChangeNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::RandrNotify(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "screensaver")]
@@ -8686,41 +8735,53 @@ impl Event {
             }
             #[cfg(feature = "sync")]
             Some((sync::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    sync::ALARM_NOTIFY_EVENT => Ok(Self::SyncAlarmNotify(TryParse::try_parse(event)?.0)),
-                    sync::COUNTER_NOTIFY_EVENT => Ok(Self::SyncCounterNotify(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of sync, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::SyncCounterNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::SyncAlarmNotify(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "xfixes")]
             Some((xfixes::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    xfixes::CURSOR_NOTIFY_EVENT => Ok(Self::XfixesCursorNotify(TryParse::try_parse(event)?.0)),
-                    xfixes::SELECTION_NOTIFY_EVENT => Ok(Self::XfixesSelectionNotify(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of xfixes, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::XfixesSelectionNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XfixesCursorNotify(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "xinput")]
             Some((xinput::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    xinput::CHANGE_DEVICE_NOTIFY_EVENT => Ok(Self::XinputChangeDeviceNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_BUTTON_PRESS_EVENT => Ok(Self::XinputDeviceButtonPress(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_BUTTON_RELEASE_EVENT => Ok(Self::XinputDeviceButtonRelease(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_BUTTON_STATE_NOTIFY_EVENT => Ok(Self::XinputDeviceButtonStateNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_FOCUS_IN_EVENT => Ok(Self::XinputDeviceFocusIn(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_FOCUS_OUT_EVENT => Ok(Self::XinputDeviceFocusOut(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_KEY_PRESS_EVENT => Ok(Self::XinputDeviceKeyPress(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_KEY_RELEASE_EVENT => Ok(Self::XinputDeviceKeyRelease(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_KEY_STATE_NOTIFY_EVENT => Ok(Self::XinputDeviceKeyStateNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_MAPPING_NOTIFY_EVENT => Ok(Self::XinputDeviceMappingNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_MOTION_NOTIFY_EVENT => Ok(Self::XinputDeviceMotionNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_PRESENCE_NOTIFY_EVENT => Ok(Self::XinputDevicePresenceNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_PROPERTY_NOTIFY_EVENT => Ok(Self::XinputDevicePropertyNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_STATE_NOTIFY_EVENT => Ok(Self::XinputDeviceStateNotify(TryParse::try_parse(event)?.0)),
-                    xinput::DEVICE_VALUATOR_EVENT => Ok(Self::XinputDeviceValuator(TryParse::try_parse(event)?.0)),
-                    xinput::PROXIMITY_IN_EVENT => Ok(Self::XinputProximityIn(TryParse::try_parse(event)?.0)),
-                    xinput::PROXIMITY_OUT_EVENT => Ok(Self::XinputProximityOut(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of xinput, which are dense and start at zero
+                const PARSERS: [EventParser; 17] = [
+                    |event| Ok(Event::XinputDeviceValuator(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceKeyPress(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceKeyRelease(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceButtonPress(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceButtonRelease(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceMotionNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceFocusIn(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceFocusOut(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputProximityIn(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputProximityOut(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceStateNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceMappingNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputChangeDeviceNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceKeyStateNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDeviceButtonStateNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDevicePresenceNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XinputDevicePropertyNotify(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "xkb")]
@@ -8746,18 +8807,26 @@ impl Event {
             }
             #[cfg(feature = "xprint")]
             Some((xprint::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    xprint::ATTRIBUT_NOTIFY_EVENT => Ok(Self::XprintAttributNotify(TryParse::try_parse(event)?.0)),
-                    xprint::NOTIFY_EVENT => Ok(Self::XprintNotify(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of xprint, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::XprintNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XprintAttributNotify(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             #[cfg(feature = "xv")]
             Some((xv::X11_EXTENSION_NAME, ext_info)) => {
-                match event_code - ext_info.first_event {
-                    xv::PORT_NOTIFY_EVENT => Ok(Self::XvPortNotify(TryParse::try_parse(event)?.0)),
-                    xv::VIDEO_NOTIFY_EVENT => Ok(Self::XvVideoNotify(TryParse::try_parse(event)?.0)),
-                    _ => Ok(Self::Unknown(event.to_vec())),
+                // Indexed by the event codes of xv, which are dense and start at zero
+                const PARSERS: [EventParser; 2] = [
+                    |event| Ok(Event::XvVideoNotify(TryParse::try_parse(event)?.0)),
+                    |event| Ok(Event::XvPortNotify(TryParse::try_parse(event)?.0)),
+                ];
+                match PARSERS.get(usize::from(event_code - ext_info.first_event)) {
+                    Some(parse) => parse(event),
+                    None => Ok(Self::Unknown(event.to_vec())),
                 }
             }
             _ => Ok(Self::Unknown(event.to_vec())),
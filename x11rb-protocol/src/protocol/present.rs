@@ -65,30 +65,7 @@ impl From<EventEnum> for core::option::Option<u8> {
         Some(input.0)
     }
 }
-impl From<EventEnum> for u16 {
-    #[inline]
-    fn from(input: EventEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<EventEnum> for core::option::Option<u16> {
-    #[inline]
-    fn from(input: EventEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<EventEnum> for u32 {
-    #[inline]
-    fn from(input: EventEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<EventEnum> for core::option::Option<u32> {
-    #[inline]
-    fn from(input: EventEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(EventEnum, u16, u32);
 impl From<u8> for EventEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -184,30 +161,7 @@ impl From<Option> for core::option::Option<u8> {
         Some(input.0)
     }
 }
-impl From<Option> for u16 {
-    #[inline]
-    fn from(input: Option) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Option> for core::option::Option<u16> {
-    #[inline]
-    fn from(input: Option) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Option> for u32 {
-    #[inline]
-    fn from(input: Option) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Option> for core::option::Option<u32> {
-    #[inline]
-    fn from(input: Option) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Option, u16, u32);
 impl From<u8> for Option {
     #[inline]
     fn from(value: u8) -> Self {
@@ -252,30 +206,7 @@ impl From<Capability> for core::option::Option<u8> {
         Some(input.0)
     }
 }
-impl From<Capability> for u16 {
-    #[inline]
-    fn from(input: Capability) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Capability> for core::option::Option<u16> {
-    #[inline]
-    fn from(input: Capability) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Capability> for u32 {
-    #[inline]
-    fn from(input: Capability) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Capability> for core::option::Option<u32> {
-    #[inline]
-    fn from(input: Capability) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Capability, u16, u32);
 impl From<u8> for Capability {
     #[inline]
     fn from(value: u8) -> Self {
@@ -316,30 +247,7 @@ impl From<CompleteKind> for core::option::Option<u8> {
         Some(input.0)
     }
 }
-impl From<CompleteKind> for u16 {
-    #[inline]
-    fn from(input: CompleteKind) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CompleteKind> for core::option::Option<u16> {
-    #[inline]
-    fn from(input: CompleteKind) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CompleteKind> for u32 {
-    #[inline]
-    fn from(input: CompleteKind) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CompleteKind> for core::option::Option<u32> {
-    #[inline]
-    fn from(input: CompleteKind) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CompleteKind, u16, u32);
 impl From<u8> for CompleteKind {
     #[inline]
     fn from(value: u8) -> Self {
@@ -377,30 +285,7 @@ impl From<CompleteMode> for core::option::Option<u8> {
         Some(input.0)
     }
 }
-impl From<CompleteMode> for u16 {
-    #[inline]
-    fn from(input: CompleteMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CompleteMode> for core::option::Option<u16> {
-    #[inline]
-    fn from(input: CompleteMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CompleteMode> for u32 {
-    #[inline]
-    fn from(input: CompleteMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CompleteMode> for core::option::Option<u32> {
-    #[inline]
-    fn from(input: CompleteMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CompleteMode, u16, u32);
 impl From<u8> for CompleteMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -429,8 +314,9 @@ pub struct Notify {
 impl_debug_if_no_extra_traits!(Notify, "Notify");
 impl TryParse for Notify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (serial, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let serial = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Notify { window, serial };
         Ok((result, remaining))
     }
@@ -1345,13 +1231,13 @@ impl_debug_if_no_extra_traits!(GenericEvent, "GenericEvent");
 impl TryParse for GenericEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (evtype, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (event, remaining) = Event::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let evtype = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let event = Event::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let result = GenericEvent { response_type, extension, sequence, length, evtype, event };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -1476,23 +1362,23 @@ impl_debug_if_no_extra_traits!(ConfigureNotifyEvent, "ConfigureNotifyEvent");
 impl TryParse for ConfigureNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (event, remaining) = Event::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (off_x, remaining) = i16::try_parse(remaining)?;
-        let (off_y, remaining) = i16::try_parse(remaining)?;
-        let (pixmap_width, remaining) = u16::try_parse(remaining)?;
-        let (pixmap_height, remaining) = u16::try_parse(remaining)?;
-        let (pixmap_flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let event = Event::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let width = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let height = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let off_x = i16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let off_y = i16::from_ne_bytes([fixed_bytes[30], fixed_bytes[31]]);
+        let pixmap_width = u16::from_ne_bytes([fixed_bytes[32], fixed_bytes[33]]);
+        let pixmap_height = u16::from_ne_bytes([fixed_bytes[34], fixed_bytes[35]]);
+        let pixmap_flags = u32::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
         let result = ConfigureNotifyEvent { response_type, extension, sequence, length, event_type, event, window, x, y, width, height, off_x, off_y, pixmap_width, pixmap_height, pixmap_flags };
         let _ = remaining;
         let remaining = initial_value.get(32 + length as usize * 4..)
@@ -1607,18 +1493,19 @@ impl_debug_if_no_extra_traits!(CompleteNotifyEvent, "CompleteNotifyEvent");
 impl TryParse for CompleteNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (kind, remaining) = u8::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (event, remaining) = Event::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (serial, remaining) = u32::try_parse(remaining)?;
-        let (ust, remaining) = u64::try_parse(remaining)?;
-        let (msc, remaining) = u64::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let kind = fixed_bytes[10];
+        let mode = fixed_bytes[11];
+        let event = Event::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let serial = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let ust = u64::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27], fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let msc = u64::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35], fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
         let kind = kind.into();
         let mode = mode.into();
         let result = CompleteNotifyEvent { response_type, extension, sequence, length, event_type, kind, mode, event, window, serial, ust, msc };
@@ -1724,17 +1611,17 @@ impl_debug_if_no_extra_traits!(IdleNotifyEvent, "IdleNotifyEvent");
 impl TryParse for IdleNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (event, remaining) = Event::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (serial, remaining) = u32::try_parse(remaining)?;
-        let (pixmap, remaining) = xproto::Pixmap::try_parse(remaining)?;
-        let (idle_fence, remaining) = sync::Fence::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let event = Event::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let serial = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let pixmap = xproto::Pixmap::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let idle_fence = sync::Fence::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
         let result = IdleNotifyEvent { response_type, extension, sequence, length, event_type, event, window, serial, pixmap, idle_fence };
         let _ = remaining;
         let remaining = initial_value.get(32 + length as usize * 4..)
@@ -1842,20 +1729,20 @@ impl_debug_if_no_extra_traits!(RedirectNotifyEvent, "RedirectNotifyEvent");
 impl TryParse for RedirectNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (update_window, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (event, remaining) = Event::try_parse(remaining)?;
-        let (event_window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (pixmap, remaining) = xproto::Pixmap::try_parse(remaining)?;
-        let (serial, remaining) = u32::try_parse(remaining)?;
-        let (valid_region, remaining) = xfixes::Region::try_parse(remaining)?;
-        let (update_region, remaining) = xfixes::Region::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let update_window = fixed_bytes[10] != 0;
+        let event = Event::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let event_window = xproto::Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let pixmap = xproto::Pixmap::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let serial = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let valid_region = xfixes::Region::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let update_region = xfixes::Region::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
         let (valid_rect, remaining) = xproto::Rectangle::try_parse(remaining)?;
         let (update_rect, remaining) = xproto::Rectangle::try_parse(remaining)?;
         let (x_off, remaining) = i16::try_parse(remaining)?;
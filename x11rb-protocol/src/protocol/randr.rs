@@ -83,18 +83,7 @@ impl From<Rotation> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<Rotation> for u32 {
-    #[inline]
-    fn from(input: Rotation) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Rotation> for Option<u32> {
-    #[inline]
-    fn from(input: Rotation) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Rotation, u32);
 impl From<u8> for Rotation {
     #[inline]
     fn from(value: u8) -> Self {
@@ -134,10 +123,11 @@ pub struct ScreenSize {
 impl_debug_if_no_extra_traits!(ScreenSize, "ScreenSize");
 impl TryParse for ScreenSize {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (mwidth, remaining) = u16::try_parse(remaining)?;
-        let (mheight, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let width = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let height = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let mwidth = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let mheight = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = ScreenSize { width, height, mwidth, mheight };
         Ok((result, remaining))
     }
@@ -385,30 +375,7 @@ impl From<SetConfig> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SetConfig> for u16 {
-    #[inline]
-    fn from(input: SetConfig) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SetConfig> for Option<u16> {
-    #[inline]
-    fn from(input: SetConfig) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SetConfig> for u32 {
-    #[inline]
-    fn from(input: SetConfig) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SetConfig> for Option<u32> {
-    #[inline]
-    fn from(input: SetConfig) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SetConfig, u16, u32);
 impl From<u8> for SetConfig {
     #[inline]
     fn from(value: u8) -> Self {
@@ -645,18 +612,7 @@ impl From<NotifyMask> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<NotifyMask> for u32 {
-    #[inline]
-    fn from(input: NotifyMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<NotifyMask> for Option<u32> {
-    #[inline]
-    fn from(input: NotifyMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(NotifyMask, u32);
 impl From<u8> for NotifyMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1230,19 +1186,20 @@ pub struct ModeInfo {
 impl_debug_if_no_extra_traits!(ModeInfo, "ModeInfo");
 impl TryParse for ModeInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (id, remaining) = u32::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (dot_clock, remaining) = u32::try_parse(remaining)?;
-        let (hsync_start, remaining) = u16::try_parse(remaining)?;
-        let (hsync_end, remaining) = u16::try_parse(remaining)?;
-        let (htotal, remaining) = u16::try_parse(remaining)?;
-        let (hskew, remaining) = u16::try_parse(remaining)?;
-        let (vsync_start, remaining) = u16::try_parse(remaining)?;
-        let (vsync_end, remaining) = u16::try_parse(remaining)?;
-        let (vtotal, remaining) = u16::try_parse(remaining)?;
-        let (name_len, remaining) = u16::try_parse(remaining)?;
-        let (mode_flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let id = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let width = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let height = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let dot_clock = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let hsync_start = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let hsync_end = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let htotal = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let hskew = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let vsync_start = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let vsync_end = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let vtotal = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let name_len = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let mode_flags = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
         let mode_flags = mode_flags.into();
         let result = ModeInfo { id, width, height, dot_clock, hsync_start, hsync_end, htotal, hskew, vsync_start, vsync_end, vtotal, name_len, mode_flags };
         Ok((result, remaining))
@@ -1523,30 +1480,7 @@ impl From<Connection> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Connection> for u16 {
-    #[inline]
-    fn from(input: Connection) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Connection> for Option<u16> {
-    #[inline]
-    fn from(input: Connection) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Connection> for u32 {
-    #[inline]
-    fn from(input: Connection) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Connection> for Option<u32> {
-    #[inline]
-    fn from(input: Connection) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Connection, u16, u32);
 impl From<u8> for Connection {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3803,30 +3737,7 @@ impl From<Transform> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Transform> for u16 {
-    #[inline]
-    fn from(input: Transform) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Transform> for Option<u16> {
-    #[inline]
-    fn from(input: Transform) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Transform> for u32 {
-    #[inline]
-    fn from(input: Transform) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Transform> for Option<u32> {
-    #[inline]
-    fn from(input: Transform) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Transform, u16, u32);
 impl From<u8> for Transform {
     #[inline]
     fn from(value: u8) -> Self {
@@ -6000,19 +5911,20 @@ impl_debug_if_no_extra_traits!(ScreenChangeNotifyEvent, "ScreenChangeNotifyEvent
 impl TryParse for ScreenChangeNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (rotation, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (config_timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (request_window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (size_id, remaining) = u16::try_parse(remaining)?;
-        let (subpixel_order, remaining) = u16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (mwidth, remaining) = u16::try_parse(remaining)?;
-        let (mheight, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let rotation = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let config_timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let request_window = xproto::Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let size_id = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let subpixel_order = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let width = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let height = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let mwidth = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let mheight = u16::from_ne_bytes([fixed_bytes[30], fixed_bytes[31]]);
         let rotation = rotation.into();
         let subpixel_order = subpixel_order.into();
         let result = ScreenChangeNotifyEvent { response_type, rotation, sequence, timestamp, config_timestamp, root, request_window, size_id, subpixel_order, width, height, mwidth, mheight };
@@ -6171,30 +6083,7 @@ impl From<Notify> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Notify> for u16 {
-    #[inline]
-    fn from(input: Notify) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Notify> for Option<u16> {
-    #[inline]
-    fn from(input: Notify) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Notify> for u32 {
-    #[inline]
-    fn from(input: Notify) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Notify> for Option<u32> {
-    #[inline]
-    fn from(input: Notify) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Notify, u16, u32);
 impl From<u8> for Notify {
     #[inline]
     fn from(value: u8) -> Self {
@@ -6233,16 +6122,16 @@ pub struct CrtcChange {
 impl_debug_if_no_extra_traits!(CrtcChange, "CrtcChange");
 impl TryParse for CrtcChange {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (crtc, remaining) = Crtc::try_parse(remaining)?;
-        let (mode, remaining) = Mode::try_parse(remaining)?;
-        let (rotation, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let crtc = Crtc::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let mode = Mode::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let rotation = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let width = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let height = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
         let rotation = rotation.into();
         let result = CrtcChange { timestamp, window, crtc, mode, rotation, x, y, width, height };
         Ok((result, remaining))
@@ -6323,15 +6212,16 @@ pub struct OutputChange {
 impl_debug_if_no_extra_traits!(OutputChange, "OutputChange");
 impl TryParse for OutputChange {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (config_timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (output, remaining) = Output::try_parse(remaining)?;
-        let (crtc, remaining) = Crtc::try_parse(remaining)?;
-        let (mode, remaining) = Mode::try_parse(remaining)?;
-        let (rotation, remaining) = u16::try_parse(remaining)?;
-        let (connection, remaining) = u8::try_parse(remaining)?;
-        let (subpixel_order, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let config_timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let output = Output::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let crtc = Crtc::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let mode = Mode::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let rotation = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let connection = fixed_bytes[26];
+        let subpixel_order = fixed_bytes[27];
         let rotation = rotation.into();
         let connection = connection.into();
         let subpixel_order = subpixel_order.into();
@@ -6409,12 +6299,12 @@ pub struct OutputProperty {
 impl_debug_if_no_extra_traits!(OutputProperty, "OutputProperty");
 impl TryParse for OutputProperty {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (output, remaining) = Output::try_parse(remaining)?;
-        let (atom, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(11..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let output = Output::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let atom = xproto::Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let status = fixed_bytes[16];
         let status = status.into();
         let result = OutputProperty { window, output, atom, timestamp, status };
         Ok((result, remaining))
@@ -6481,10 +6371,10 @@ pub struct ProviderChange {
 impl_debug_if_no_extra_traits!(ProviderChange, "ProviderChange");
 impl TryParse for ProviderChange {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (provider, remaining) = Provider::try_parse(remaining)?;
-        let remaining = remaining.get(16..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let provider = Provider::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = ProviderChange { timestamp, window, provider };
         Ok((result, remaining))
     }
@@ -6548,12 +6438,12 @@ pub struct ProviderProperty {
 impl_debug_if_no_extra_traits!(ProviderProperty, "ProviderProperty");
 impl TryParse for ProviderProperty {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (provider, remaining) = Provider::try_parse(remaining)?;
-        let (atom, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (state, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(11..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let provider = Provider::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let atom = xproto::Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let state = fixed_bytes[16];
         let result = ProviderProperty { window, provider, atom, timestamp, state };
         Ok((result, remaining))
     }
@@ -6618,9 +6508,9 @@ pub struct ResourceChange {
 impl_debug_if_no_extra_traits!(ResourceChange, "ResourceChange");
 impl TryParse for ResourceChange {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let remaining = remaining.get(20..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = ResourceChange { timestamp, window };
         Ok((result, remaining))
     }
@@ -6687,16 +6577,17 @@ pub struct MonitorInfo {
 impl_debug_if_no_extra_traits!(MonitorInfo, "MonitorInfo");
 impl TryParse for MonitorInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (primary, remaining) = bool::try_parse(remaining)?;
-        let (automatic, remaining) = bool::try_parse(remaining)?;
-        let (n_output, remaining) = u16::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (width_in_millimeters, remaining) = u32::try_parse(remaining)?;
-        let (height_in_millimeters, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let primary = fixed_bytes[4] != 0;
+        let automatic = fixed_bytes[5] != 0;
+        let n_output = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let x = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let y = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let width = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let height = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let width_in_millimeters = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let height_in_millimeters = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
         let (outputs, remaining) = crate::x11_utils::parse_list::<Output>(remaining, n_output.try_to_usize()?)?;
         let result = MonitorInfo { name, primary, automatic, x, y, width, height, width_in_millimeters, height_in_millimeters, outputs };
         Ok((result, remaining))
@@ -7257,11 +7148,11 @@ pub struct LeaseNotify {
 impl_debug_if_no_extra_traits!(LeaseNotify, "LeaseNotify");
 impl TryParse for LeaseNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (lease, remaining) = Lease::try_parse(remaining)?;
-        let (created, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(15..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let lease = Lease::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let created = fixed_bytes[12];
         let result = LeaseNotify { timestamp, window, lease, created };
         Ok((result, remaining))
     }
@@ -7452,9 +7343,10 @@ impl_debug_if_no_extra_traits!(NotifyEvent, "NotifyEvent");
 impl TryParse for NotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (sub_code, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sub_code = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (u, remaining) = NotifyData::try_parse(remaining)?;
         let sub_code = sub_code.into();
         let result = NotifyEvent { response_type, sub_code, sequence, u };
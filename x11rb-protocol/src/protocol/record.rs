@@ -46,8 +46,9 @@ pub struct Range8 {
 impl_debug_if_no_extra_traits!(Range8, "Range8");
 impl TryParse for Range8 {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (first, remaining) = u8::try_parse(remaining)?;
-        let (last, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let first = fixed_bytes[0];
+        let last = fixed_bytes[1];
         let result = Range8 { first, last };
         Ok((result, remaining))
     }
@@ -79,8 +80,9 @@ pub struct Range16 {
 impl_debug_if_no_extra_traits!(Range16, "Range16");
 impl TryParse for Range16 {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (first, remaining) = u16::try_parse(remaining)?;
-        let (last, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let first = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let last = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let result = Range16 { first, last };
         Ok((result, remaining))
     }
@@ -246,30 +248,7 @@ impl From<HType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<HType> for u16 {
-    #[inline]
-    fn from(input: HType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<HType> for Option<u16> {
-    #[inline]
-    fn from(input: HType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<HType> for u32 {
-    #[inline]
-    fn from(input: HType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<HType> for Option<u32> {
-    #[inline]
-    fn from(input: HType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(HType, u16, u32);
 impl From<u8> for HType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -310,30 +289,7 @@ impl From<CS> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<CS> for u16 {
-    #[inline]
-    fn from(input: CS) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CS> for Option<u16> {
-    #[inline]
-    fn from(input: CS) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CS> for u32 {
-    #[inline]
-    fn from(input: CS) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CS> for Option<u32> {
-    #[inline]
-    fn from(input: CS) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CS, u16, u32);
 impl From<u8> for CS {
     #[inline]
     fn from(value: u8) -> Self {
@@ -361,8 +317,9 @@ pub struct ClientInfo {
 impl_debug_if_no_extra_traits!(ClientInfo, "ClientInfo");
 impl TryParse for ClientInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (client_resource, remaining) = ClientSpec::try_parse(remaining)?;
-        let (num_ranges, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let client_resource = ClientSpec::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let num_ranges = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (ranges, remaining) = crate::x11_utils::parse_list::<Range>(remaining, num_ranges.try_to_usize()?)?;
         let result = ClientInfo { client_resource, ranges };
         Ok((result, remaining))
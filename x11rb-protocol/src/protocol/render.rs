@@ -55,30 +55,7 @@ impl From<PictType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PictType> for u16 {
-    #[inline]
-    fn from(input: PictType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PictType> for Option<u16> {
-    #[inline]
-    fn from(input: PictType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PictType> for u32 {
-    #[inline]
-    fn from(input: PictType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PictType> for Option<u32> {
-    #[inline]
-    fn from(input: PictType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PictType, u16, u32);
 impl From<u8> for PictType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -113,30 +90,7 @@ impl From<PictureEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PictureEnum> for u16 {
-    #[inline]
-    fn from(input: PictureEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PictureEnum> for Option<u16> {
-    #[inline]
-    fn from(input: PictureEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PictureEnum> for u32 {
-    #[inline]
-    fn from(input: PictureEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PictureEnum> for Option<u32> {
-    #[inline]
-    fn from(input: PictureEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PictureEnum, u16, u32);
 impl From<u8> for PictureEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -222,30 +176,7 @@ impl From<PictOp> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PictOp> for u16 {
-    #[inline]
-    fn from(input: PictOp) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PictOp> for Option<u16> {
-    #[inline]
-    fn from(input: PictOp) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PictOp> for u32 {
-    #[inline]
-    fn from(input: PictOp) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PictOp> for Option<u32> {
-    #[inline]
-    fn from(input: PictOp) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PictOp, u16, u32);
 impl From<u8> for PictOp {
     #[inline]
     fn from(value: u8) -> Self {
@@ -624,14 +555,15 @@ pub struct Directformat {
 impl_debug_if_no_extra_traits!(Directformat, "Directformat");
 impl TryParse for Directformat {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (red_shift, remaining) = u16::try_parse(remaining)?;
-        let (red_mask, remaining) = u16::try_parse(remaining)?;
-        let (green_shift, remaining) = u16::try_parse(remaining)?;
-        let (green_mask, remaining) = u16::try_parse(remaining)?;
-        let (blue_shift, remaining) = u16::try_parse(remaining)?;
-        let (blue_mask, remaining) = u16::try_parse(remaining)?;
-        let (alpha_shift, remaining) = u16::try_parse(remaining)?;
-        let (alpha_mask, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let red_shift = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let red_mask = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let green_shift = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let green_mask = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let blue_shift = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let blue_mask = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let alpha_shift = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let alpha_mask = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
         let result = Directformat { red_shift, red_mask, green_shift, green_mask, blue_shift, blue_mask, alpha_shift, alpha_mask };
         Ok((result, remaining))
     }
@@ -692,10 +624,10 @@ pub struct Pictforminfo {
 impl_debug_if_no_extra_traits!(Pictforminfo, "Pictforminfo");
 impl TryParse for Pictforminfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (id, remaining) = Pictformat::try_parse(remaining)?;
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (depth, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let id = Pictformat::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let type_ = fixed_bytes[4];
+        let depth = fixed_bytes[5];
         let (direct, remaining) = Directformat::try_parse(remaining)?;
         let (colormap, remaining) = xproto::Colormap::try_parse(remaining)?;
         let type_ = type_.into();
@@ -763,8 +695,9 @@ pub struct Pictvisual {
 impl_debug_if_no_extra_traits!(Pictvisual, "Pictvisual");
 impl TryParse for Pictvisual {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (visual, remaining) = xproto::Visualid::try_parse(remaining)?;
-        let (format, remaining) = Pictformat::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let visual = xproto::Visualid::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let format = Pictformat::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Pictvisual { visual, format };
         Ok((result, remaining))
     }
@@ -802,10 +735,9 @@ pub struct Pictdepth {
 impl_debug_if_no_extra_traits!(Pictdepth, "Pictdepth");
 impl TryParse for Pictdepth {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (depth, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (num_visuals, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let depth = fixed_bytes[0];
+        let num_visuals = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (visuals, remaining) = crate::x11_utils::parse_list::<Pictvisual>(remaining, num_visuals.try_to_usize()?)?;
         let result = Pictdepth { depth, visuals };
         Ok((result, remaining))
@@ -854,8 +786,9 @@ pub struct Pictscreen {
 impl_debug_if_no_extra_traits!(Pictscreen, "Pictscreen");
 impl TryParse for Pictscreen {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (num_depths, remaining) = u32::try_parse(remaining)?;
-        let (fallback, remaining) = Pictformat::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let num_depths = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let fallback = Pictformat::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (depths, remaining) = crate::x11_utils::parse_list::<Pictdepth>(remaining, num_depths.try_to_usize()?)?;
         let result = Pictscreen { fallback, depths };
         Ok((result, remaining))
@@ -905,11 +838,12 @@ pub struct Indexvalue {
 impl_debug_if_no_extra_traits!(Indexvalue, "Indexvalue");
 impl TryParse for Indexvalue {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (pixel, remaining) = u32::try_parse(remaining)?;
-        let (red, remaining) = u16::try_parse(remaining)?;
-        let (green, remaining) = u16::try_parse(remaining)?;
-        let (blue, remaining) = u16::try_parse(remaining)?;
-        let (alpha, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let pixel = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let red = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let green = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let blue = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let alpha = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let result = Indexvalue { pixel, red, green, blue, alpha };
         Ok((result, remaining))
     }
@@ -959,10 +893,11 @@ pub struct Color {
 impl_debug_if_no_extra_traits!(Color, "Color");
 impl TryParse for Color {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (red, remaining) = u16::try_parse(remaining)?;
-        let (green, remaining) = u16::try_parse(remaining)?;
-        let (blue, remaining) = u16::try_parse(remaining)?;
-        let (alpha, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let red = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let green = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let blue = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let alpha = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = Color { red, green, blue, alpha };
         Ok((result, remaining))
     }
@@ -1004,8 +939,9 @@ pub struct Pointfix {
 impl_debug_if_no_extra_traits!(Pointfix, "Pointfix");
 impl TryParse for Pointfix {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x, remaining) = Fixed::try_parse(remaining)?;
-        let (y, remaining) = Fixed::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let x = Fixed::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let y = Fixed::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Pointfix { x, y };
         Ok((result, remaining))
     }
@@ -1151,8 +1087,9 @@ pub struct Trapezoid {
 impl_debug_if_no_extra_traits!(Trapezoid, "Trapezoid");
 impl TryParse for Trapezoid {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (top, remaining) = Fixed::try_parse(remaining)?;
-        let (bottom, remaining) = Fixed::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let top = Fixed::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let bottom = Fixed::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (left, remaining) = Linefix::try_parse(remaining)?;
         let (right, remaining) = Linefix::try_parse(remaining)?;
         let result = Trapezoid { top, bottom, left, right };
@@ -1232,12 +1169,13 @@ pub struct Glyphinfo {
 impl_debug_if_no_extra_traits!(Glyphinfo, "Glyphinfo");
 impl TryParse for Glyphinfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (x_off, remaining) = i16::try_parse(remaining)?;
-        let (y_off, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let width = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let height = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let x = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let y = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let x_off = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let y_off = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let result = Glyphinfo { width, height, x, y, x_off, y_off };
         Ok((result, remaining))
     }
@@ -4187,15 +4125,16 @@ pub struct Transform {
 impl_debug_if_no_extra_traits!(Transform, "Transform");
 impl TryParse for Transform {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (matrix11, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix12, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix13, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix21, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix22, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix23, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix31, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix32, remaining) = Fixed::try_parse(remaining)?;
-        let (matrix33, remaining) = Fixed::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<36>(remaining)?;
+        let matrix11 = Fixed::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let matrix12 = Fixed::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let matrix13 = Fixed::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let matrix21 = Fixed::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let matrix22 = Fixed::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let matrix23 = Fixed::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let matrix31 = Fixed::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let matrix32 = Fixed::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let matrix33 = Fixed::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
         let result = Transform { matrix11, matrix12, matrix13, matrix21, matrix22, matrix23, matrix31, matrix32, matrix33 };
         Ok((result, remaining))
     }
@@ -4608,8 +4547,9 @@ pub struct Animcursorelt {
 impl_debug_if_no_extra_traits!(Animcursorelt, "Animcursorelt");
 impl TryParse for Animcursorelt {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (cursor, remaining) = xproto::Cursor::try_parse(remaining)?;
-        let (delay, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let cursor = xproto::Cursor::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let delay = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Animcursorelt { cursor, delay };
         Ok((result, remaining))
     }
@@ -4725,9 +4665,10 @@ pub struct Spanfix {
 impl_debug_if_no_extra_traits!(Spanfix, "Spanfix");
 impl TryParse for Spanfix {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (l, remaining) = Fixed::try_parse(remaining)?;
-        let (r, remaining) = Fixed::try_parse(remaining)?;
-        let (y, remaining) = Fixed::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let l = Fixed::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let r = Fixed::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let y = Fixed::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = Spanfix { l, r, y };
         Ok((result, remaining))
     }
@@ -46,8 +46,9 @@ pub struct Client {
 impl_debug_if_no_extra_traits!(Client, "Client");
 impl TryParse for Client {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (resource_base, remaining) = u32::try_parse(remaining)?;
-        let (resource_mask, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let resource_base = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let resource_mask = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Client { resource_base, resource_mask };
         Ok((result, remaining))
     }
@@ -85,8 +86,9 @@ pub struct Type {
 impl_debug_if_no_extra_traits!(Type, "Type");
 impl TryParse for Type {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (resource_type, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (count, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let resource_type = xproto::Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let count = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Type { resource_type, count };
         Ok((result, remaining))
     }
@@ -172,8 +174,9 @@ pub struct ClientIdSpec {
 impl_debug_if_no_extra_traits!(ClientIdSpec, "ClientIdSpec");
 impl TryParse for ClientIdSpec {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (client, remaining) = u32::try_parse(remaining)?;
-        let (mask, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let client = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let mask = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let mask = mask.into();
         let result = ClientIdSpec { client, mask };
         Ok((result, remaining))
@@ -261,8 +264,9 @@ pub struct ResourceIdSpec {
 impl_debug_if_no_extra_traits!(ResourceIdSpec, "ResourceIdSpec");
 impl TryParse for ResourceIdSpec {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (resource, remaining) = u32::try_parse(remaining)?;
-        let (type_, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let resource = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let type_ = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = ResourceIdSpec { resource, type_ };
         Ok((result, remaining))
     }
@@ -56,30 +56,7 @@ impl From<Kind> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Kind> for u16 {
-    #[inline]
-    fn from(input: Kind) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Kind> for Option<u16> {
-    #[inline]
-    fn from(input: Kind) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Kind> for u32 {
-    #[inline]
-    fn from(input: Kind) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Kind> for Option<u32> {
-    #[inline]
-    fn from(input: Kind) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Kind, u16, u32);
 impl From<u8> for Kind {
     #[inline]
     fn from(value: u8) -> Self {
@@ -166,30 +143,7 @@ impl From<State> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<State> for u16 {
-    #[inline]
-    fn from(input: State) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<State> for Option<u16> {
-    #[inline]
-    fn from(input: State) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<State> for u32 {
-    #[inline]
-    fn from(input: State) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<State> for Option<u32> {
-    #[inline]
-    fn from(input: State) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(State, u16, u32);
 impl From<u8> for State {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1204,15 +1158,15 @@ impl_debug_if_no_extra_traits!(NotifyEvent, "NotifyEvent");
 impl TryParse for NotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (state, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (kind, remaining) = u8::try_parse(remaining)?;
-        let (forced, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(14..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let state = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let kind = fixed_bytes[16];
+        let forced = fixed_bytes[17] != 0;
         let state = state.into();
         let kind = kind.into();
         let result = NotifyEvent { response_type, state, sequence, time, root, window, kind, forced };
@@ -62,30 +62,7 @@ impl From<SO> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SO> for u16 {
-    #[inline]
-    fn from(input: SO) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SO> for Option<u16> {
-    #[inline]
-    fn from(input: SO) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SO> for u32 {
-    #[inline]
-    fn from(input: SO) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SO> for Option<u32> {
-    #[inline]
-    fn from(input: SO) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SO, u16, u32);
 impl From<u8> for SO {
     #[inline]
     fn from(value: u8) -> Self {
@@ -125,30 +102,7 @@ impl From<SK> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SK> for u16 {
-    #[inline]
-    fn from(input: SK) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SK> for Option<u16> {
-    #[inline]
-    fn from(input: SK) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SK> for u32 {
-    #[inline]
-    fn from(input: SK) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SK> for Option<u32> {
-    #[inline]
-    fn from(input: SK) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SK, u16, u32);
 impl From<u8> for SK {
     #[inline]
     fn from(value: u8) -> Self {
@@ -187,17 +141,17 @@ impl_debug_if_no_extra_traits!(NotifyEvent, "NotifyEvent");
 impl TryParse for NotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (shape_kind, remaining) = Kind::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (affected_window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (extents_x, remaining) = i16::try_parse(remaining)?;
-        let (extents_y, remaining) = i16::try_parse(remaining)?;
-        let (extents_width, remaining) = u16::try_parse(remaining)?;
-        let (extents_height, remaining) = u16::try_parse(remaining)?;
-        let (server_time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (shaped, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(11..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let shape_kind = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let affected_window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let extents_x = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let extents_y = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let extents_width = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let extents_height = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let server_time = xproto::Timestamp::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let shaped = fixed_bytes[20] != 0;
         let shape_kind = shape_kind.into();
         let result = NotifyEvent { response_type, shape_kind, sequence, affected_window, extents_x, extents_y, extents_width, extents_height, server_time, shaped };
         let _ = remaining;
@@ -69,15 +69,14 @@ impl_debug_if_no_extra_traits!(CompletionEvent, "CompletionEvent");
 impl TryParse for CompletionEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (drawable, remaining) = xproto::Drawable::try_parse(remaining)?;
-        let (minor_event, remaining) = u16::try_parse(remaining)?;
-        let (major_event, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (shmseg, remaining) = Seg::try_parse(remaining)?;
-        let (offset, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let drawable = xproto::Drawable::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let minor_event = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let major_event = fixed_bytes[10];
+        let shmseg = Seg::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let offset = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let result = CompletionEvent { response_type, sequence, drawable, minor_event, major_event, shmseg, offset };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -58,30 +58,7 @@ impl From<ALARMSTATE> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ALARMSTATE> for u16 {
-    #[inline]
-    fn from(input: ALARMSTATE) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ALARMSTATE> for Option<u16> {
-    #[inline]
-    fn from(input: ALARMSTATE) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ALARMSTATE> for u32 {
-    #[inline]
-    fn from(input: ALARMSTATE) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ALARMSTATE> for Option<u32> {
-    #[inline]
-    fn from(input: ALARMSTATE) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ALARMSTATE, u16, u32);
 impl From<u8> for ALARMSTATE {
     #[inline]
     fn from(value: u8) -> Self {
@@ -267,8 +244,9 @@ pub struct Int64 {
 impl_debug_if_no_extra_traits!(Int64, "Int64");
 impl TryParse for Int64 {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (hi, remaining) = i32::try_parse(remaining)?;
-        let (lo, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let hi = i32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let lo = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Int64 { hi, lo };
         Ok((result, remaining))
     }
@@ -366,8 +344,9 @@ pub struct Trigger {
 impl_debug_if_no_extra_traits!(Trigger, "Trigger");
 impl TryParse for Trigger {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (counter, remaining) = Counter::try_parse(remaining)?;
-        let (wait_type, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let counter = Counter::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let wait_type = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (wait_value, remaining) = Int64::try_parse(remaining)?;
         let (test_type, remaining) = u32::try_parse(remaining)?;
         let wait_type = wait_type.into();
@@ -2543,10 +2522,11 @@ impl_debug_if_no_extra_traits!(CounterNotifyEvent, "CounterNotifyEvent");
 impl TryParse for CounterNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (kind, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (counter, remaining) = Counter::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let kind = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let counter = Counter::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (wait_value, remaining) = Int64::try_parse(remaining)?;
         let (counter_value, remaining) = Int64::try_parse(remaining)?;
         let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
@@ -2693,10 +2673,11 @@ impl_debug_if_no_extra_traits!(AlarmNotifyEvent, "AlarmNotifyEvent");
 impl TryParse for AlarmNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (kind, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (alarm, remaining) = Alarm::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let kind = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let alarm = Alarm::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (counter_value, remaining) = Int64::try_parse(remaining)?;
         let (alarm_value, remaining) = Int64::try_parse(remaining)?;
         let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
@@ -46,10 +46,11 @@ pub struct DrmClipRect {
 impl_debug_if_no_extra_traits!(DrmClipRect, "DrmClipRect");
 impl TryParse for DrmClipRect {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x1, remaining) = i16::try_parse(remaining)?;
-        let (y1, remaining) = i16::try_parse(remaining)?;
-        let (x2, remaining) = i16::try_parse(remaining)?;
-        let (x3, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let x1 = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let y1 = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let x2 = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let x3 = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = DrmClipRect { x1, y1, x2, x3 };
         Ok((result, remaining))
     }
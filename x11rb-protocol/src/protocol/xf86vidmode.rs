@@ -222,20 +222,19 @@ pub struct ModeInfo {
 impl_debug_if_no_extra_traits!(ModeInfo, "ModeInfo");
 impl TryParse for ModeInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (dotclock, remaining) = Dotclock::try_parse(remaining)?;
-        let (hdisplay, remaining) = u16::try_parse(remaining)?;
-        let (hsyncstart, remaining) = u16::try_parse(remaining)?;
-        let (hsyncend, remaining) = u16::try_parse(remaining)?;
-        let (htotal, remaining) = u16::try_parse(remaining)?;
-        let (hskew, remaining) = u32::try_parse(remaining)?;
-        let (vdisplay, remaining) = u16::try_parse(remaining)?;
-        let (vsyncstart, remaining) = u16::try_parse(remaining)?;
-        let (vsyncend, remaining) = u16::try_parse(remaining)?;
-        let (vtotal, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(12..).ok_or(ParseError::InsufficientData)?;
-        let (privsize, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<48>(remaining)?;
+        let dotclock = Dotclock::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let hdisplay = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let hsyncstart = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let hsyncend = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let htotal = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let hskew = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let vdisplay = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let vsyncstart = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let vsyncend = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let vtotal = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let privsize = u32::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
         let flags = flags.into();
         let result = ModeInfo { dotclock, hdisplay, hsyncstart, hsyncend, htotal, hskew, vdisplay, vsyncstart, vsyncend, vtotal, flags, privsize };
         Ok((result, remaining))
@@ -210,30 +210,7 @@ impl From<SaveSetMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SaveSetMode> for u16 {
-    #[inline]
-    fn from(input: SaveSetMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SaveSetMode> for Option<u16> {
-    #[inline]
-    fn from(input: SaveSetMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SaveSetMode> for u32 {
-    #[inline]
-    fn from(input: SaveSetMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SaveSetMode> for Option<u32> {
-    #[inline]
-    fn from(input: SaveSetMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SaveSetMode, u16, u32);
 impl From<u8> for SaveSetMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -269,30 +246,7 @@ impl From<SaveSetTarget> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SaveSetTarget> for u16 {
-    #[inline]
-    fn from(input: SaveSetTarget) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SaveSetTarget> for Option<u16> {
-    #[inline]
-    fn from(input: SaveSetTarget) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SaveSetTarget> for u32 {
-    #[inline]
-    fn from(input: SaveSetTarget) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SaveSetTarget> for Option<u32> {
-    #[inline]
-    fn from(input: SaveSetTarget) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SaveSetTarget, u16, u32);
 impl From<u8> for SaveSetTarget {
     #[inline]
     fn from(value: u8) -> Self {
@@ -328,30 +282,7 @@ impl From<SaveSetMapping> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SaveSetMapping> for u16 {
-    #[inline]
-    fn from(input: SaveSetMapping) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SaveSetMapping> for Option<u16> {
-    #[inline]
-    fn from(input: SaveSetMapping) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SaveSetMapping> for u32 {
-    #[inline]
-    fn from(input: SaveSetMapping) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SaveSetMapping> for Option<u32> {
-    #[inline]
-    fn from(input: SaveSetMapping) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SaveSetMapping, u16, u32);
 impl From<u8> for SaveSetMapping {
     #[inline]
     fn from(value: u8) -> Self {
@@ -464,30 +395,7 @@ impl From<SelectionEvent> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SelectionEvent> for u16 {
-    #[inline]
-    fn from(input: SelectionEvent) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SelectionEvent> for Option<u16> {
-    #[inline]
-    fn from(input: SelectionEvent) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SelectionEvent> for u32 {
-    #[inline]
-    fn from(input: SelectionEvent) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SelectionEvent> for Option<u32> {
-    #[inline]
-    fn from(input: SelectionEvent) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SelectionEvent, u16, u32);
 impl From<u8> for SelectionEvent {
     #[inline]
     fn from(value: u8) -> Self {
@@ -574,15 +482,15 @@ impl_debug_if_no_extra_traits!(SelectionNotifyEvent, "SelectionNotifyEvent");
 impl TryParse for SelectionNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (subtype, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (owner, remaining) = xproto::Window::try_parse(remaining)?;
-        let (selection, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (selection_timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let remaining = remaining.get(8..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let subtype = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let owner = xproto::Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let selection = xproto::Atom::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let selection_timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
         let subtype = subtype.into();
         let result = SelectionNotifyEvent { response_type, subtype, sequence, window, owner, selection, timestamp, selection_timestamp };
         let _ = remaining;
@@ -793,30 +701,7 @@ impl From<CursorNotify> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<CursorNotify> for u16 {
-    #[inline]
-    fn from(input: CursorNotify) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CursorNotify> for Option<u16> {
-    #[inline]
-    fn from(input: CursorNotify) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CursorNotify> for u32 {
-    #[inline]
-    fn from(input: CursorNotify) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CursorNotify> for Option<u32> {
-    #[inline]
-    fn from(input: CursorNotify) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CursorNotify, u16, u32);
 impl From<u8> for CursorNotify {
     #[inline]
     fn from(value: u8) -> Self {
@@ -896,14 +781,14 @@ impl_debug_if_no_extra_traits!(CursorNotifyEvent, "CursorNotifyEvent");
 impl TryParse for CursorNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (subtype, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (cursor_serial, remaining) = u32::try_parse(remaining)?;
-        let (timestamp, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let remaining = remaining.get(12..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let subtype = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let cursor_serial = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let timestamp = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let subtype = subtype.into();
         let result = CursorNotifyEvent { response_type, subtype, sequence, window, cursor_serial, timestamp, name };
         let _ = remaining;
@@ -1225,30 +1110,7 @@ impl From<RegionEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<RegionEnum> for u16 {
-    #[inline]
-    fn from(input: RegionEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<RegionEnum> for Option<u16> {
-    #[inline]
-    fn from(input: RegionEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<RegionEnum> for u32 {
-    #[inline]
-    fn from(input: RegionEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<RegionEnum> for Option<u32> {
-    #[inline]
-    fn from(input: RegionEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(RegionEnum, u16, u32);
 impl From<u8> for RegionEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -48,10 +48,11 @@ pub struct ScreenInfo {
 impl_debug_if_no_extra_traits!(ScreenInfo, "ScreenInfo");
 impl TryParse for ScreenInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x_org, remaining) = i16::try_parse(remaining)?;
-        let (y_org, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let x_org = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let y_org = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let width = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let height = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = ScreenInfo { x_org, y_org, width, height };
         Ok((result, remaining))
     }
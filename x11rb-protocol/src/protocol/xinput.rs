@@ -56,8 +56,9 @@ pub struct Fp3232 {
 impl_debug_if_no_extra_traits!(Fp3232, "Fp3232");
 impl TryParse for Fp3232 {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (integral, remaining) = i32::try_parse(remaining)?;
-        let (frac, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let integral = i32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let frac = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Fp3232 { integral, frac };
         Ok((result, remaining))
     }
@@ -268,30 +269,7 @@ impl From<DeviceUse> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<DeviceUse> for u16 {
-    #[inline]
-    fn from(input: DeviceUse) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<DeviceUse> for Option<u16> {
-    #[inline]
-    fn from(input: DeviceUse) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<DeviceUse> for u32 {
-    #[inline]
-    fn from(input: DeviceUse) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DeviceUse> for Option<u32> {
-    #[inline]
-    fn from(input: DeviceUse) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DeviceUse, u16, u32);
 impl From<u8> for DeviceUse {
     #[inline]
     fn from(value: u8) -> Self {
@@ -335,30 +313,7 @@ impl From<InputClass> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<InputClass> for u16 {
-    #[inline]
-    fn from(input: InputClass) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<InputClass> for Option<u16> {
-    #[inline]
-    fn from(input: InputClass) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<InputClass> for u32 {
-    #[inline]
-    fn from(input: InputClass) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<InputClass> for Option<u32> {
-    #[inline]
-    fn from(input: InputClass) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(InputClass, u16, u32);
 impl From<u8> for InputClass {
     #[inline]
     fn from(value: u8) -> Self {
@@ -399,30 +354,7 @@ impl From<ValuatorMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ValuatorMode> for u16 {
-    #[inline]
-    fn from(input: ValuatorMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ValuatorMode> for Option<u16> {
-    #[inline]
-    fn from(input: ValuatorMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ValuatorMode> for u32 {
-    #[inline]
-    fn from(input: ValuatorMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ValuatorMode> for Option<u32> {
-    #[inline]
-    fn from(input: ValuatorMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ValuatorMode, u16, u32);
 impl From<u8> for ValuatorMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -451,11 +383,11 @@ pub struct DeviceInfo {
 impl_debug_if_no_extra_traits!(DeviceInfo, "DeviceInfo");
 impl TryParse for DeviceInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (device_type, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (num_class_info, remaining) = u8::try_parse(remaining)?;
-        let (device_use, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let device_type = xproto::Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let device_id = fixed_bytes[4];
+        let num_class_info = fixed_bytes[5];
+        let device_use = fixed_bytes[6];
         let device_use = device_use.into();
         let result = DeviceInfo { device_type, device_id, num_class_info, device_use };
         Ok((result, remaining))
@@ -502,12 +434,12 @@ pub struct KeyInfo {
 impl_debug_if_no_extra_traits!(KeyInfo, "KeyInfo");
 impl TryParse for KeyInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
-        let (min_keycode, remaining) = KeyCode::try_parse(remaining)?;
-        let (max_keycode, remaining) = KeyCode::try_parse(remaining)?;
-        let (num_keys, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
+        let min_keycode = fixed_bytes[2];
+        let max_keycode = fixed_bytes[3];
+        let num_keys = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
         let class_id = class_id.into();
         let result = KeyInfo { class_id, len, min_keycode, max_keycode, num_keys };
         Ok((result, remaining))
@@ -554,9 +486,10 @@ pub struct ButtonInfo {
 impl_debug_if_no_extra_traits!(ButtonInfo, "ButtonInfo");
 impl TryParse for ButtonInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
-        let (num_buttons, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
+        let num_buttons = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let class_id = class_id.into();
         let result = ButtonInfo { class_id, len, num_buttons };
         Ok((result, remaining))
@@ -594,9 +527,10 @@ pub struct AxisInfo {
 impl_debug_if_no_extra_traits!(AxisInfo, "AxisInfo");
 impl TryParse for AxisInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (resolution, remaining) = u32::try_parse(remaining)?;
-        let (minimum, remaining) = i32::try_parse(remaining)?;
-        let (maximum, remaining) = i32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let resolution = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let minimum = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let maximum = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = AxisInfo { resolution, minimum, maximum };
         Ok((result, remaining))
     }
@@ -643,11 +577,12 @@ pub struct ValuatorInfo {
 impl_debug_if_no_extra_traits!(ValuatorInfo, "ValuatorInfo");
 impl TryParse for ValuatorInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
-        let (axes_len, remaining) = u8::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (motion_size, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
+        let axes_len = fixed_bytes[2];
+        let mode = fixed_bytes[3];
+        let motion_size = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (axes, remaining) = crate::x11_utils::parse_list::<AxisInfo>(remaining, axes_len.try_to_usize()?)?;
         let class_id = class_id.into();
         let mode = mode.into();
@@ -700,10 +635,10 @@ pub struct InputInfoInfoKey {
 impl_debug_if_no_extra_traits!(InputInfoInfoKey, "InputInfoInfoKey");
 impl TryParse for InputInfoInfoKey {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (min_keycode, remaining) = KeyCode::try_parse(remaining)?;
-        let (max_keycode, remaining) = KeyCode::try_parse(remaining)?;
-        let (num_keys, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<6>(remaining)?;
+        let min_keycode = fixed_bytes[0];
+        let max_keycode = fixed_bytes[1];
+        let num_keys = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let result = InputInfoInfoKey { min_keycode, max_keycode, num_keys };
         Ok((result, remaining))
     }
@@ -770,9 +705,10 @@ pub struct InputInfoInfoValuator {
 impl_debug_if_no_extra_traits!(InputInfoInfoValuator, "InputInfoInfoValuator");
 impl TryParse for InputInfoInfoValuator {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (axes_len, remaining) = u8::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (motion_size, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<6>(remaining)?;
+        let axes_len = fixed_bytes[0];
+        let mode = fixed_bytes[1];
+        let motion_size = u32::from_ne_bytes([fixed_bytes[2], fixed_bytes[3], fixed_bytes[4], fixed_bytes[5]]);
         let (axes, remaining) = crate::x11_utils::parse_list::<AxisInfo>(remaining, axes_len.try_to_usize()?)?;
         let mode = mode.into();
         let result = InputInfoInfoValuator { mode, motion_size, axes };
@@ -916,8 +852,9 @@ pub struct InputInfo {
 impl_debug_if_no_extra_traits!(InputInfo, "InputInfo");
 impl TryParse for InputInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
         let (info, remaining) = InputInfoInfo::try_parse(remaining, u8::from(class_id))?;
         let result = InputInfo { len, info };
         Ok((result, remaining))
@@ -1125,8 +1062,9 @@ pub struct InputClassInfo {
 impl_debug_if_no_extra_traits!(InputClassInfo, "InputClassInfo");
 impl TryParse for InputClassInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (event_type_base, remaining) = EventTypeBase::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let event_type_base = fixed_bytes[1];
         let class_id = class_id.into();
         let result = InputClassInfo { class_id, event_type_base };
         Ok((result, remaining))
@@ -1723,30 +1661,7 @@ impl From<PropagateMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PropagateMode> for u16 {
-    #[inline]
-    fn from(input: PropagateMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PropagateMode> for Option<u16> {
-    #[inline]
-    fn from(input: PropagateMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PropagateMode> for u32 {
-    #[inline]
-    fn from(input: PropagateMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PropagateMode> for Option<u32> {
-    #[inline]
-    fn from(input: PropagateMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PropagateMode, u16, u32);
 impl From<u8> for PropagateMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2732,30 +2647,7 @@ impl From<ModifierDevice> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ModifierDevice> for u16 {
-    #[inline]
-    fn from(input: ModifierDevice) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ModifierDevice> for Option<u16> {
-    #[inline]
-    fn from(input: ModifierDevice) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ModifierDevice> for u32 {
-    #[inline]
-    fn from(input: ModifierDevice) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ModifierDevice> for Option<u32> {
-    #[inline]
-    fn from(input: ModifierDevice) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ModifierDevice, u16, u32);
 impl From<u8> for ModifierDevice {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3205,30 +3097,7 @@ impl From<DeviceInputMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<DeviceInputMode> for u16 {
-    #[inline]
-    fn from(input: DeviceInputMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<DeviceInputMode> for Option<u16> {
-    #[inline]
-    fn from(input: DeviceInputMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<DeviceInputMode> for u32 {
-    #[inline]
-    fn from(input: DeviceInputMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DeviceInputMode> for Option<u32> {
-    #[inline]
-    fn from(input: DeviceInputMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DeviceInputMode, u16, u32);
 impl From<u8> for DeviceInputMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3571,30 +3440,7 @@ impl From<FeedbackClass> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<FeedbackClass> for u16 {
-    #[inline]
-    fn from(input: FeedbackClass) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<FeedbackClass> for Option<u16> {
-    #[inline]
-    fn from(input: FeedbackClass) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<FeedbackClass> for u32 {
-    #[inline]
-    fn from(input: FeedbackClass) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<FeedbackClass> for Option<u32> {
-    #[inline]
-    fn from(input: FeedbackClass) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(FeedbackClass, u16, u32);
 impl From<u8> for FeedbackClass {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3634,17 +3480,17 @@ pub struct KbdFeedbackState {
 impl_debug_if_no_extra_traits!(KbdFeedbackState, "KbdFeedbackState");
 impl TryParse for KbdFeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (pitch, remaining) = u16::try_parse(remaining)?;
-        let (duration, remaining) = u16::try_parse(remaining)?;
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
-        let (global_auto_repeat, remaining) = bool::try_parse(remaining)?;
-        let (click, remaining) = u8::try_parse(remaining)?;
-        let (percent, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let pitch = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let duration = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let led_mask = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let global_auto_repeat = fixed_bytes[16] != 0;
+        let click = fixed_bytes[17];
+        let percent = fixed_bytes[18];
         let (auto_repeats, remaining) = crate::x11_utils::parse_u8_array::<32>(remaining)?;
         let class_id = class_id.into();
         let result = KbdFeedbackState { class_id, feedback_id, len, pitch, duration, led_mask, led_values, global_auto_repeat, click, percent, auto_repeats };
@@ -3750,13 +3596,13 @@ pub struct PtrFeedbackState {
 impl_debug_if_no_extra_traits!(PtrFeedbackState, "PtrFeedbackState");
 impl TryParse for PtrFeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (accel_num, remaining) = u16::try_parse(remaining)?;
-        let (accel_denom, remaining) = u16::try_parse(remaining)?;
-        let (threshold, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let accel_num = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let accel_denom = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let threshold = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let class_id = class_id.into();
         let result = PtrFeedbackState { class_id, feedback_id, len, accel_num, accel_denom, threshold };
         Ok((result, remaining))
@@ -3812,12 +3658,13 @@ pub struct IntegerFeedbackState {
 impl_debug_if_no_extra_traits!(IntegerFeedbackState, "IntegerFeedbackState");
 impl TryParse for IntegerFeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (resolution, remaining) = u32::try_parse(remaining)?;
-        let (min_value, remaining) = i32::try_parse(remaining)?;
-        let (max_value, remaining) = i32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let resolution = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let min_value = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let max_value = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let class_id = class_id.into();
         let result = IntegerFeedbackState { class_id, feedback_id, len, resolution, min_value, max_value };
         Ok((result, remaining))
@@ -3875,11 +3722,12 @@ pub struct StringFeedbackState {
 impl_debug_if_no_extra_traits!(StringFeedbackState, "StringFeedbackState");
 impl TryParse for StringFeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (max_symbols, remaining) = u16::try_parse(remaining)?;
-        let (num_keysyms, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let max_symbols = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_keysyms = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let (keysyms, remaining) = crate::x11_utils::parse_list::<xproto::Keysym>(remaining, num_keysyms.try_to_usize()?)?;
         let class_id = class_id.into();
         let result = StringFeedbackState { class_id, feedback_id, len, max_symbols, keysyms };
@@ -3934,13 +3782,13 @@ pub struct BellFeedbackState {
 impl_debug_if_no_extra_traits!(BellFeedbackState, "BellFeedbackState");
 impl TryParse for BellFeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (percent, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (pitch, remaining) = u16::try_parse(remaining)?;
-        let (duration, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let percent = fixed_bytes[4];
+        let pitch = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let duration = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let class_id = class_id.into();
         let result = BellFeedbackState { class_id, feedback_id, len, percent, pitch, duration };
         Ok((result, remaining))
@@ -3995,11 +3843,12 @@ pub struct LedFeedbackState {
 impl_debug_if_no_extra_traits!(LedFeedbackState, "LedFeedbackState");
 impl TryParse for LedFeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let led_mask = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let class_id = class_id.into();
         let result = LedFeedbackState { class_id, feedback_id, len, led_mask, led_values };
         Ok((result, remaining))
@@ -4054,14 +3903,14 @@ pub struct FeedbackStateDataKeyboard {
 impl_debug_if_no_extra_traits!(FeedbackStateDataKeyboard, "FeedbackStateDataKeyboard");
 impl TryParse for FeedbackStateDataKeyboard {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (pitch, remaining) = u16::try_parse(remaining)?;
-        let (duration, remaining) = u16::try_parse(remaining)?;
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
-        let (global_auto_repeat, remaining) = bool::try_parse(remaining)?;
-        let (click, remaining) = u8::try_parse(remaining)?;
-        let (percent, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let pitch = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let duration = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let led_mask = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let global_auto_repeat = fixed_bytes[12] != 0;
+        let click = fixed_bytes[13];
+        let percent = fixed_bytes[14];
         let (auto_repeats, remaining) = crate::x11_utils::parse_u8_array::<32>(remaining)?;
         let result = FeedbackStateDataKeyboard { pitch, duration, led_mask, led_values, global_auto_repeat, click, percent, auto_repeats };
         Ok((result, remaining))
@@ -4152,10 +4001,10 @@ pub struct FeedbackStateDataPointer {
 impl_debug_if_no_extra_traits!(FeedbackStateDataPointer, "FeedbackStateDataPointer");
 impl TryParse for FeedbackStateDataPointer {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (accel_num, remaining) = u16::try_parse(remaining)?;
-        let (accel_denom, remaining) = u16::try_parse(remaining)?;
-        let (threshold, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let accel_num = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let accel_denom = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let threshold = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = FeedbackStateDataPointer { accel_num, accel_denom, threshold };
         Ok((result, remaining))
     }
@@ -4195,8 +4044,9 @@ pub struct FeedbackStateDataString {
 impl_debug_if_no_extra_traits!(FeedbackStateDataString, "FeedbackStateDataString");
 impl TryParse for FeedbackStateDataString {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (max_symbols, remaining) = u16::try_parse(remaining)?;
-        let (num_keysyms, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let max_symbols = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let num_keysyms = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (keysyms, remaining) = crate::x11_utils::parse_list::<xproto::Keysym>(remaining, num_keysyms.try_to_usize()?)?;
         let result = FeedbackStateDataString { max_symbols, keysyms };
         Ok((result, remaining))
@@ -4243,9 +4093,10 @@ pub struct FeedbackStateDataInteger {
 impl_debug_if_no_extra_traits!(FeedbackStateDataInteger, "FeedbackStateDataInteger");
 impl TryParse for FeedbackStateDataInteger {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (resolution, remaining) = u32::try_parse(remaining)?;
-        let (min_value, remaining) = i32::try_parse(remaining)?;
-        let (max_value, remaining) = i32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let resolution = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let min_value = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let max_value = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = FeedbackStateDataInteger { resolution, min_value, max_value };
         Ok((result, remaining))
     }
@@ -4288,8 +4139,9 @@ pub struct FeedbackStateDataLed {
 impl_debug_if_no_extra_traits!(FeedbackStateDataLed, "FeedbackStateDataLed");
 impl TryParse for FeedbackStateDataLed {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let led_mask = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = FeedbackStateDataLed { led_mask, led_values };
         Ok((result, remaining))
     }
@@ -4327,10 +4179,10 @@ pub struct FeedbackStateDataBell {
 impl_debug_if_no_extra_traits!(FeedbackStateDataBell, "FeedbackStateDataBell");
 impl TryParse for FeedbackStateDataBell {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (percent, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (pitch, remaining) = u16::try_parse(remaining)?;
-        let (duration, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let percent = fixed_bytes[0];
+        let pitch = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let duration = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = FeedbackStateDataBell { percent, pitch, duration };
         Ok((result, remaining))
     }
@@ -4512,9 +4364,10 @@ pub struct FeedbackState {
 impl_debug_if_no_extra_traits!(FeedbackState, "FeedbackState");
 impl TryParse for FeedbackState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (data, remaining) = FeedbackStateData::try_parse(remaining, u8::from(class_id))?;
         let result = FeedbackState { feedback_id, len, data };
         Ok((result, remaining))
@@ -4680,17 +4533,18 @@ pub struct KbdFeedbackCtl {
 impl_debug_if_no_extra_traits!(KbdFeedbackCtl, "KbdFeedbackCtl");
 impl TryParse for KbdFeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (key, remaining) = KeyCode::try_parse(remaining)?;
-        let (auto_repeat_mode, remaining) = u8::try_parse(remaining)?;
-        let (key_click_percent, remaining) = i8::try_parse(remaining)?;
-        let (bell_percent, remaining) = i8::try_parse(remaining)?;
-        let (bell_pitch, remaining) = i16::try_parse(remaining)?;
-        let (bell_duration, remaining) = i16::try_parse(remaining)?;
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let key = fixed_bytes[4];
+        let auto_repeat_mode = fixed_bytes[5];
+        let key_click_percent = i8::from_ne_bytes([fixed_bytes[6]]);
+        let bell_percent = i8::from_ne_bytes([fixed_bytes[7]]);
+        let bell_pitch = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let bell_duration = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let led_mask = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let class_id = class_id.into();
         let result = KbdFeedbackCtl { class_id, feedback_id, len, key, auto_repeat_mode, key_click_percent, bell_percent, bell_pitch, bell_duration, led_mask, led_values };
         Ok((result, remaining))
@@ -4763,13 +4617,13 @@ pub struct PtrFeedbackCtl {
 impl_debug_if_no_extra_traits!(PtrFeedbackCtl, "PtrFeedbackCtl");
 impl TryParse for PtrFeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (num, remaining) = i16::try_parse(remaining)?;
-        let (denom, remaining) = i16::try_parse(remaining)?;
-        let (threshold, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let num = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let denom = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let threshold = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let class_id = class_id.into();
         let result = PtrFeedbackCtl { class_id, feedback_id, len, num, denom, threshold };
         Ok((result, remaining))
@@ -4823,10 +4677,11 @@ pub struct IntegerFeedbackCtl {
 impl_debug_if_no_extra_traits!(IntegerFeedbackCtl, "IntegerFeedbackCtl");
 impl TryParse for IntegerFeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (int_to_display, remaining) = i32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let int_to_display = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let class_id = class_id.into();
         let result = IntegerFeedbackCtl { class_id, feedback_id, len, int_to_display };
         Ok((result, remaining))
@@ -4871,11 +4726,11 @@ pub struct StringFeedbackCtl {
 impl_debug_if_no_extra_traits!(StringFeedbackCtl, "StringFeedbackCtl");
 impl TryParse for StringFeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (num_keysyms, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let num_keysyms = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let (keysyms, remaining) = crate::x11_utils::parse_list::<xproto::Keysym>(remaining, num_keysyms.try_to_usize()?)?;
         let class_id = class_id.into();
         let result = StringFeedbackCtl { class_id, feedback_id, len, keysyms };
@@ -4930,13 +4785,13 @@ pub struct BellFeedbackCtl {
 impl_debug_if_no_extra_traits!(BellFeedbackCtl, "BellFeedbackCtl");
 impl TryParse for BellFeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (percent, remaining) = i8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (pitch, remaining) = i16::try_parse(remaining)?;
-        let (duration, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let percent = i8::from_ne_bytes([fixed_bytes[4]]);
+        let pitch = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let duration = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let class_id = class_id.into();
         let result = BellFeedbackCtl { class_id, feedback_id, len, percent, pitch, duration };
         Ok((result, remaining))
@@ -4991,11 +4846,12 @@ pub struct LedFeedbackCtl {
 impl_debug_if_no_extra_traits!(LedFeedbackCtl, "LedFeedbackCtl");
 impl TryParse for LedFeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let led_mask = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let class_id = class_id.into();
         let result = LedFeedbackCtl { class_id, feedback_id, len, led_mask, led_values };
         Ok((result, remaining))
@@ -5050,14 +4906,15 @@ pub struct FeedbackCtlDataKeyboard {
 impl_debug_if_no_extra_traits!(FeedbackCtlDataKeyboard, "FeedbackCtlDataKeyboard");
 impl TryParse for FeedbackCtlDataKeyboard {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (key, remaining) = KeyCode::try_parse(remaining)?;
-        let (auto_repeat_mode, remaining) = u8::try_parse(remaining)?;
-        let (key_click_percent, remaining) = i8::try_parse(remaining)?;
-        let (bell_percent, remaining) = i8::try_parse(remaining)?;
-        let (bell_pitch, remaining) = i16::try_parse(remaining)?;
-        let (bell_duration, remaining) = i16::try_parse(remaining)?;
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let key = fixed_bytes[0];
+        let auto_repeat_mode = fixed_bytes[1];
+        let key_click_percent = i8::from_ne_bytes([fixed_bytes[2]]);
+        let bell_percent = i8::from_ne_bytes([fixed_bytes[3]]);
+        let bell_pitch = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let bell_duration = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let led_mask = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let result = FeedbackCtlDataKeyboard { key, auto_repeat_mode, key_click_percent, bell_percent, bell_pitch, bell_duration, led_mask, led_values };
         Ok((result, remaining))
     }
@@ -5115,10 +4972,10 @@ pub struct FeedbackCtlDataPointer {
 impl_debug_if_no_extra_traits!(FeedbackCtlDataPointer, "FeedbackCtlDataPointer");
 impl TryParse for FeedbackCtlDataPointer {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (num, remaining) = i16::try_parse(remaining)?;
-        let (denom, remaining) = i16::try_parse(remaining)?;
-        let (threshold, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let num = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let denom = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let threshold = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = FeedbackCtlDataPointer { num, denom, threshold };
         Ok((result, remaining))
     }
@@ -5234,8 +5091,9 @@ pub struct FeedbackCtlDataLed {
 impl_debug_if_no_extra_traits!(FeedbackCtlDataLed, "FeedbackCtlDataLed");
 impl TryParse for FeedbackCtlDataLed {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (led_mask, remaining) = u32::try_parse(remaining)?;
-        let (led_values, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let led_mask = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let led_values = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = FeedbackCtlDataLed { led_mask, led_values };
         Ok((result, remaining))
     }
@@ -5273,10 +5131,10 @@ pub struct FeedbackCtlDataBell {
 impl_debug_if_no_extra_traits!(FeedbackCtlDataBell, "FeedbackCtlDataBell");
 impl TryParse for FeedbackCtlDataBell {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (percent, remaining) = i8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (pitch, remaining) = i16::try_parse(remaining)?;
-        let (duration, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let percent = i8::from_ne_bytes([fixed_bytes[0]]);
+        let pitch = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let duration = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = FeedbackCtlDataBell { percent, pitch, duration };
         Ok((result, remaining))
     }
@@ -5458,9 +5316,10 @@ pub struct FeedbackCtl {
 impl_debug_if_no_extra_traits!(FeedbackCtl, "FeedbackCtl");
 impl TryParse for FeedbackCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (feedback_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let feedback_id = fixed_bytes[1];
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (data, remaining) = FeedbackCtlData::try_parse(remaining, u8::from(class_id))?;
         let result = FeedbackCtl { feedback_id, len, data };
         Ok((result, remaining))
@@ -6437,10 +6296,10 @@ pub struct KeyState {
 impl_debug_if_no_extra_traits!(KeyState, "KeyState");
 impl TryParse for KeyState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
-        let (num_keys, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
+        let num_keys = fixed_bytes[2];
         let (keys, remaining) = crate::x11_utils::parse_u8_array::<32>(remaining)?;
         let class_id = class_id.into();
         let result = KeyState { class_id, len, num_keys, keys };
@@ -6514,10 +6373,10 @@ pub struct ButtonState {
 impl_debug_if_no_extra_traits!(ButtonState, "ButtonState");
 impl TryParse for ButtonState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
-        let (num_buttons, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
+        let num_buttons = fixed_bytes[2];
         let (buttons, remaining) = crate::x11_utils::parse_u8_array::<32>(remaining)?;
         let class_id = class_id.into();
         let result = ButtonState { class_id, len, num_buttons, buttons };
@@ -6598,30 +6457,7 @@ impl From<ValuatorStateModeMask> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ValuatorStateModeMask> for u16 {
-    #[inline]
-    fn from(input: ValuatorStateModeMask) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ValuatorStateModeMask> for Option<u16> {
-    #[inline]
-    fn from(input: ValuatorStateModeMask) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ValuatorStateModeMask> for u32 {
-    #[inline]
-    fn from(input: ValuatorStateModeMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ValuatorStateModeMask> for Option<u32> {
-    #[inline]
-    fn from(input: ValuatorStateModeMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ValuatorStateModeMask, u16, u32);
 impl From<u8> for ValuatorStateModeMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -6651,10 +6487,11 @@ pub struct ValuatorState {
 impl_debug_if_no_extra_traits!(ValuatorState, "ValuatorState");
 impl TryParse for ValuatorState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
-        let (num_valuators, remaining) = u8::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
+        let num_valuators = fixed_bytes[2];
+        let mode = fixed_bytes[3];
         let (valuators, remaining) = crate::x11_utils::parse_list::<i32>(remaining, num_valuators.try_to_usize()?)?;
         let class_id = class_id.into();
         let mode = mode.into();
@@ -6835,8 +6672,9 @@ pub struct InputStateDataValuator {
 impl_debug_if_no_extra_traits!(InputStateDataValuator, "InputStateDataValuator");
 impl TryParse for InputStateDataValuator {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (num_valuators, remaining) = u8::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let num_valuators = fixed_bytes[0];
+        let mode = fixed_bytes[1];
         let (valuators, remaining) = crate::x11_utils::parse_list::<i32>(remaining, num_valuators.try_to_usize()?)?;
         let mode = mode.into();
         let result = InputStateDataValuator { mode, valuators };
@@ -6979,8 +6817,9 @@ pub struct InputState {
 impl_debug_if_no_extra_traits!(InputState, "InputState");
 impl TryParse for InputState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (class_id, remaining) = u8::try_parse(remaining)?;
-        let (len, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let class_id = fixed_bytes[0];
+        let len = fixed_bytes[1];
         let (data, remaining) = InputStateData::try_parse(remaining, u8::from(class_id))?;
         let result = InputState { len, data };
         Ok((result, remaining))
@@ -7381,18 +7220,7 @@ impl From<DeviceControl> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<DeviceControl> for u32 {
-    #[inline]
-    fn from(input: DeviceControl) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DeviceControl> for Option<u32> {
-    #[inline]
-    fn from(input: DeviceControl) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DeviceControl, u32);
 impl From<u8> for DeviceControl {
     #[inline]
     fn from(value: u8) -> Self {
@@ -7431,9 +7259,10 @@ pub struct DeviceResolutionState {
 impl_debug_if_no_extra_traits!(DeviceResolutionState, "DeviceResolutionState");
 impl TryParse for DeviceResolutionState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (num_valuators, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let num_valuators = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let (resolution_values, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_valuators.try_to_usize()?)?;
         let (resolution_min, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_valuators.try_to_usize()?)?;
         let (resolution_max, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_valuators.try_to_usize()?)?;
@@ -7496,16 +7325,17 @@ pub struct DeviceAbsCalibState {
 impl_debug_if_no_extra_traits!(DeviceAbsCalibState, "DeviceAbsCalibState");
 impl TryParse for DeviceAbsCalibState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (min_x, remaining) = i32::try_parse(remaining)?;
-        let (max_x, remaining) = i32::try_parse(remaining)?;
-        let (min_y, remaining) = i32::try_parse(remaining)?;
-        let (max_y, remaining) = i32::try_parse(remaining)?;
-        let (flip_x, remaining) = u32::try_parse(remaining)?;
-        let (flip_y, remaining) = u32::try_parse(remaining)?;
-        let (rotation, remaining) = u32::try_parse(remaining)?;
-        let (button_threshold, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<36>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let min_x = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let max_x = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let min_y = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let max_y = i32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let flip_x = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let flip_y = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let rotation = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let button_threshold = u32::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
         let control_id = control_id.into();
         let result = DeviceAbsCalibState { control_id, len, min_x, max_x, min_y, max_y, flip_x, flip_y, rotation, button_threshold };
         Ok((result, remaining))
@@ -7594,14 +7424,15 @@ pub struct DeviceAbsAreaState {
 impl_debug_if_no_extra_traits!(DeviceAbsAreaState, "DeviceAbsAreaState");
 impl TryParse for DeviceAbsAreaState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (offset_x, remaining) = u32::try_parse(remaining)?;
-        let (offset_y, remaining) = u32::try_parse(remaining)?;
-        let (width, remaining) = u32::try_parse(remaining)?;
-        let (height, remaining) = u32::try_parse(remaining)?;
-        let (screen, remaining) = u32::try_parse(remaining)?;
-        let (following, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let offset_x = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let offset_y = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let width = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let height = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let screen = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let following = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let control_id = control_id.into();
         let result = DeviceAbsAreaState { control_id, len, offset_x, offset_y, width, height, screen, following };
         Ok((result, remaining))
@@ -7674,11 +7505,11 @@ pub struct DeviceCoreState {
 impl_debug_if_no_extra_traits!(DeviceCoreState, "DeviceCoreState");
 impl TryParse for DeviceCoreState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let (iscore, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let status = fixed_bytes[4];
+        let iscore = fixed_bytes[5];
         let control_id = control_id.into();
         let result = DeviceCoreState { control_id, len, status, iscore };
         Ok((result, remaining))
@@ -7723,10 +7554,10 @@ pub struct DeviceEnableState {
 impl_debug_if_no_extra_traits!(DeviceEnableState, "DeviceEnableState");
 impl TryParse for DeviceEnableState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (enable, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let enable = fixed_bytes[4];
         let control_id = control_id.into();
         let result = DeviceEnableState { control_id, len, enable };
         Ok((result, remaining))
@@ -7825,14 +7656,15 @@ pub struct DeviceStateDataAbsCalib {
 impl_debug_if_no_extra_traits!(DeviceStateDataAbsCalib, "DeviceStateDataAbsCalib");
 impl TryParse for DeviceStateDataAbsCalib {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (min_x, remaining) = i32::try_parse(remaining)?;
-        let (max_x, remaining) = i32::try_parse(remaining)?;
-        let (min_y, remaining) = i32::try_parse(remaining)?;
-        let (max_y, remaining) = i32::try_parse(remaining)?;
-        let (flip_x, remaining) = u32::try_parse(remaining)?;
-        let (flip_y, remaining) = u32::try_parse(remaining)?;
-        let (rotation, remaining) = u32::try_parse(remaining)?;
-        let (button_threshold, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let min_x = i32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let max_x = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let min_y = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let max_y = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let flip_x = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let flip_y = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let rotation = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let button_threshold = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
         let result = DeviceStateDataAbsCalib { min_x, max_x, min_y, max_y, flip_x, flip_y, rotation, button_threshold };
         Ok((result, remaining))
     }
@@ -7905,9 +7737,9 @@ pub struct DeviceStateDataCore {
 impl_debug_if_no_extra_traits!(DeviceStateDataCore, "DeviceStateDataCore");
 impl TryParse for DeviceStateDataCore {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let (iscore, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let status = fixed_bytes[0];
+        let iscore = fixed_bytes[1];
         let result = DeviceStateDataCore { status, iscore };
         Ok((result, remaining))
     }
@@ -7945,12 +7777,13 @@ pub struct DeviceStateDataAbsArea {
 impl_debug_if_no_extra_traits!(DeviceStateDataAbsArea, "DeviceStateDataAbsArea");
 impl TryParse for DeviceStateDataAbsArea {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (offset_x, remaining) = u32::try_parse(remaining)?;
-        let (offset_y, remaining) = u32::try_parse(remaining)?;
-        let (width, remaining) = u32::try_parse(remaining)?;
-        let (height, remaining) = u32::try_parse(remaining)?;
-        let (screen, remaining) = u32::try_parse(remaining)?;
-        let (following, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let offset_x = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let offset_y = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let width = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let height = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let screen = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let following = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
         let result = DeviceStateDataAbsArea { offset_x, offset_y, width, height, screen, following };
         Ok((result, remaining))
     }
@@ -8143,8 +7976,9 @@ pub struct DeviceState {
 impl_debug_if_no_extra_traits!(DeviceState, "DeviceState");
 impl TryParse for DeviceState {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (data, remaining) = DeviceStateData::try_parse(remaining, u16::from(control_id))?;
         let result = DeviceState { len, data };
         Ok((result, remaining))
@@ -8292,11 +8126,11 @@ pub struct DeviceResolutionCtl {
 impl_debug_if_no_extra_traits!(DeviceResolutionCtl, "DeviceResolutionCtl");
 impl TryParse for DeviceResolutionCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (first_valuator, remaining) = u8::try_parse(remaining)?;
-        let (num_valuators, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let first_valuator = fixed_bytes[4];
+        let num_valuators = fixed_bytes[5];
         let (resolution_values, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_valuators.try_to_usize()?)?;
         let control_id = control_id.into();
         let result = DeviceResolutionCtl { control_id, len, first_valuator, resolution_values };
@@ -8355,16 +8189,17 @@ pub struct DeviceAbsCalibCtl {
 impl_debug_if_no_extra_traits!(DeviceAbsCalibCtl, "DeviceAbsCalibCtl");
 impl TryParse for DeviceAbsCalibCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (min_x, remaining) = i32::try_parse(remaining)?;
-        let (max_x, remaining) = i32::try_parse(remaining)?;
-        let (min_y, remaining) = i32::try_parse(remaining)?;
-        let (max_y, remaining) = i32::try_parse(remaining)?;
-        let (flip_x, remaining) = u32::try_parse(remaining)?;
-        let (flip_y, remaining) = u32::try_parse(remaining)?;
-        let (rotation, remaining) = u32::try_parse(remaining)?;
-        let (button_threshold, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<36>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let min_x = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let max_x = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let min_y = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let max_y = i32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let flip_x = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let flip_y = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let rotation = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let button_threshold = u32::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
         let control_id = control_id.into();
         let result = DeviceAbsCalibCtl { control_id, len, min_x, max_x, min_y, max_y, flip_x, flip_y, rotation, button_threshold };
         Ok((result, remaining))
@@ -8453,14 +8288,15 @@ pub struct DeviceAbsAreaCtrl {
 impl_debug_if_no_extra_traits!(DeviceAbsAreaCtrl, "DeviceAbsAreaCtrl");
 impl TryParse for DeviceAbsAreaCtrl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (offset_x, remaining) = u32::try_parse(remaining)?;
-        let (offset_y, remaining) = u32::try_parse(remaining)?;
-        let (width, remaining) = i32::try_parse(remaining)?;
-        let (height, remaining) = i32::try_parse(remaining)?;
-        let (screen, remaining) = i32::try_parse(remaining)?;
-        let (following, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let offset_x = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let offset_y = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let width = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let height = i32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let screen = i32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let following = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let control_id = control_id.into();
         let result = DeviceAbsAreaCtrl { control_id, len, offset_x, offset_y, width, height, screen, following };
         Ok((result, remaining))
@@ -8532,10 +8368,10 @@ pub struct DeviceCoreCtrl {
 impl_debug_if_no_extra_traits!(DeviceCoreCtrl, "DeviceCoreCtrl");
 impl TryParse for DeviceCoreCtrl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let status = fixed_bytes[4];
         let control_id = control_id.into();
         let result = DeviceCoreCtrl { control_id, len, status };
         Ok((result, remaining))
@@ -8578,10 +8414,10 @@ pub struct DeviceEnableCtrl {
 impl_debug_if_no_extra_traits!(DeviceEnableCtrl, "DeviceEnableCtrl");
 impl TryParse for DeviceEnableCtrl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (enable, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let enable = fixed_bytes[4];
         let control_id = control_id.into();
         let result = DeviceEnableCtrl { control_id, len, enable };
         Ok((result, remaining))
@@ -8623,9 +8459,9 @@ pub struct DeviceCtlDataResolution {
 impl_debug_if_no_extra_traits!(DeviceCtlDataResolution, "DeviceCtlDataResolution");
 impl TryParse for DeviceCtlDataResolution {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (first_valuator, remaining) = u8::try_parse(remaining)?;
-        let (num_valuators, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let first_valuator = fixed_bytes[0];
+        let num_valuators = fixed_bytes[1];
         let (resolution_values, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_valuators.try_to_usize()?)?;
         let result = DeviceCtlDataResolution { first_valuator, resolution_values };
         Ok((result, remaining))
@@ -8678,14 +8514,15 @@ pub struct DeviceCtlDataAbsCalib {
 impl_debug_if_no_extra_traits!(DeviceCtlDataAbsCalib, "DeviceCtlDataAbsCalib");
 impl TryParse for DeviceCtlDataAbsCalib {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (min_x, remaining) = i32::try_parse(remaining)?;
-        let (max_x, remaining) = i32::try_parse(remaining)?;
-        let (min_y, remaining) = i32::try_parse(remaining)?;
-        let (max_y, remaining) = i32::try_parse(remaining)?;
-        let (flip_x, remaining) = u32::try_parse(remaining)?;
-        let (flip_y, remaining) = u32::try_parse(remaining)?;
-        let (rotation, remaining) = u32::try_parse(remaining)?;
-        let (button_threshold, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let min_x = i32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let max_x = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let min_y = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let max_y = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let flip_x = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let flip_y = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let rotation = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let button_threshold = u32::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
         let result = DeviceCtlDataAbsCalib { min_x, max_x, min_y, max_y, flip_x, flip_y, rotation, button_threshold };
         Ok((result, remaining))
     }
@@ -8794,12 +8631,13 @@ pub struct DeviceCtlDataAbsArea {
 impl_debug_if_no_extra_traits!(DeviceCtlDataAbsArea, "DeviceCtlDataAbsArea");
 impl TryParse for DeviceCtlDataAbsArea {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (offset_x, remaining) = u32::try_parse(remaining)?;
-        let (offset_y, remaining) = u32::try_parse(remaining)?;
-        let (width, remaining) = i32::try_parse(remaining)?;
-        let (height, remaining) = i32::try_parse(remaining)?;
-        let (screen, remaining) = i32::try_parse(remaining)?;
-        let (following, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let offset_x = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let offset_y = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let width = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let height = i32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let screen = i32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let following = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
         let result = DeviceCtlDataAbsArea { offset_x, offset_y, width, height, screen, following };
         Ok((result, remaining))
     }
@@ -8992,8 +8830,9 @@ pub struct DeviceCtl {
 impl_debug_if_no_extra_traits!(DeviceCtl, "DeviceCtl");
 impl TryParse for DeviceCtl {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (control_id, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let control_id = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (data, remaining) = DeviceCtlData::try_parse(remaining, u16::from(control_id))?;
         let result = DeviceCtl { len, data };
         Ok((result, remaining))
@@ -9313,30 +9152,7 @@ impl From<PropertyFormat> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PropertyFormat> for u16 {
-    #[inline]
-    fn from(input: PropertyFormat) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PropertyFormat> for Option<u16> {
-    #[inline]
-    fn from(input: PropertyFormat) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PropertyFormat> for u32 {
-    #[inline]
-    fn from(input: PropertyFormat) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PropertyFormat> for Option<u32> {
-    #[inline]
-    fn from(input: PropertyFormat) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PropertyFormat, u16, u32);
 impl From<u8> for PropertyFormat {
     #[inline]
     fn from(value: u8) -> Self {
@@ -9944,42 +9760,7 @@ impl From<Device> for Option<bool> {
         Some(input.0)
     }
 }
-impl From<Device> for u8 {
-    #[inline]
-    fn from(input: Device) -> Self {
-        u8::from(input.0)
-    }
-}
-impl From<Device> for Option<u8> {
-    #[inline]
-    fn from(input: Device) -> Self {
-        Some(u8::from(input.0))
-    }
-}
-impl From<Device> for u16 {
-    #[inline]
-    fn from(input: Device) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Device> for Option<u16> {
-    #[inline]
-    fn from(input: Device) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Device> for u32 {
-    #[inline]
-    fn from(input: Device) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Device> for Option<u32> {
-    #[inline]
-    fn from(input: Device) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Device, u8, u16, u32);
 impl From<bool> for Device {
     #[inline]
     fn from(value: bool) -> Self {
@@ -10008,10 +9789,11 @@ pub struct GroupInfo {
 impl_debug_if_no_extra_traits!(GroupInfo, "GroupInfo");
 impl TryParse for GroupInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (base, remaining) = u8::try_parse(remaining)?;
-        let (latched, remaining) = u8::try_parse(remaining)?;
-        let (locked, remaining) = u8::try_parse(remaining)?;
-        let (effective, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let base = fixed_bytes[0];
+        let latched = fixed_bytes[1];
+        let locked = fixed_bytes[2];
+        let effective = fixed_bytes[3];
         let result = GroupInfo { base, latched, locked, effective };
         Ok((result, remaining))
     }
@@ -10051,10 +9833,11 @@ pub struct ModifierInfo {
 impl_debug_if_no_extra_traits!(ModifierInfo, "ModifierInfo");
 impl TryParse for ModifierInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (base, remaining) = u32::try_parse(remaining)?;
-        let (latched, remaining) = u32::try_parse(remaining)?;
-        let (locked, remaining) = u32::try_parse(remaining)?;
-        let (effective, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let base = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let latched = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let locked = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let effective = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let result = ModifierInfo { base, latched, locked, effective };
         Ok((result, remaining))
     }
@@ -10463,25 +10246,14 @@ impl From<HierarchyChangeType> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<HierarchyChangeType> for u32 {
+enum_into_larger!(HierarchyChangeType, u32);
+impl From<u8> for HierarchyChangeType {
     #[inline]
-    fn from(input: HierarchyChangeType) -> Self {
-        u32::from(input.0)
+    fn from(value: u8) -> Self {
+        Self(value.into())
     }
 }
-impl From<HierarchyChangeType> for Option<u32> {
-    #[inline]
-    fn from(input: HierarchyChangeType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
-impl From<u8> for HierarchyChangeType {
-    #[inline]
-    fn from(value: u8) -> Self {
-        Self(value.into())
-    }
-}
-impl From<u16> for HierarchyChangeType {
+impl From<u16> for HierarchyChangeType {
     #[inline]
     fn from(value: u16) -> Self {
         Self(value)
@@ -10518,30 +10290,7 @@ impl From<ChangeMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ChangeMode> for u16 {
-    #[inline]
-    fn from(input: ChangeMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ChangeMode> for Option<u16> {
-    #[inline]
-    fn from(input: ChangeMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ChangeMode> for u32 {
-    #[inline]
-    fn from(input: ChangeMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ChangeMode> for Option<u32> {
-    #[inline]
-    fn from(input: ChangeMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ChangeMode, u16, u32);
 impl From<u8> for ChangeMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -10572,11 +10321,12 @@ impl_debug_if_no_extra_traits!(AddMaster, "AddMaster");
 impl TryParse for AddMaster {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (name_len, remaining) = u16::try_parse(remaining)?;
-        let (send_core, remaining) = bool::try_parse(remaining)?;
-        let (enable, remaining) = bool::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let name_len = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let send_core = fixed_bytes[6] != 0;
+        let enable = fixed_bytes[7] != 0;
         let (name, remaining) = crate::x11_utils::parse_u8_list(remaining, name_len.try_to_usize()?)?;
         let name = name.to_vec();
         // Align offset to multiple of 4
@@ -10637,13 +10387,13 @@ pub struct RemoveMaster {
 impl_debug_if_no_extra_traits!(RemoveMaster, "RemoveMaster");
 impl TryParse for RemoveMaster {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (return_mode, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (return_pointer, remaining) = DeviceId::try_parse(remaining)?;
-        let (return_keyboard, remaining) = DeviceId::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let return_mode = fixed_bytes[6];
+        let return_pointer = DeviceId::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let return_keyboard = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let type_ = type_.into();
         let return_mode = return_mode.into();
         let result = RemoveMaster { type_, len, deviceid, return_mode, return_pointer, return_keyboard };
@@ -10698,10 +10448,11 @@ pub struct AttachSlave {
 impl_debug_if_no_extra_traits!(AttachSlave, "AttachSlave");
 impl TryParse for AttachSlave {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (master, remaining) = DeviceId::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let master = DeviceId::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let type_ = type_.into();
         let result = AttachSlave { type_, len, deviceid, master };
         Ok((result, remaining))
@@ -10745,10 +10496,10 @@ pub struct DetachSlave {
 impl_debug_if_no_extra_traits!(DetachSlave, "DetachSlave");
 impl TryParse for DetachSlave {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
         let type_ = type_.into();
         let result = DetachSlave { type_, len, deviceid };
         Ok((result, remaining))
@@ -10792,9 +10543,10 @@ impl_debug_if_no_extra_traits!(HierarchyChangeDataAddMaster, "HierarchyChangeDat
 impl TryParse for HierarchyChangeDataAddMaster {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (name_len, remaining) = u16::try_parse(remaining)?;
-        let (send_core, remaining) = bool::try_parse(remaining)?;
-        let (enable, remaining) = bool::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let name_len = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let send_core = fixed_bytes[2] != 0;
+        let enable = fixed_bytes[3] != 0;
         let (name, remaining) = crate::x11_utils::parse_u8_list(remaining, name_len.try_to_usize()?)?;
         let name = name.to_vec();
         // Align offset to multiple of 4
@@ -10849,11 +10601,11 @@ pub struct HierarchyChangeDataRemoveMaster {
 impl_debug_if_no_extra_traits!(HierarchyChangeDataRemoveMaster, "HierarchyChangeDataRemoveMaster");
 impl TryParse for HierarchyChangeDataRemoveMaster {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (return_mode, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (return_pointer, remaining) = DeviceId::try_parse(remaining)?;
-        let (return_keyboard, remaining) = DeviceId::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let return_mode = fixed_bytes[2];
+        let return_pointer = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let return_keyboard = DeviceId::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let return_mode = return_mode.into();
         let result = HierarchyChangeDataRemoveMaster { deviceid, return_mode, return_pointer, return_keyboard };
         Ok((result, remaining))
@@ -10896,8 +10648,9 @@ pub struct HierarchyChangeDataAttachSlave {
 impl_debug_if_no_extra_traits!(HierarchyChangeDataAttachSlave, "HierarchyChangeDataAttachSlave");
 impl TryParse for HierarchyChangeDataAttachSlave {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (master, remaining) = DeviceId::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let master = DeviceId::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let result = HierarchyChangeDataAttachSlave { deviceid, master };
         Ok((result, remaining))
     }
@@ -11073,8 +10826,9 @@ pub struct HierarchyChange {
 impl_debug_if_no_extra_traits!(HierarchyChange, "HierarchyChange");
 impl TryParse for HierarchyChange {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (data, remaining) = HierarchyChangeData::try_parse(remaining, u16::from(type_))?;
         let result = HierarchyChange { len, data };
         Ok((result, remaining))
@@ -11481,8 +11235,9 @@ pub struct EventMask {
 impl_debug_if_no_extra_traits!(EventMask, "EventMask");
 impl TryParse for EventMask {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (mask_len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let mask_len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let mut remaining = remaining;
         let list_length = mask_len.try_to_usize()?;
         let mut mask = Vec::with_capacity(list_length);
@@ -11777,18 +11532,7 @@ impl From<DeviceClassType> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<DeviceClassType> for u32 {
-    #[inline]
-    fn from(input: DeviceClassType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DeviceClassType> for Option<u32> {
-    #[inline]
-    fn from(input: DeviceClassType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DeviceClassType, u32);
 impl From<u8> for DeviceClassType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -11837,18 +11581,7 @@ impl From<DeviceType> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<DeviceType> for u32 {
-    #[inline]
-    fn from(input: DeviceType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DeviceType> for Option<u32> {
-    #[inline]
-    fn from(input: DeviceType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DeviceType, u32);
 impl From<u8> for DeviceType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -11941,18 +11674,7 @@ impl From<ScrollType> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<ScrollType> for u32 {
-    #[inline]
-    fn from(input: ScrollType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ScrollType> for Option<u32> {
-    #[inline]
-    fn from(input: ScrollType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ScrollType, u32);
 impl From<u8> for ScrollType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -11994,30 +11716,7 @@ impl From<TouchMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<TouchMode> for u16 {
-    #[inline]
-    fn from(input: TouchMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<TouchMode> for Option<u16> {
-    #[inline]
-    fn from(input: TouchMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<TouchMode> for u32 {
-    #[inline]
-    fn from(input: TouchMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<TouchMode> for Option<u32> {
-    #[inline]
-    fn from(input: TouchMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(TouchMode, u16, u32);
 impl From<u8> for TouchMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -12047,10 +11746,11 @@ pub struct ButtonClass {
 impl_debug_if_no_extra_traits!(ButtonClass, "ButtonClass");
 impl TryParse for ButtonClass {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (num_buttons, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_buttons = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let (state, remaining) = crate::x11_utils::parse_list::<u32>(remaining, u32::from(num_buttons).checked_add(31u32).ok_or(ParseError::InvalidExpression)?.checked_div(32u32).ok_or(ParseError::InvalidExpression)?.try_to_usize()?)?;
         let (labels, remaining) = crate::x11_utils::parse_list::<xproto::Atom>(remaining, num_buttons.try_to_usize()?)?;
         let type_ = type_.into();
@@ -12105,10 +11805,11 @@ pub struct KeyClass {
 impl_debug_if_no_extra_traits!(KeyClass, "KeyClass");
 impl TryParse for KeyClass {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (num_keys, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_keys = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let (keys, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_keys.try_to_usize()?)?;
         let type_ = type_.into();
         let result = KeyClass { type_, len, sourceid, keys };
@@ -12163,13 +11864,13 @@ pub struct ScrollClass {
 impl_debug_if_no_extra_traits!(ScrollClass, "ScrollClass");
 impl TryParse for ScrollClass {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (number, remaining) = u16::try_parse(remaining)?;
-        let (scroll_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let number = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let scroll_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let (increment, remaining) = Fp3232::try_parse(remaining)?;
         let type_ = type_.into();
         let scroll_type = scroll_type.into();
@@ -12241,11 +11942,12 @@ pub struct TouchClass {
 impl_debug_if_no_extra_traits!(TouchClass, "TouchClass");
 impl TryParse for TouchClass {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (num_touches, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let mode = fixed_bytes[6];
+        let num_touches = fixed_bytes[7];
         let type_ = type_.into();
         let mode = mode.into();
         let result = TouchClass { type_, len, sourceid, mode, num_touches };
@@ -12293,11 +11995,11 @@ pub struct GestureClass {
 impl_debug_if_no_extra_traits!(GestureClass, "GestureClass");
 impl TryParse for GestureClass {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (num_touches, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_touches = fixed_bytes[6];
         let type_ = type_.into();
         let result = GestureClass { type_, len, sourceid, num_touches };
         Ok((result, remaining))
@@ -12349,11 +12051,12 @@ pub struct ValuatorClass {
 impl_debug_if_no_extra_traits!(ValuatorClass, "ValuatorClass");
 impl TryParse for ValuatorClass {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (number, remaining) = u16::try_parse(remaining)?;
-        let (label, remaining) = xproto::Atom::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let number = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let label = xproto::Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let (min, remaining) = Fp3232::try_parse(remaining)?;
         let (max, remaining) = Fp3232::try_parse(remaining)?;
         let (value, remaining) = Fp3232::try_parse(remaining)?;
@@ -12547,8 +12250,9 @@ pub struct DeviceClassDataValuator {
 impl_debug_if_no_extra_traits!(DeviceClassDataValuator, "DeviceClassDataValuator");
 impl TryParse for DeviceClassDataValuator {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (number, remaining) = u16::try_parse(remaining)?;
-        let (label, remaining) = xproto::Atom::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<6>(remaining)?;
+        let number = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let label = xproto::Atom::from_ne_bytes([fixed_bytes[2], fixed_bytes[3], fixed_bytes[4], fixed_bytes[5]]);
         let (min, remaining) = Fp3232::try_parse(remaining)?;
         let (max, remaining) = Fp3232::try_parse(remaining)?;
         let (value, remaining) = Fp3232::try_parse(remaining)?;
@@ -12635,10 +12339,10 @@ pub struct DeviceClassDataScroll {
 impl_debug_if_no_extra_traits!(DeviceClassDataScroll, "DeviceClassDataScroll");
 impl TryParse for DeviceClassDataScroll {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (number, remaining) = u16::try_parse(remaining)?;
-        let (scroll_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<10>(remaining)?;
+        let number = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let scroll_type = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[6], fixed_bytes[7], fixed_bytes[8], fixed_bytes[9]]);
         let (increment, remaining) = Fp3232::try_parse(remaining)?;
         let scroll_type = scroll_type.into();
         let flags = flags.into();
@@ -12693,8 +12397,9 @@ pub struct DeviceClassDataTouch {
 impl_debug_if_no_extra_traits!(DeviceClassDataTouch, "DeviceClassDataTouch");
 impl TryParse for DeviceClassDataTouch {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (num_touches, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let mode = fixed_bytes[0];
+        let num_touches = fixed_bytes[1];
         let mode = mode.into();
         let result = DeviceClassDataTouch { mode, num_touches };
         Ok((result, remaining))
@@ -12899,9 +12604,10 @@ impl_debug_if_no_extra_traits!(DeviceClass, "DeviceClass");
 impl TryParse for DeviceClass {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<6>(remaining)?;
+        let type_ = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
         let (data, remaining) = DeviceClassData::try_parse(remaining, u16::from(type_))?;
         let result = DeviceClass { len, sourceid, data };
         let length = u32::from(len).checked_mul(4u32).ok_or(ParseError::InvalidExpression)?.try_to_usize()?;
@@ -12943,13 +12649,13 @@ impl_debug_if_no_extra_traits!(XIDeviceInfo, "XIDeviceInfo");
 impl TryParse for XIDeviceInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (type_, remaining) = u16::try_parse(remaining)?;
-        let (attachment, remaining) = DeviceId::try_parse(remaining)?;
-        let (num_classes, remaining) = u16::try_parse(remaining)?;
-        let (name_len, remaining) = u16::try_parse(remaining)?;
-        let (enabled, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let type_ = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let attachment = DeviceId::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_classes = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let name_len = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let enabled = fixed_bytes[10] != 0;
         let (name, remaining) = crate::x11_utils::parse_u8_list(remaining, name_len.try_to_usize()?)?;
         let name = name.to_vec();
         // Align offset to multiple of 4
@@ -13369,42 +13075,7 @@ impl From<GrabOwner> for Option<bool> {
         Some(input.0)
     }
 }
-impl From<GrabOwner> for u8 {
-    #[inline]
-    fn from(input: GrabOwner) -> Self {
-        u8::from(input.0)
-    }
-}
-impl From<GrabOwner> for Option<u8> {
-    #[inline]
-    fn from(input: GrabOwner) -> Self {
-        Some(u8::from(input.0))
-    }
-}
-impl From<GrabOwner> for u16 {
-    #[inline]
-    fn from(input: GrabOwner) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GrabOwner> for Option<u16> {
-    #[inline]
-    fn from(input: GrabOwner) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GrabOwner> for u32 {
-    #[inline]
-    fn from(input: GrabOwner) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GrabOwner> for Option<u32> {
-    #[inline]
-    fn from(input: GrabOwner) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GrabOwner, u8, u16, u32);
 impl From<bool> for GrabOwner {
     #[inline]
     fn from(value: bool) -> Self {
@@ -13718,30 +13389,7 @@ impl From<EventMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<EventMode> for u16 {
-    #[inline]
-    fn from(input: EventMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<EventMode> for Option<u16> {
-    #[inline]
-    fn from(input: EventMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<EventMode> for u32 {
-    #[inline]
-    fn from(input: EventMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<EventMode> for Option<u32> {
-    #[inline]
-    fn from(input: EventMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(EventMode, u16, u32);
 impl From<u8> for EventMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -13870,30 +13518,7 @@ impl From<GrabMode22> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GrabMode22> for u16 {
-    #[inline]
-    fn from(input: GrabMode22) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GrabMode22> for Option<u16> {
-    #[inline]
-    fn from(input: GrabMode22) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GrabMode22> for u32 {
-    #[inline]
-    fn from(input: GrabMode22) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GrabMode22> for Option<u32> {
-    #[inline]
-    fn from(input: GrabMode22) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GrabMode22, u16, u32);
 impl From<u8> for GrabMode22 {
     #[inline]
     fn from(value: u8) -> Self {
@@ -13935,30 +13560,7 @@ impl From<GrabType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GrabType> for u16 {
-    #[inline]
-    fn from(input: GrabType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GrabType> for Option<u16> {
-    #[inline]
-    fn from(input: GrabType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GrabType> for u32 {
-    #[inline]
-    fn from(input: GrabType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GrabType> for Option<u32> {
-    #[inline]
-    fn from(input: GrabType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GrabType, u16, u32);
 impl From<u8> for GrabType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -14036,9 +13638,9 @@ pub struct GrabModifierInfo {
 impl_debug_if_no_extra_traits!(GrabModifierInfo, "GrabModifierInfo");
 impl TryParse for GrabModifierInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (modifiers, remaining) = u32::try_parse(remaining)?;
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let modifiers = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let status = fixed_bytes[4];
         let status = status.into();
         let result = GrabModifierInfo { modifiers, status };
         Ok((result, remaining))
@@ -15209,10 +14811,10 @@ pub struct BarrierReleasePointerInfo {
 impl_debug_if_no_extra_traits!(BarrierReleasePointerInfo, "BarrierReleasePointerInfo");
 impl TryParse for BarrierReleasePointerInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (barrier, remaining) = xfixes::Barrier::try_parse(remaining)?;
-        let (eventid, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let barrier = xfixes::Barrier::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let eventid = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = BarrierReleasePointerInfo { deviceid, barrier, eventid };
         Ok((result, remaining))
     }
@@ -15333,26 +14935,14 @@ impl_debug_if_no_extra_traits!(DeviceValuatorEvent, "DeviceValuatorEvent");
 impl TryParse for DeviceValuatorEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (device_state, remaining) = u16::try_parse(remaining)?;
-        let (num_valuators, remaining) = u8::try_parse(remaining)?;
-        let (first_valuator, remaining) = u8::try_parse(remaining)?;
-        let (valuators_0, remaining) = i32::try_parse(remaining)?;
-        let (valuators_1, remaining) = i32::try_parse(remaining)?;
-        let (valuators_2, remaining) = i32::try_parse(remaining)?;
-        let (valuators_3, remaining) = i32::try_parse(remaining)?;
-        let (valuators_4, remaining) = i32::try_parse(remaining)?;
-        let (valuators_5, remaining) = i32::try_parse(remaining)?;
-        let valuators = [
-            valuators_0,
-            valuators_1,
-            valuators_2,
-            valuators_3,
-            valuators_4,
-            valuators_5,
-        ];
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let device_id = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let device_state = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_valuators = fixed_bytes[6];
+        let first_valuator = fixed_bytes[7];
+        let (valuators, remaining) = crate::x11_utils::parse_array::<i32, 6>(remaining)?;
         let result = DeviceValuatorEvent { response_type, device_id, sequence, device_state, num_valuators, first_valuator, valuators };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -15495,30 +15085,7 @@ impl From<MoreEventsMask> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<MoreEventsMask> for u16 {
-    #[inline]
-    fn from(input: MoreEventsMask) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<MoreEventsMask> for Option<u16> {
-    #[inline]
-    fn from(input: MoreEventsMask) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<MoreEventsMask> for u32 {
-    #[inline]
-    fn from(input: MoreEventsMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<MoreEventsMask> for Option<u32> {
-    #[inline]
-    fn from(input: MoreEventsMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(MoreEventsMask, u16, u32);
 impl From<u8> for MoreEventsMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -15560,20 +15127,21 @@ impl_debug_if_no_extra_traits!(DeviceKeyPressEvent, "DeviceKeyPressEvent");
 impl TryParse for DeviceKeyPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = i16::try_parse(remaining)?;
-        let (root_y, remaining) = i16::try_parse(remaining)?;
-        let (event_x, remaining) = i16::try_parse(remaining)?;
-        let (event_y, remaining) = i16::try_parse(remaining)?;
-        let (state, remaining) = u16::try_parse(remaining)?;
-        let (same_screen, remaining) = bool::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root_x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let root_y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let event_x = i16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let event_y = i16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let state = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let same_screen = fixed_bytes[30] != 0;
+        let device_id = fixed_bytes[31];
         let state = state.into();
         let result = DeviceKeyPressEvent { response_type, detail, sequence, time, root, event, child, root_x, root_y, event_x, event_y, state, same_screen, device_id };
         let _ = remaining;
@@ -15744,14 +15312,14 @@ impl_debug_if_no_extra_traits!(DeviceFocusInEvent, "DeviceFocusInEvent");
 impl TryParse for DeviceFocusInEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(18..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let mode = fixed_bytes[12];
+        let device_id = fixed_bytes[13];
         let detail = detail.into();
         let mode = mode.into();
         let result = DeviceFocusInEvent { response_type, detail, sequence, time, window, mode, device_id };
@@ -15903,30 +15471,7 @@ impl From<ClassesReportedMask> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ClassesReportedMask> for u16 {
-    #[inline]
-    fn from(input: ClassesReportedMask) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ClassesReportedMask> for Option<u16> {
-    #[inline]
-    fn from(input: ClassesReportedMask) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ClassesReportedMask> for u32 {
-    #[inline]
-    fn from(input: ClassesReportedMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ClassesReportedMask> for Option<u32> {
-    #[inline]
-    fn from(input: ClassesReportedMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ClassesReportedMask, u16, u32);
 impl From<u8> for ClassesReportedMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -15969,24 +15514,18 @@ impl_debug_if_no_extra_traits!(DeviceStateNotifyEvent, "DeviceStateNotifyEvent")
 impl TryParse for DeviceStateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (num_keys, remaining) = u8::try_parse(remaining)?;
-        let (num_buttons, remaining) = u8::try_parse(remaining)?;
-        let (num_valuators, remaining) = u8::try_parse(remaining)?;
-        let (classes_reported, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let device_id = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let num_keys = fixed_bytes[8];
+        let num_buttons = fixed_bytes[9];
+        let num_valuators = fixed_bytes[10];
+        let classes_reported = fixed_bytes[11];
         let (buttons, remaining) = crate::x11_utils::parse_u8_array::<4>(remaining)?;
         let (keys, remaining) = crate::x11_utils::parse_u8_array::<4>(remaining)?;
-        let (valuators_0, remaining) = u32::try_parse(remaining)?;
-        let (valuators_1, remaining) = u32::try_parse(remaining)?;
-        let (valuators_2, remaining) = u32::try_parse(remaining)?;
-        let valuators = [
-            valuators_0,
-            valuators_1,
-            valuators_2,
-        ];
+        let (valuators, remaining) = crate::x11_utils::parse_array::<u32, 3>(remaining)?;
         let classes_reported = classes_reported.into();
         let result = DeviceStateNotifyEvent { response_type, device_id, sequence, time, num_keys, num_buttons, num_valuators, classes_reported, buttons, keys, valuators };
         let _ = remaining;
@@ -16132,15 +15671,14 @@ impl_debug_if_no_extra_traits!(DeviceMappingNotifyEvent, "DeviceMappingNotifyEve
 impl TryParse for DeviceMappingNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (request, remaining) = u8::try_parse(remaining)?;
-        let (first_keycode, remaining) = KeyCode::try_parse(remaining)?;
-        let (count, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let remaining = remaining.get(20..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let device_id = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let request = fixed_bytes[4];
+        let first_keycode = fixed_bytes[5];
+        let count = fixed_bytes[6];
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let request = request.into();
         let result = DeviceMappingNotifyEvent { response_type, device_id, sequence, request, first_keycode, count, time };
         let _ = remaining;
@@ -16277,30 +15815,7 @@ impl From<ChangeDevice> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ChangeDevice> for u16 {
-    #[inline]
-    fn from(input: ChangeDevice) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ChangeDevice> for Option<u16> {
-    #[inline]
-    fn from(input: ChangeDevice) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ChangeDevice> for u32 {
-    #[inline]
-    fn from(input: ChangeDevice) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ChangeDevice> for Option<u32> {
-    #[inline]
-    fn from(input: ChangeDevice) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ChangeDevice, u16, u32);
 impl From<u8> for ChangeDevice {
     #[inline]
     fn from(value: u8) -> Self {
@@ -16333,12 +15848,12 @@ impl_debug_if_no_extra_traits!(ChangeDeviceNotifyEvent, "ChangeDeviceNotifyEvent
 impl TryParse for ChangeDeviceNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (request, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(23..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let device_id = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let request = fixed_bytes[8];
         let request = request.into();
         let result = ChangeDeviceNotifyEvent { response_type, device_id, sequence, time, request };
         let _ = remaining;
@@ -16464,9 +15979,10 @@ impl_debug_if_no_extra_traits!(DeviceKeyStateNotifyEvent, "DeviceKeyStateNotifyE
 impl TryParse for DeviceKeyStateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let device_id = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (keys, remaining) = crate::x11_utils::parse_u8_array::<28>(remaining)?;
         let result = DeviceKeyStateNotifyEvent { response_type, device_id, sequence, keys };
         let _ = remaining;
@@ -16586,9 +16102,10 @@ impl_debug_if_no_extra_traits!(DeviceButtonStateNotifyEvent, "DeviceButtonStateN
 impl TryParse for DeviceButtonStateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let device_id = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (buttons, remaining) = crate::x11_utils::parse_u8_array::<28>(remaining)?;
         let result = DeviceButtonStateNotifyEvent { response_type, device_id, sequence, buttons };
         let _ = remaining;
@@ -16716,30 +16233,7 @@ impl From<DeviceChange> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<DeviceChange> for u16 {
-    #[inline]
-    fn from(input: DeviceChange) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<DeviceChange> for Option<u16> {
-    #[inline]
-    fn from(input: DeviceChange) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<DeviceChange> for u32 {
-    #[inline]
-    fn from(input: DeviceChange) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DeviceChange> for Option<u32> {
-    #[inline]
-    fn from(input: DeviceChange) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DeviceChange, u16, u32);
 impl From<u8> for DeviceChange {
     #[inline]
     fn from(value: u8) -> Self {
@@ -16777,14 +16271,13 @@ impl_debug_if_no_extra_traits!(DevicePresenceNotifyEvent, "DevicePresenceNotifyE
 impl TryParse for DevicePresenceNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (devchange, remaining) = u8::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (control, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(20..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let devchange = fixed_bytes[8];
+        let device_id = fixed_bytes[9];
+        let control = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let devchange = devchange.into();
         let result = DevicePresenceNotifyEvent { response_type, sequence, time, devchange, device_id, control };
         let _ = remaining;
@@ -16916,13 +16409,13 @@ impl_debug_if_no_extra_traits!(DevicePropertyNotifyEvent, "DevicePropertyNotifyE
 impl TryParse for DevicePropertyNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (state, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (property, remaining) = xproto::Atom::try_parse(remaining)?;
-        let remaining = remaining.get(19..).ok_or(ParseError::InsufficientData)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let state = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let property = xproto::Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let device_id = fixed_bytes[31];
         let state = state.into();
         let result = DevicePropertyNotifyEvent { response_type, state, sequence, time, property, device_id };
         let _ = remaining;
@@ -17055,30 +16548,7 @@ impl From<ChangeReason> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ChangeReason> for u16 {
-    #[inline]
-    fn from(input: ChangeReason) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ChangeReason> for Option<u16> {
-    #[inline]
-    fn from(input: ChangeReason) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ChangeReason> for u32 {
-    #[inline]
-    fn from(input: ChangeReason) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ChangeReason> for Option<u32> {
-    #[inline]
-    fn from(input: ChangeReason) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ChangeReason, u16, u32);
 impl From<u8> for ChangeReason {
     #[inline]
     fn from(value: u8) -> Self {
@@ -17116,17 +16586,17 @@ impl_debug_if_no_extra_traits!(DeviceChangedEvent, "DeviceChangedEvent");
 impl TryParse for DeviceChangedEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (num_classes, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (reason, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(11..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let num_classes = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let reason = fixed_bytes[20];
         let (classes, remaining) = crate::x11_utils::parse_list::<DeviceClass>(remaining, num_classes.try_to_usize()?)?;
         let reason = reason.into();
         let result = DeviceChangedEvent { response_type, extension, sequence, length, event_type, deviceid, time, sourceid, reason, classes };
@@ -17255,26 +16725,26 @@ impl_debug_if_no_extra_traits!(KeyPressEvent, "KeyPressEvent");
 impl TryParse for KeyPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (buttons_len, remaining) = u16::try_parse(remaining)?;
-        let (valuators_len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<60>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let event_x = Fp1616::from_ne_bytes([fixed_bytes[40], fixed_bytes[41], fixed_bytes[42], fixed_bytes[43]]);
+        let event_y = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let buttons_len = u16::from_ne_bytes([fixed_bytes[48], fixed_bytes[49]]);
+        let valuators_len = u16::from_ne_bytes([fixed_bytes[50], fixed_bytes[51]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[52], fixed_bytes[53]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[56], fixed_bytes[57], fixed_bytes[58], fixed_bytes[59]]);
         let (mods, remaining) = ModifierInfo::try_parse(remaining)?;
         let (group, remaining) = GroupInfo::try_parse(remaining)?;
         let (button_mask, remaining) = crate::x11_utils::parse_list::<u32>(remaining, buttons_len.try_to_usize()?)?;
@@ -17439,26 +16909,26 @@ impl_debug_if_no_extra_traits!(ButtonPressEvent, "ButtonPressEvent");
 impl TryParse for ButtonPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (buttons_len, remaining) = u16::try_parse(remaining)?;
-        let (valuators_len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<60>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let event_x = Fp1616::from_ne_bytes([fixed_bytes[40], fixed_bytes[41], fixed_bytes[42], fixed_bytes[43]]);
+        let event_y = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let buttons_len = u16::from_ne_bytes([fixed_bytes[48], fixed_bytes[49]]);
+        let valuators_len = u16::from_ne_bytes([fixed_bytes[50], fixed_bytes[51]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[52], fixed_bytes[53]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[56], fixed_bytes[57], fixed_bytes[58], fixed_bytes[59]]);
         let (mods, remaining) = ModifierInfo::try_parse(remaining)?;
         let (group, remaining) = GroupInfo::try_parse(remaining)?;
         let (button_mask, remaining) = crate::x11_utils::parse_list::<u32>(remaining, buttons_len.try_to_usize()?)?;
@@ -17571,30 +17041,7 @@ impl From<NotifyMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<NotifyMode> for u16 {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<NotifyMode> for Option<u16> {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<NotifyMode> for u32 {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<NotifyMode> for Option<u32> {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(NotifyMode, u16, u32);
 impl From<u8> for NotifyMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -17640,30 +17087,7 @@ impl From<NotifyDetail> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<NotifyDetail> for u16 {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<NotifyDetail> for Option<u16> {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<NotifyDetail> for u32 {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<NotifyDetail> for Option<u32> {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(NotifyDetail, u16, u32);
 impl From<u8> for NotifyDetail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -17719,26 +17143,27 @@ impl_debug_if_no_extra_traits!(EnterEvent, "EnterEvent");
 impl TryParse for EnterEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (same_screen, remaining) = bool::try_parse(remaining)?;
-        let (focus, remaining) = bool::try_parse(remaining)?;
-        let (buttons_len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<52>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let mode = fixed_bytes[18];
+        let detail = fixed_bytes[19];
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let event_x = Fp1616::from_ne_bytes([fixed_bytes[40], fixed_bytes[41], fixed_bytes[42], fixed_bytes[43]]);
+        let event_y = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let same_screen = fixed_bytes[48] != 0;
+        let focus = fixed_bytes[49] != 0;
+        let buttons_len = u16::from_ne_bytes([fixed_bytes[50], fixed_bytes[51]]);
         let (mods, remaining) = ModifierInfo::try_parse(remaining)?;
         let (group, remaining) = GroupInfo::try_parse(remaining)?;
         let (buttons, remaining) = crate::x11_utils::parse_list::<u32>(remaining, buttons_len.try_to_usize()?)?;
@@ -17887,12 +17312,12 @@ pub struct HierarchyInfo {
 impl_debug_if_no_extra_traits!(HierarchyInfo, "HierarchyInfo");
 impl TryParse for HierarchyInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (attachment, remaining) = DeviceId::try_parse(remaining)?;
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (enabled, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let attachment = DeviceId::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let type_ = fixed_bytes[4];
+        let enabled = fixed_bytes[5] != 0;
+        let flags = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let type_ = type_.into();
         let flags = flags.into();
         let result = HierarchyInfo { deviceid, attachment, type_, enabled, flags };
@@ -17953,16 +17378,16 @@ impl_debug_if_no_extra_traits!(HierarchyEvent, "HierarchyEvent");
 impl TryParse for HierarchyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let (num_infos, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(10..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let num_infos = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
         let (infos, remaining) = crate::x11_utils::parse_list::<HierarchyInfo>(remaining, num_infos.try_to_usize()?)?;
         let flags = flags.into();
         let result = HierarchyEvent { response_type, extension, sequence, length, event_type, deviceid, time, flags, infos };
@@ -18031,30 +17456,7 @@ impl From<PropertyFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PropertyFlag> for u16 {
-    #[inline]
-    fn from(input: PropertyFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PropertyFlag> for Option<u16> {
-    #[inline]
-    fn from(input: PropertyFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PropertyFlag> for u32 {
-    #[inline]
-    fn from(input: PropertyFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PropertyFlag> for Option<u32> {
-    #[inline]
-    fn from(input: PropertyFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PropertyFlag, u16, u32);
 impl From<u8> for PropertyFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -18092,16 +17494,16 @@ impl_debug_if_no_extra_traits!(PropertyEvent, "PropertyEvent");
 impl TryParse for PropertyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (property, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (what, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(11..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let property = xproto::Atom::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let what = fixed_bytes[20];
         let what = what.into();
         let result = PropertyEvent { response_type, extension, sequence, length, event_type, deviceid, time, property, what };
         let _ = remaining;
@@ -18196,18 +17598,18 @@ impl_debug_if_no_extra_traits!(RawKeyPressEvent, "RawKeyPressEvent");
 impl TryParse for RawKeyPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (valuators_len, remaining) = u16::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let valuators_len = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let (valuator_mask, remaining) = crate::x11_utils::parse_list::<u32>(remaining, valuators_len.try_to_usize()?)?;
         let (axisvalues, remaining) = crate::x11_utils::parse_list::<Fp3232>(remaining, valuator_mask.iter().try_fold(0u32, |acc, x| acc.checked_add(u32::from(*x).count_ones()).ok_or(ParseError::InvalidExpression))?.try_to_usize()?)?;
         let (axisvalues_raw, remaining) = crate::x11_utils::parse_list::<Fp3232>(remaining, valuator_mask.iter().try_fold(0u32, |acc, x| acc.checked_add(u32::from(*x).count_ones()).ok_or(ParseError::InvalidExpression))?.try_to_usize()?)?;
@@ -18292,18 +17694,18 @@ impl_debug_if_no_extra_traits!(RawButtonPressEvent, "RawButtonPressEvent");
 impl TryParse for RawButtonPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (valuators_len, remaining) = u16::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let valuators_len = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let (valuator_mask, remaining) = crate::x11_utils::parse_list::<u32>(remaining, valuators_len.try_to_usize()?)?;
         let (axisvalues, remaining) = crate::x11_utils::parse_list::<Fp3232>(remaining, valuator_mask.iter().try_fold(0u32, |acc, x| acc.checked_add(u32::from(*x).count_ones()).ok_or(ParseError::InvalidExpression))?.try_to_usize()?)?;
         let (axisvalues_raw, remaining) = crate::x11_utils::parse_list::<Fp3232>(remaining, valuator_mask.iter().try_fold(0u32, |acc, x| acc.checked_add(u32::from(*x).count_ones()).ok_or(ParseError::InvalidExpression))?.try_to_usize()?)?;
@@ -18449,26 +17851,26 @@ impl_debug_if_no_extra_traits!(TouchBeginEvent, "TouchBeginEvent");
 impl TryParse for TouchBeginEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (buttons_len, remaining) = u16::try_parse(remaining)?;
-        let (valuators_len, remaining) = u16::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<60>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let event_x = Fp1616::from_ne_bytes([fixed_bytes[40], fixed_bytes[41], fixed_bytes[42], fixed_bytes[43]]);
+        let event_y = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let buttons_len = u16::from_ne_bytes([fixed_bytes[48], fixed_bytes[49]]);
+        let valuators_len = u16::from_ne_bytes([fixed_bytes[50], fixed_bytes[51]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[52], fixed_bytes[53]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[56], fixed_bytes[57], fixed_bytes[58], fixed_bytes[59]]);
         let (mods, remaining) = ModifierInfo::try_parse(remaining)?;
         let (group, remaining) = GroupInfo::try_parse(remaining)?;
         let (button_mask, remaining) = crate::x11_utils::parse_list::<u32>(remaining, buttons_len.try_to_usize()?)?;
@@ -18627,21 +18029,20 @@ impl_debug_if_no_extra_traits!(TouchOwnershipEvent, "TouchOwnershipEvent");
 impl TryParse for TouchOwnershipEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (touchid, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(8..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<48>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let touchid = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[32], fixed_bytes[33]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
         let flags = flags.into();
         let result = TouchOwnershipEvent { response_type, extension, sequence, length, event_type, deviceid, time, touchid, root, event, child, sourceid, flags };
         let _ = remaining;
@@ -18761,18 +18162,18 @@ impl_debug_if_no_extra_traits!(RawTouchBeginEvent, "RawTouchBeginEvent");
 impl TryParse for RawTouchBeginEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (valuators_len, remaining) = u16::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let valuators_len = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let (valuator_mask, remaining) = crate::x11_utils::parse_list::<u32>(remaining, valuators_len.try_to_usize()?)?;
         let (axisvalues, remaining) = crate::x11_utils::parse_list::<Fp3232>(remaining, valuator_mask.iter().try_fold(0u32, |acc, x| acc.checked_add(u32::from(*x).count_ones()).ok_or(ParseError::InvalidExpression))?.try_to_usize()?)?;
         let (axisvalues_raw, remaining) = crate::x11_utils::parse_list::<Fp3232>(remaining, valuator_mask.iter().try_fold(0u32, |acc, x| acc.checked_add(u32::from(*x).count_ones()).ok_or(ParseError::InvalidExpression))?.try_to_usize()?)?;
@@ -18914,23 +18315,23 @@ impl_debug_if_no_extra_traits!(BarrierHitEvent, "BarrierHitEvent");
 impl TryParse for BarrierHitEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (eventid, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (barrier, remaining) = xfixes::Barrier::try_parse(remaining)?;
-        let (dtime, remaining) = u32::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<52>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let eventid = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let barrier = xfixes::Barrier::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let dtime = u32::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[40], fixed_bytes[41]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[48], fixed_bytes[49], fixed_bytes[50], fixed_bytes[51]]);
         let (dx, remaining) = Fp3232::try_parse(remaining)?;
         let (dy, remaining) = Fp3232::try_parse(remaining)?;
         let flags = flags.into();
@@ -19143,29 +18544,29 @@ impl_debug_if_no_extra_traits!(GesturePinchBeginEvent, "GesturePinchBeginEvent")
 impl TryParse for GesturePinchBeginEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_unaccel_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_unaccel_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (scale, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_angle, remaining) = Fp1616::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<76>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let event_x = Fp1616::from_ne_bytes([fixed_bytes[40], fixed_bytes[41], fixed_bytes[42], fixed_bytes[43]]);
+        let event_y = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let delta_x = Fp1616::from_ne_bytes([fixed_bytes[48], fixed_bytes[49], fixed_bytes[50], fixed_bytes[51]]);
+        let delta_y = Fp1616::from_ne_bytes([fixed_bytes[52], fixed_bytes[53], fixed_bytes[54], fixed_bytes[55]]);
+        let delta_unaccel_x = Fp1616::from_ne_bytes([fixed_bytes[56], fixed_bytes[57], fixed_bytes[58], fixed_bytes[59]]);
+        let delta_unaccel_y = Fp1616::from_ne_bytes([fixed_bytes[60], fixed_bytes[61], fixed_bytes[62], fixed_bytes[63]]);
+        let scale = Fp1616::from_ne_bytes([fixed_bytes[64], fixed_bytes[65], fixed_bytes[66], fixed_bytes[67]]);
+        let delta_angle = Fp1616::from_ne_bytes([fixed_bytes[68], fixed_bytes[69], fixed_bytes[70], fixed_bytes[71]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[72], fixed_bytes[73]]);
         let (mods, remaining) = ModifierInfo::try_parse(remaining)?;
         let (group, remaining) = GroupInfo::try_parse(remaining)?;
         let (flags, remaining) = u32::try_parse(remaining)?;
@@ -19427,27 +18828,27 @@ impl_debug_if_no_extra_traits!(GestureSwipeBeginEvent, "GestureSwipeBeginEvent")
 impl TryParse for GestureSwipeBeginEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let (deviceid, remaining) = DeviceId::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (detail, remaining) = u32::try_parse(remaining)?;
-        let (root, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event, remaining) = xproto::Window::try_parse(remaining)?;
-        let (child, remaining) = xproto::Window::try_parse(remaining)?;
-        let (root_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (root_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (event_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_unaccel_x, remaining) = Fp1616::try_parse(remaining)?;
-        let (delta_unaccel_y, remaining) = Fp1616::try_parse(remaining)?;
-        let (sourceid, remaining) = DeviceId::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<68>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let deviceid = DeviceId::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let detail = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event = xproto::Window::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
+        let child = xproto::Window::from_ne_bytes([fixed_bytes[28], fixed_bytes[29], fixed_bytes[30], fixed_bytes[31]]);
+        let root_x = Fp1616::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let root_y = Fp1616::from_ne_bytes([fixed_bytes[36], fixed_bytes[37], fixed_bytes[38], fixed_bytes[39]]);
+        let event_x = Fp1616::from_ne_bytes([fixed_bytes[40], fixed_bytes[41], fixed_bytes[42], fixed_bytes[43]]);
+        let event_y = Fp1616::from_ne_bytes([fixed_bytes[44], fixed_bytes[45], fixed_bytes[46], fixed_bytes[47]]);
+        let delta_x = Fp1616::from_ne_bytes([fixed_bytes[48], fixed_bytes[49], fixed_bytes[50], fixed_bytes[51]]);
+        let delta_y = Fp1616::from_ne_bytes([fixed_bytes[52], fixed_bytes[53], fixed_bytes[54], fixed_bytes[55]]);
+        let delta_unaccel_x = Fp1616::from_ne_bytes([fixed_bytes[56], fixed_bytes[57], fixed_bytes[58], fixed_bytes[59]]);
+        let delta_unaccel_y = Fp1616::from_ne_bytes([fixed_bytes[60], fixed_bytes[61], fixed_bytes[62], fixed_bytes[63]]);
+        let sourceid = DeviceId::from_ne_bytes([fixed_bytes[64], fixed_bytes[65]]);
         let (mods, remaining) = ModifierInfo::try_parse(remaining)?;
         let (group, remaining) = GroupInfo::try_parse(remaining)?;
         let (flags, remaining) = u32::try_parse(remaining)?;
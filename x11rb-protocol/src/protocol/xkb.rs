@@ -56,30 +56,7 @@ impl From<Const> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Const> for u16 {
-    #[inline]
-    fn from(input: Const) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Const> for Option<u16> {
-    #[inline]
-    fn from(input: Const) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Const> for u32 {
-    #[inline]
-    fn from(input: Const) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Const> for Option<u32> {
-    #[inline]
-    fn from(input: Const) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Const, u16, u32);
 impl From<u8> for Const {
     #[inline]
     fn from(value: u8) -> Self {
@@ -126,18 +103,7 @@ impl From<EventType> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<EventType> for u32 {
-    #[inline]
-    fn from(input: EventType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<EventType> for Option<u32> {
-    #[inline]
-    fn from(input: EventType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(EventType, u32);
 impl From<u8> for EventType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -191,18 +157,7 @@ impl From<NKNDetail> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<NKNDetail> for u32 {
-    #[inline]
-    fn from(input: NKNDetail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<NKNDetail> for Option<u32> {
-    #[inline]
-    fn from(input: NKNDetail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(NKNDetail, u32);
 impl From<u8> for NKNDetail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -251,18 +206,7 @@ impl From<AXNDetail> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<AXNDetail> for u32 {
-    #[inline]
-    fn from(input: AXNDetail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<AXNDetail> for Option<u32> {
-    #[inline]
-    fn from(input: AXNDetail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(AXNDetail, u32);
 impl From<u8> for AXNDetail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -316,18 +260,7 @@ impl From<MapPart> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<MapPart> for u32 {
-    #[inline]
-    fn from(input: MapPart) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<MapPart> for Option<u32> {
-    #[inline]
-    fn from(input: MapPart) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(MapPart, u32);
 impl From<u8> for MapPart {
     #[inline]
     fn from(value: u8) -> Self {
@@ -376,18 +309,7 @@ impl From<SetMapFlags> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<SetMapFlags> for u32 {
-    #[inline]
-    fn from(input: SetMapFlags) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SetMapFlags> for Option<u32> {
-    #[inline]
-    fn from(input: SetMapFlags) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SetMapFlags, u32);
 impl From<u8> for SetMapFlags {
     #[inline]
     fn from(value: u8) -> Self {
@@ -442,18 +364,7 @@ impl From<StatePart> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<StatePart> for u32 {
-    #[inline]
-    fn from(input: StatePart) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<StatePart> for Option<u32> {
-    #[inline]
-    fn from(input: StatePart) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(StatePart, u32);
 impl From<u8> for StatePart {
     #[inline]
     fn from(value: u8) -> Self {
@@ -642,18 +553,7 @@ impl From<AXOption> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<AXOption> for u32 {
-    #[inline]
-    fn from(input: AXOption) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<AXOption> for Option<u32> {
-    #[inline]
-    fn from(input: AXOption) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(AXOption, u32);
 impl From<u8> for AXOption {
     #[inline]
     fn from(value: u8) -> Self {
@@ -708,18 +608,7 @@ impl From<LedClassResult> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<LedClassResult> for u32 {
-    #[inline]
-    fn from(input: LedClassResult) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<LedClassResult> for Option<u32> {
-    #[inline]
-    fn from(input: LedClassResult) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(LedClassResult, u32);
 impl From<u8> for LedClassResult {
     #[inline]
     fn from(value: u8) -> Self {
@@ -763,18 +652,7 @@ impl From<LedClass> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<LedClass> for u32 {
-    #[inline]
-    fn from(input: LedClass) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<LedClass> for Option<u32> {
-    #[inline]
-    fn from(input: LedClass) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(LedClass, u32);
 impl From<u8> for LedClass {
     #[inline]
     fn from(value: u8) -> Self {
@@ -820,30 +698,7 @@ impl From<BellClassResult> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<BellClassResult> for u16 {
-    #[inline]
-    fn from(input: BellClassResult) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<BellClassResult> for Option<u16> {
-    #[inline]
-    fn from(input: BellClassResult) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<BellClassResult> for u32 {
-    #[inline]
-    fn from(input: BellClassResult) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<BellClassResult> for Option<u32> {
-    #[inline]
-    fn from(input: BellClassResult) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(BellClassResult, u16, u32);
 impl From<u8> for BellClassResult {
     #[inline]
     fn from(value: u8) -> Self {
@@ -880,18 +735,7 @@ impl From<BellClass> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<BellClass> for u32 {
-    #[inline]
-    fn from(input: BellClass) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<BellClass> for Option<u32> {
-    #[inline]
-    fn from(input: BellClass) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(BellClass, u32);
 impl From<u8> for BellClass {
     #[inline]
     fn from(value: u8) -> Self {
@@ -941,18 +785,7 @@ impl From<ID> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<ID> for u32 {
-    #[inline]
-    fn from(input: ID) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ID> for Option<u32> {
-    #[inline]
-    fn from(input: ID) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ID, u32);
 impl From<u8> for ID {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1003,30 +836,7 @@ impl From<Group> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Group> for u16 {
-    #[inline]
-    fn from(input: Group) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Group> for Option<u16> {
-    #[inline]
-    fn from(input: Group) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Group> for u32 {
-    #[inline]
-    fn from(input: Group) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Group> for Option<u32> {
-    #[inline]
-    fn from(input: Group) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Group, u16, u32);
 impl From<u8> for Group {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1064,30 +874,7 @@ impl From<Groups> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Groups> for u16 {
-    #[inline]
-    fn from(input: Groups) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Groups> for Option<u16> {
-    #[inline]
-    fn from(input: Groups) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Groups> for u32 {
-    #[inline]
-    fn from(input: Groups) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Groups> for Option<u32> {
-    #[inline]
-    fn from(input: Groups) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Groups, u16, u32);
 impl From<u8> for Groups {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1125,30 +912,7 @@ impl From<SetOfGroup> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SetOfGroup> for u16 {
-    #[inline]
-    fn from(input: SetOfGroup) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SetOfGroup> for Option<u16> {
-    #[inline]
-    fn from(input: SetOfGroup) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SetOfGroup> for u32 {
-    #[inline]
-    fn from(input: SetOfGroup) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SetOfGroup> for Option<u32> {
-    #[inline]
-    fn from(input: SetOfGroup) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SetOfGroup, u16, u32);
 impl From<u8> for SetOfGroup {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1186,30 +950,7 @@ impl From<SetOfGroups> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SetOfGroups> for u16 {
-    #[inline]
-    fn from(input: SetOfGroups) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SetOfGroups> for Option<u16> {
-    #[inline]
-    fn from(input: SetOfGroups) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SetOfGroups> for u32 {
-    #[inline]
-    fn from(input: SetOfGroups) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SetOfGroups> for Option<u32> {
-    #[inline]
-    fn from(input: SetOfGroups) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SetOfGroups, u16, u32);
 impl From<u8> for SetOfGroups {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1246,30 +987,7 @@ impl From<GroupsWrap> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GroupsWrap> for u16 {
-    #[inline]
-    fn from(input: GroupsWrap) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GroupsWrap> for Option<u16> {
-    #[inline]
-    fn from(input: GroupsWrap) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GroupsWrap> for u32 {
-    #[inline]
-    fn from(input: GroupsWrap) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GroupsWrap> for Option<u32> {
-    #[inline]
-    fn from(input: GroupsWrap) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GroupsWrap, u16, u32);
 impl From<u8> for GroupsWrap {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1313,30 +1031,7 @@ impl From<VModsHigh> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<VModsHigh> for u16 {
-    #[inline]
-    fn from(input: VModsHigh) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<VModsHigh> for Option<u16> {
-    #[inline]
-    fn from(input: VModsHigh) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<VModsHigh> for u32 {
-    #[inline]
-    fn from(input: VModsHigh) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<VModsHigh> for Option<u32> {
-    #[inline]
-    fn from(input: VModsHigh) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(VModsHigh, u16, u32);
 impl From<u8> for VModsHigh {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1385,30 +1080,7 @@ impl From<VModsLow> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<VModsLow> for u16 {
-    #[inline]
-    fn from(input: VModsLow) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<VModsLow> for Option<u16> {
-    #[inline]
-    fn from(input: VModsLow) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<VModsLow> for u32 {
-    #[inline]
-    fn from(input: VModsLow) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<VModsLow> for Option<u32> {
-    #[inline]
-    fn from(input: VModsLow) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(VModsLow, u16, u32);
 impl From<u8> for VModsLow {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1465,18 +1137,7 @@ impl From<VMod> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<VMod> for u32 {
-    #[inline]
-    fn from(input: VMod) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<VMod> for Option<u32> {
-    #[inline]
-    fn from(input: VMod) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(VMod, u32);
 impl From<u8> for VMod {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1539,30 +1200,7 @@ impl From<Explicit> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Explicit> for u16 {
-    #[inline]
-    fn from(input: Explicit) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Explicit> for Option<u16> {
-    #[inline]
-    fn from(input: Explicit) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Explicit> for u32 {
-    #[inline]
-    fn from(input: Explicit) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Explicit> for Option<u32> {
-    #[inline]
-    fn from(input: Explicit) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Explicit, u16, u32);
 impl From<u8> for Explicit {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1608,30 +1246,7 @@ impl From<SymInterpretMatch> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SymInterpretMatch> for u16 {
-    #[inline]
-    fn from(input: SymInterpretMatch) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SymInterpretMatch> for Option<u16> {
-    #[inline]
-    fn from(input: SymInterpretMatch) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SymInterpretMatch> for u32 {
-    #[inline]
-    fn from(input: SymInterpretMatch) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SymInterpretMatch> for Option<u32> {
-    #[inline]
-    fn from(input: SymInterpretMatch) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SymInterpretMatch, u16, u32);
 impl From<u8> for SymInterpretMatch {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1670,30 +1285,7 @@ impl From<SymInterpMatch> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SymInterpMatch> for u16 {
-    #[inline]
-    fn from(input: SymInterpMatch) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SymInterpMatch> for Option<u16> {
-    #[inline]
-    fn from(input: SymInterpMatch) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SymInterpMatch> for u32 {
-    #[inline]
-    fn from(input: SymInterpMatch) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SymInterpMatch> for Option<u32> {
-    #[inline]
-    fn from(input: SymInterpMatch) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SymInterpMatch, u16, u32);
 impl From<u8> for SymInterpMatch {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1730,30 +1322,7 @@ impl From<IMFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<IMFlag> for u16 {
-    #[inline]
-    fn from(input: IMFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<IMFlag> for Option<u16> {
-    #[inline]
-    fn from(input: IMFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<IMFlag> for u32 {
-    #[inline]
-    fn from(input: IMFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<IMFlag> for Option<u32> {
-    #[inline]
-    fn from(input: IMFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(IMFlag, u16, u32);
 impl From<u8> for IMFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1794,30 +1363,7 @@ impl From<IMModsWhich> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<IMModsWhich> for u16 {
-    #[inline]
-    fn from(input: IMModsWhich) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<IMModsWhich> for Option<u16> {
-    #[inline]
-    fn from(input: IMModsWhich) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<IMModsWhich> for u32 {
-    #[inline]
-    fn from(input: IMModsWhich) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<IMModsWhich> for Option<u32> {
-    #[inline]
-    fn from(input: IMModsWhich) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(IMModsWhich, u16, u32);
 impl From<u8> for IMModsWhich {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1839,51 +1385,28 @@ impl core::fmt::Debug for IMModsWhich  {
 bitmask_binop!(IMModsWhich, u8);
 
 #[derive(Clone, Copy, Default, PartialEq, Eq, PartialOrd, Ord, Hash)]
-#[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
-pub struct IMGroupsWhich(u8);
-impl IMGroupsWhich {
-    pub const USE_COMPAT: Self = Self(1 << 4);
-    pub const USE_EFFECTIVE: Self = Self(1 << 3);
-    pub const USE_LOCKED: Self = Self(1 << 2);
-    pub const USE_LATCHED: Self = Self(1 << 1);
-    pub const USE_BASE: Self = Self(1 << 0);
-}
-impl From<IMGroupsWhich> for u8 {
-    #[inline]
-    fn from(input: IMGroupsWhich) -> Self {
-        input.0
-    }
-}
-impl From<IMGroupsWhich> for Option<u8> {
-    #[inline]
-    fn from(input: IMGroupsWhich) -> Self {
-        Some(input.0)
-    }
-}
-impl From<IMGroupsWhich> for u16 {
-    #[inline]
-    fn from(input: IMGroupsWhich) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<IMGroupsWhich> for Option<u16> {
-    #[inline]
-    fn from(input: IMGroupsWhich) -> Self {
-        Some(u16::from(input.0))
-    }
+#[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
+pub struct IMGroupsWhich(u8);
+impl IMGroupsWhich {
+    pub const USE_COMPAT: Self = Self(1 << 4);
+    pub const USE_EFFECTIVE: Self = Self(1 << 3);
+    pub const USE_LOCKED: Self = Self(1 << 2);
+    pub const USE_LATCHED: Self = Self(1 << 1);
+    pub const USE_BASE: Self = Self(1 << 0);
 }
-impl From<IMGroupsWhich> for u32 {
+impl From<IMGroupsWhich> for u8 {
     #[inline]
     fn from(input: IMGroupsWhich) -> Self {
-        u32::from(input.0)
+        input.0
     }
 }
-impl From<IMGroupsWhich> for Option<u32> {
+impl From<IMGroupsWhich> for Option<u8> {
     #[inline]
     fn from(input: IMGroupsWhich) -> Self {
-        Some(u32::from(input.0))
+        Some(input.0)
     }
 }
+enum_into_larger!(IMGroupsWhich, u16, u32);
 impl From<u8> for IMGroupsWhich {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1920,14 +1443,15 @@ pub struct IndicatorMap {
 impl_debug_if_no_extra_traits!(IndicatorMap, "IndicatorMap");
 impl TryParse for IndicatorMap {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (which_groups, remaining) = u8::try_parse(remaining)?;
-        let (groups, remaining) = u8::try_parse(remaining)?;
-        let (which_mods, remaining) = u8::try_parse(remaining)?;
-        let (mods, remaining) = u8::try_parse(remaining)?;
-        let (real_mods, remaining) = u8::try_parse(remaining)?;
-        let (vmods, remaining) = u16::try_parse(remaining)?;
-        let (ctrls, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let flags = fixed_bytes[0];
+        let which_groups = fixed_bytes[1];
+        let groups = fixed_bytes[2];
+        let which_mods = fixed_bytes[3];
+        let mods = fixed_bytes[4];
+        let real_mods = fixed_bytes[5];
+        let vmods = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let ctrls = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let flags = flags.into();
         let which_groups = which_groups.into();
         let groups = groups.into();
@@ -1998,30 +1522,7 @@ impl From<CMDetail> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<CMDetail> for u16 {
-    #[inline]
-    fn from(input: CMDetail) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CMDetail> for Option<u16> {
-    #[inline]
-    fn from(input: CMDetail) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CMDetail> for u32 {
-    #[inline]
-    fn from(input: CMDetail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CMDetail> for Option<u32> {
-    #[inline]
-    fn from(input: CMDetail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CMDetail, u16, u32);
 impl From<u8> for CMDetail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2136,18 +1637,7 @@ impl From<GBNDetail> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<GBNDetail> for u32 {
-    #[inline]
-    fn from(input: GBNDetail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GBNDetail> for Option<u32> {
-    #[inline]
-    fn from(input: GBNDetail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GBNDetail, u32);
 impl From<u8> for GBNDetail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2199,18 +1689,7 @@ impl From<XIFeature> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<XIFeature> for u32 {
-    #[inline]
-    fn from(input: XIFeature) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<XIFeature> for Option<u32> {
-    #[inline]
-    fn from(input: XIFeature) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(XIFeature, u32);
 impl From<u8> for XIFeature {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2302,9 +1781,10 @@ pub struct ModDef {
 impl_debug_if_no_extra_traits!(ModDef, "ModDef");
 impl TryParse for ModDef {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (mask, remaining) = u8::try_parse(remaining)?;
-        let (real_mods, remaining) = u8::try_parse(remaining)?;
-        let (vmods, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let mask = fixed_bytes[0];
+        let real_mods = fixed_bytes[1];
+        let vmods = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let mask = mask.into();
         let real_mods = real_mods.into();
         let vmods = vmods.into();
@@ -2463,12 +1943,12 @@ pub struct KTMapEntry {
 impl_debug_if_no_extra_traits!(KTMapEntry, "KTMapEntry");
 impl TryParse for KTMapEntry {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (active, remaining) = bool::try_parse(remaining)?;
-        let (mods_mask, remaining) = u8::try_parse(remaining)?;
-        let (level, remaining) = u8::try_parse(remaining)?;
-        let (mods_mods, remaining) = u8::try_parse(remaining)?;
-        let (mods_vmods, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let active = fixed_bytes[0] != 0;
+        let mods_mask = fixed_bytes[1];
+        let level = fixed_bytes[2];
+        let mods_mods = fixed_bytes[3];
+        let mods_vmods = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
         let mods_mask = mods_mask.into();
         let mods_mods = mods_mods.into();
         let mods_vmods = mods_vmods.into();
@@ -2521,13 +2001,13 @@ pub struct KeyType {
 impl_debug_if_no_extra_traits!(KeyType, "KeyType");
 impl TryParse for KeyType {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (mods_mask, remaining) = u8::try_parse(remaining)?;
-        let (mods_mods, remaining) = u8::try_parse(remaining)?;
-        let (mods_vmods, remaining) = u16::try_parse(remaining)?;
-        let (num_levels, remaining) = u8::try_parse(remaining)?;
-        let (n_map_entries, remaining) = u8::try_parse(remaining)?;
-        let (has_preserve, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let mods_mask = fixed_bytes[0];
+        let mods_mods = fixed_bytes[1];
+        let mods_vmods = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let num_levels = fixed_bytes[4];
+        let n_map_entries = fixed_bytes[5];
+        let has_preserve = fixed_bytes[6] != 0;
         let (map, remaining) = crate::x11_utils::parse_list::<KTMapEntry>(remaining, n_map_entries.try_to_usize()?)?;
         let (preserve, remaining) = crate::x11_utils::parse_list::<ModDef>(remaining, u32::from(has_preserve).checked_mul(u32::from(n_map_entries)).ok_or(ParseError::InvalidExpression)?.try_to_usize()?)?;
         let mods_mask = mods_mask.into();
@@ -2639,8 +2119,9 @@ pub struct CommonBehavior {
 impl_debug_if_no_extra_traits!(CommonBehavior, "CommonBehavior");
 impl TryParse for CommonBehavior {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (data, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let data = fixed_bytes[1];
         let result = CommonBehavior { type_, data };
         Ok((result, remaining))
     }
@@ -2705,8 +2186,9 @@ pub struct RadioGroupBehavior {
 impl_debug_if_no_extra_traits!(RadioGroupBehavior, "RadioGroupBehavior");
 impl TryParse for RadioGroupBehavior {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (group, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let group = fixed_bytes[1];
         let result = RadioGroupBehavior { type_, group };
         Ok((result, remaining))
     }
@@ -2738,8 +2220,9 @@ pub struct OverlayBehavior {
 impl_debug_if_no_extra_traits!(OverlayBehavior, "OverlayBehavior");
 impl TryParse for OverlayBehavior {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (key, remaining) = xproto::Keycode::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let key = fixed_bytes[1];
         let result = OverlayBehavior { type_, key };
         Ok((result, remaining))
     }
@@ -2940,30 +2423,7 @@ impl From<BehaviorType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<BehaviorType> for u16 {
-    #[inline]
-    fn from(input: BehaviorType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<BehaviorType> for Option<u16> {
-    #[inline]
-    fn from(input: BehaviorType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<BehaviorType> for u32 {
-    #[inline]
-    fn from(input: BehaviorType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<BehaviorType> for Option<u32> {
-    #[inline]
-    fn from(input: BehaviorType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(BehaviorType, u16, u32);
 impl From<u8> for BehaviorType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3034,8 +2494,9 @@ pub struct SetExplicit {
 impl_debug_if_no_extra_traits!(SetExplicit, "SetExplicit");
 impl TryParse for SetExplicit {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (explicit, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let keycode = fixed_bytes[0];
+        let explicit = fixed_bytes[1];
         let explicit = explicit.into();
         let result = SetExplicit { keycode, explicit };
         Ok((result, remaining))
@@ -3068,8 +2529,9 @@ pub struct KeyModMap {
 impl_debug_if_no_extra_traits!(KeyModMap, "KeyModMap");
 impl TryParse for KeyModMap {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (mods, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let keycode = fixed_bytes[0];
+        let mods = fixed_bytes[1];
         let mods = mods.into();
         let result = KeyModMap { keycode, mods };
         Ok((result, remaining))
@@ -3102,9 +2564,9 @@ pub struct KeyVModMap {
 impl_debug_if_no_extra_traits!(KeyVModMap, "KeyVModMap");
 impl TryParse for KeyVModMap {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (vmods, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let keycode = fixed_bytes[0];
+        let vmods = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let vmods = vmods.into();
         let result = KeyVModMap { keycode, vmods };
         Ok((result, remaining))
@@ -3141,9 +2603,10 @@ pub struct KTSetMapEntry {
 impl_debug_if_no_extra_traits!(KTSetMapEntry, "KTSetMapEntry");
 impl TryParse for KTSetMapEntry {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (level, remaining) = u8::try_parse(remaining)?;
-        let (real_mods, remaining) = u8::try_parse(remaining)?;
-        let (virtual_mods, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let level = fixed_bytes[0];
+        let real_mods = fixed_bytes[1];
+        let virtual_mods = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let real_mods = real_mods.into();
         let virtual_mods = virtual_mods.into();
         let result = KTSetMapEntry { level, real_mods, virtual_mods };
@@ -3186,13 +2649,13 @@ pub struct SetKeyType {
 impl_debug_if_no_extra_traits!(SetKeyType, "SetKeyType");
 impl TryParse for SetKeyType {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (mask, remaining) = u8::try_parse(remaining)?;
-        let (real_mods, remaining) = u8::try_parse(remaining)?;
-        let (virtual_mods, remaining) = u16::try_parse(remaining)?;
-        let (num_levels, remaining) = u8::try_parse(remaining)?;
-        let (n_map_entries, remaining) = u8::try_parse(remaining)?;
-        let (preserve, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let mask = fixed_bytes[0];
+        let real_mods = fixed_bytes[1];
+        let virtual_mods = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let num_levels = fixed_bytes[4];
+        let n_map_entries = fixed_bytes[5];
+        let preserve = fixed_bytes[6] != 0;
         let (entries, remaining) = crate::x11_utils::parse_list::<KTSetMapEntry>(remaining, n_map_entries.try_to_usize()?)?;
         let (preserve_entries, remaining) = crate::x11_utils::parse_list::<KTSetMapEntry>(remaining, u32::from(preserve).checked_mul(u32::from(n_map_entries)).ok_or(ParseError::InvalidExpression)?.try_to_usize()?)?;
         let mask = mask.into();
@@ -3252,9 +2715,9 @@ pub struct Outline {
 impl_debug_if_no_extra_traits!(Outline, "Outline");
 impl TryParse for Outline {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (n_points, remaining) = u8::try_parse(remaining)?;
-        let (corner_radius, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let n_points = fixed_bytes[0];
+        let corner_radius = fixed_bytes[1];
         let (points, remaining) = crate::x11_utils::parse_list::<xproto::Point>(remaining, n_points.try_to_usize()?)?;
         let result = Outline { corner_radius, points };
         Ok((result, remaining))
@@ -3304,11 +2767,11 @@ pub struct Shape {
 impl_debug_if_no_extra_traits!(Shape, "Shape");
 impl TryParse for Shape {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (n_outlines, remaining) = u8::try_parse(remaining)?;
-        let (primary_ndx, remaining) = u8::try_parse(remaining)?;
-        let (approx_ndx, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let n_outlines = fixed_bytes[4];
+        let primary_ndx = fixed_bytes[5];
+        let approx_ndx = fixed_bytes[6];
         let (outlines, remaining) = crate::x11_utils::parse_list::<Outline>(remaining, n_outlines.try_to_usize()?)?;
         let result = Shape { name, primary_ndx, approx_ndx, outlines };
         Ok((result, remaining))
@@ -3441,9 +2904,9 @@ pub struct OverlayRow {
 impl_debug_if_no_extra_traits!(OverlayRow, "OverlayRow");
 impl TryParse for OverlayRow {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (row_under, remaining) = u8::try_parse(remaining)?;
-        let (n_keys, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let row_under = fixed_bytes[0];
+        let n_keys = fixed_bytes[1];
         let (keys, remaining) = crate::x11_utils::parse_list::<OverlayKey>(remaining, n_keys.try_to_usize()?)?;
         let result = OverlayRow { row_under, keys };
         Ok((result, remaining))
@@ -3491,9 +2954,9 @@ pub struct Overlay {
 impl_debug_if_no_extra_traits!(Overlay, "Overlay");
 impl TryParse for Overlay {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (n_rows, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let n_rows = fixed_bytes[4];
         let (rows, remaining) = crate::x11_utils::parse_list::<OverlayRow>(remaining, n_rows.try_to_usize()?)?;
         let result = Overlay { name, rows };
         Ok((result, remaining))
@@ -3543,11 +3006,11 @@ pub struct Row {
 impl_debug_if_no_extra_traits!(Row, "Row");
 impl TryParse for Row {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (top, remaining) = i16::try_parse(remaining)?;
-        let (left, remaining) = i16::try_parse(remaining)?;
-        let (n_keys, remaining) = u8::try_parse(remaining)?;
-        let (vertical, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let top = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let left = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let n_keys = fixed_bytes[4];
+        let vertical = fixed_bytes[5] != 0;
         let (keys, remaining) = crate::x11_utils::parse_list::<Key>(remaining, n_keys.try_to_usize()?)?;
         let result = Row { top, left, vertical, keys };
         Ok((result, remaining))
@@ -3609,30 +3072,7 @@ impl From<DoodadType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<DoodadType> for u16 {
-    #[inline]
-    fn from(input: DoodadType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<DoodadType> for Option<u16> {
-    #[inline]
-    fn from(input: DoodadType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<DoodadType> for u32 {
-    #[inline]
-    fn from(input: DoodadType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<DoodadType> for Option<u32> {
-    #[inline]
-    fn from(input: DoodadType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(DoodadType, u16, u32);
 impl From<u8> for DoodadType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3663,8 +3103,9 @@ impl_debug_if_no_extra_traits!(Listing, "Listing");
 impl TryParse for Listing {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (flags, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let flags = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let length = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (string, remaining) = crate::x11_utils::parse_u8_list(remaining, length.try_to_usize()?)?;
         let string = string.to_vec();
         // Align offset to multiple of 2
@@ -3723,12 +3164,13 @@ pub struct DeviceLedInfo {
 impl_debug_if_no_extra_traits!(DeviceLedInfo, "DeviceLedInfo");
 impl TryParse for DeviceLedInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (led_class, remaining) = LedClassSpec::try_parse(remaining)?;
-        let (led_id, remaining) = IDSpec::try_parse(remaining)?;
-        let (names_present, remaining) = u32::try_parse(remaining)?;
-        let (maps_present, remaining) = u32::try_parse(remaining)?;
-        let (phys_indicators, remaining) = u32::try_parse(remaining)?;
-        let (state, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let led_class = LedClassSpec::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let led_id = IDSpec::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let names_present = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let maps_present = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let phys_indicators = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let state = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let (names, remaining) = crate::x11_utils::parse_list::<xproto::Atom>(remaining, u32::from(names_present).count_ones().try_to_usize()?)?;
         let (maps, remaining) = crate::x11_utils::parse_list::<IndicatorMap>(remaining, u32::from(maps_present).count_ones().try_to_usize()?)?;
         let led_class = led_class.into();
@@ -3778,30 +3220,7 @@ impl From<Error> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Error> for u16 {
-    #[inline]
-    fn from(input: Error) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Error> for Option<u16> {
-    #[inline]
-    fn from(input: Error) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Error> for u32 {
-    #[inline]
-    fn from(input: Error) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Error> for Option<u32> {
-    #[inline]
-    fn from(input: Error) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Error, u16, u32);
 impl From<u8> for Error {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3843,30 +3262,7 @@ impl From<SA> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SA> for u16 {
-    #[inline]
-    fn from(input: SA) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SA> for Option<u16> {
-    #[inline]
-    fn from(input: SA) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SA> for u32 {
-    #[inline]
-    fn from(input: SA) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SA> for Option<u32> {
-    #[inline]
-    fn from(input: SA) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SA, u16, u32);
 impl From<u8> for SA {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3924,30 +3320,7 @@ impl From<SAType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SAType> for u16 {
-    #[inline]
-    fn from(input: SAType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SAType> for Option<u16> {
-    #[inline]
-    fn from(input: SAType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SAType> for u32 {
-    #[inline]
-    fn from(input: SAType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SAType> for Option<u32> {
-    #[inline]
-    fn from(input: SAType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SAType, u16, u32);
 impl From<u8> for SAType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4035,13 +3408,13 @@ pub struct SASetMods {
 impl_debug_if_no_extra_traits!(SASetMods, "SASetMods");
 impl TryParse for SASetMods {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (mask, remaining) = u8::try_parse(remaining)?;
-        let (real_mods, remaining) = u8::try_parse(remaining)?;
-        let (vmods_high, remaining) = u8::try_parse(remaining)?;
-        let (vmods_low, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let mask = fixed_bytes[2];
+        let real_mods = fixed_bytes[3];
+        let vmods_high = fixed_bytes[4];
+        let vmods_low = fixed_bytes[5];
         let type_ = type_.into();
         let flags = flags.into();
         let mask = mask.into();
@@ -4099,10 +3472,10 @@ pub struct SASetGroup {
 impl_debug_if_no_extra_traits!(SASetGroup, "SASetGroup");
 impl TryParse for SASetGroup {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (group, remaining) = i8::try_parse(remaining)?;
-        let remaining = remaining.get(5..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let group = i8::from_ne_bytes([fixed_bytes[2]]);
         let type_ = type_.into();
         let flags = flags.into();
         let result = SASetGroup { type_, flags, group };
@@ -4159,30 +3532,7 @@ impl From<SAMovePtrFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SAMovePtrFlag> for u16 {
-    #[inline]
-    fn from(input: SAMovePtrFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SAMovePtrFlag> for Option<u16> {
-    #[inline]
-    fn from(input: SAMovePtrFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SAMovePtrFlag> for u32 {
-    #[inline]
-    fn from(input: SAMovePtrFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SAMovePtrFlag> for Option<u32> {
-    #[inline]
-    fn from(input: SAMovePtrFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SAMovePtrFlag, u16, u32);
 impl From<u8> for SAMovePtrFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4215,13 +3565,13 @@ pub struct SAMovePtr {
 impl_debug_if_no_extra_traits!(SAMovePtr, "SAMovePtr");
 impl TryParse for SAMovePtr {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (x_high, remaining) = i8::try_parse(remaining)?;
-        let (x_low, remaining) = u8::try_parse(remaining)?;
-        let (y_high, remaining) = i8::try_parse(remaining)?;
-        let (y_low, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let x_high = i8::from_ne_bytes([fixed_bytes[2]]);
+        let x_low = fixed_bytes[3];
+        let y_high = i8::from_ne_bytes([fixed_bytes[4]]);
+        let y_low = fixed_bytes[5];
         let type_ = type_.into();
         let flags = flags.into();
         let result = SAMovePtr { type_, flags, x_high, x_low, y_high, y_low };
@@ -4272,11 +3622,11 @@ pub struct SAPtrBtn {
 impl_debug_if_no_extra_traits!(SAPtrBtn, "SAPtrBtn");
 impl TryParse for SAPtrBtn {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (count, remaining) = u8::try_parse(remaining)?;
-        let (button, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let count = fixed_bytes[2];
+        let button = fixed_bytes[3];
         let type_ = type_.into();
         let result = SAPtrBtn { type_, flags, count, button };
         Ok((result, remaining))
@@ -4321,11 +3671,10 @@ pub struct SALockPtrBtn {
 impl_debug_if_no_extra_traits!(SALockPtrBtn, "SALockPtrBtn");
 impl TryParse for SALockPtrBtn {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (button, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let button = fixed_bytes[3];
         let type_ = type_.into();
         let result = SALockPtrBtn { type_, flags, button };
         Ok((result, remaining))
@@ -4377,30 +3726,7 @@ impl From<SASetPtrDfltFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SASetPtrDfltFlag> for u16 {
-    #[inline]
-    fn from(input: SASetPtrDfltFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SASetPtrDfltFlag> for Option<u16> {
-    #[inline]
-    fn from(input: SASetPtrDfltFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SASetPtrDfltFlag> for u32 {
-    #[inline]
-    fn from(input: SASetPtrDfltFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SASetPtrDfltFlag> for Option<u32> {
-    #[inline]
-    fn from(input: SASetPtrDfltFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SASetPtrDfltFlag, u16, u32);
 impl From<u8> for SASetPtrDfltFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4430,11 +3756,11 @@ pub struct SASetPtrDflt {
 impl_debug_if_no_extra_traits!(SASetPtrDflt, "SASetPtrDflt");
 impl TryParse for SASetPtrDflt {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (affect, remaining) = u8::try_parse(remaining)?;
-        let (value, remaining) = i8::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let affect = fixed_bytes[2];
+        let value = i8::from_ne_bytes([fixed_bytes[3]]);
         let type_ = type_.into();
         let flags = flags.into();
         let affect = affect.into();
@@ -4492,30 +3818,7 @@ impl From<SAIsoLockFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SAIsoLockFlag> for u16 {
-    #[inline]
-    fn from(input: SAIsoLockFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SAIsoLockFlag> for Option<u16> {
-    #[inline]
-    fn from(input: SAIsoLockFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SAIsoLockFlag> for u32 {
-    #[inline]
-    fn from(input: SAIsoLockFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SAIsoLockFlag> for Option<u32> {
-    #[inline]
-    fn from(input: SAIsoLockFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SAIsoLockFlag, u16, u32);
 impl From<u8> for SAIsoLockFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4557,30 +3860,7 @@ impl From<SAIsoLockNoAffect> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SAIsoLockNoAffect> for u16 {
-    #[inline]
-    fn from(input: SAIsoLockNoAffect) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SAIsoLockNoAffect> for Option<u16> {
-    #[inline]
-    fn from(input: SAIsoLockNoAffect) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SAIsoLockNoAffect> for u32 {
-    #[inline]
-    fn from(input: SAIsoLockNoAffect) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SAIsoLockNoAffect> for Option<u32> {
-    #[inline]
-    fn from(input: SAIsoLockNoAffect) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SAIsoLockNoAffect, u16, u32);
 impl From<u8> for SAIsoLockNoAffect {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4616,14 +3896,15 @@ pub struct SAIsoLock {
 impl_debug_if_no_extra_traits!(SAIsoLock, "SAIsoLock");
 impl TryParse for SAIsoLock {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (mask, remaining) = u8::try_parse(remaining)?;
-        let (real_mods, remaining) = u8::try_parse(remaining)?;
-        let (group, remaining) = i8::try_parse(remaining)?;
-        let (affect, remaining) = u8::try_parse(remaining)?;
-        let (vmods_high, remaining) = u8::try_parse(remaining)?;
-        let (vmods_low, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let mask = fixed_bytes[2];
+        let real_mods = fixed_bytes[3];
+        let group = i8::from_ne_bytes([fixed_bytes[4]]);
+        let affect = fixed_bytes[5];
+        let vmods_high = fixed_bytes[6];
+        let vmods_low = fixed_bytes[7];
         let type_ = type_.into();
         let flags = flags.into();
         let mask = mask.into();
@@ -4710,47 +3991,24 @@ impl Serialize for SATerminate {
 
 #[derive(Clone, Copy, Default, PartialEq, Eq, PartialOrd, Ord, Hash)]
 #[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
-pub struct SwitchScreenFlag(u8);
-impl SwitchScreenFlag {
-    pub const APPLICATION: Self = Self(1 << 0);
-    pub const ABSOLUTE: Self = Self(1 << 2);
-}
-impl From<SwitchScreenFlag> for u8 {
-    #[inline]
-    fn from(input: SwitchScreenFlag) -> Self {
-        input.0
-    }
-}
-impl From<SwitchScreenFlag> for Option<u8> {
-    #[inline]
-    fn from(input: SwitchScreenFlag) -> Self {
-        Some(input.0)
-    }
-}
-impl From<SwitchScreenFlag> for u16 {
-    #[inline]
-    fn from(input: SwitchScreenFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SwitchScreenFlag> for Option<u16> {
-    #[inline]
-    fn from(input: SwitchScreenFlag) -> Self {
-        Some(u16::from(input.0))
-    }
+pub struct SwitchScreenFlag(u8);
+impl SwitchScreenFlag {
+    pub const APPLICATION: Self = Self(1 << 0);
+    pub const ABSOLUTE: Self = Self(1 << 2);
 }
-impl From<SwitchScreenFlag> for u32 {
+impl From<SwitchScreenFlag> for u8 {
     #[inline]
     fn from(input: SwitchScreenFlag) -> Self {
-        u32::from(input.0)
+        input.0
     }
 }
-impl From<SwitchScreenFlag> for Option<u32> {
+impl From<SwitchScreenFlag> for Option<u8> {
     #[inline]
     fn from(input: SwitchScreenFlag) -> Self {
-        Some(u32::from(input.0))
+        Some(input.0)
     }
 }
+enum_into_larger!(SwitchScreenFlag, u16, u32);
 impl From<u8> for SwitchScreenFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4779,10 +4037,10 @@ pub struct SASwitchScreen {
 impl_debug_if_no_extra_traits!(SASwitchScreen, "SASwitchScreen");
 impl TryParse for SASwitchScreen {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (new_screen, remaining) = i8::try_parse(remaining)?;
-        let remaining = remaining.get(5..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let new_screen = i8::from_ne_bytes([fixed_bytes[2]]);
         let type_ = type_.into();
         let result = SASwitchScreen { type_, flags, new_screen };
         Ok((result, remaining))
@@ -4836,30 +4094,7 @@ impl From<BoolCtrlsHigh> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<BoolCtrlsHigh> for u16 {
-    #[inline]
-    fn from(input: BoolCtrlsHigh) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<BoolCtrlsHigh> for Option<u16> {
-    #[inline]
-    fn from(input: BoolCtrlsHigh) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<BoolCtrlsHigh> for u32 {
-    #[inline]
-    fn from(input: BoolCtrlsHigh) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<BoolCtrlsHigh> for Option<u32> {
-    #[inline]
-    fn from(input: BoolCtrlsHigh) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(BoolCtrlsHigh, u16, u32);
 impl From<u8> for BoolCtrlsHigh {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4905,30 +4140,7 @@ impl From<BoolCtrlsLow> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<BoolCtrlsLow> for u16 {
-    #[inline]
-    fn from(input: BoolCtrlsLow) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<BoolCtrlsLow> for Option<u16> {
-    #[inline]
-    fn from(input: BoolCtrlsLow) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<BoolCtrlsLow> for u32 {
-    #[inline]
-    fn from(input: BoolCtrlsLow) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<BoolCtrlsLow> for Option<u32> {
-    #[inline]
-    fn from(input: BoolCtrlsLow) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(BoolCtrlsLow, u16, u32);
 impl From<u8> for BoolCtrlsLow {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4963,11 +4175,10 @@ pub struct SASetControls {
 impl_debug_if_no_extra_traits!(SASetControls, "SASetControls");
 impl TryParse for SASetControls {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (bool_ctrls_high, remaining) = u8::try_parse(remaining)?;
-        let (bool_ctrls_low, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let bool_ctrls_high = fixed_bytes[4];
+        let bool_ctrls_low = fixed_bytes[5];
         let type_ = type_.into();
         let bool_ctrls_high = bool_ctrls_high.into();
         let bool_ctrls_low = bool_ctrls_low.into();
@@ -5024,30 +4235,7 @@ impl From<ActionMessageFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ActionMessageFlag> for u16 {
-    #[inline]
-    fn from(input: ActionMessageFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ActionMessageFlag> for Option<u16> {
-    #[inline]
-    fn from(input: ActionMessageFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ActionMessageFlag> for u32 {
-    #[inline]
-    fn from(input: ActionMessageFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ActionMessageFlag> for Option<u32> {
-    #[inline]
-    fn from(input: ActionMessageFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ActionMessageFlag, u16, u32);
 impl From<u8> for ActionMessageFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5077,8 +4265,9 @@ pub struct SAActionMessage {
 impl_debug_if_no_extra_traits!(SAActionMessage, "SAActionMessage");
 impl TryParse for SAActionMessage {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
         let (message, remaining) = crate::x11_utils::parse_u8_array::<6>(remaining)?;
         let type_ = type_.into();
         let flags = flags.into();
@@ -5126,14 +4315,15 @@ pub struct SARedirectKey {
 impl_debug_if_no_extra_traits!(SARedirectKey, "SARedirectKey");
 impl TryParse for SARedirectKey {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (newkey, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (mask, remaining) = u8::try_parse(remaining)?;
-        let (real_modifiers, remaining) = u8::try_parse(remaining)?;
-        let (vmods_mask_high, remaining) = u8::try_parse(remaining)?;
-        let (vmods_mask_low, remaining) = u8::try_parse(remaining)?;
-        let (vmods_high, remaining) = u8::try_parse(remaining)?;
-        let (vmods_low, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let newkey = fixed_bytes[1];
+        let mask = fixed_bytes[2];
+        let real_modifiers = fixed_bytes[3];
+        let vmods_mask_high = fixed_bytes[4];
+        let vmods_mask_low = fixed_bytes[5];
+        let vmods_high = fixed_bytes[6];
+        let vmods_low = fixed_bytes[7];
         let type_ = type_.into();
         let mask = mask.into();
         let real_modifiers = real_modifiers.into();
@@ -5193,12 +4383,12 @@ pub struct SADeviceBtn {
 impl_debug_if_no_extra_traits!(SADeviceBtn, "SADeviceBtn");
 impl TryParse for SADeviceBtn {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let (count, remaining) = u8::try_parse(remaining)?;
-        let (button, remaining) = u8::try_parse(remaining)?;
-        let (device, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let count = fixed_bytes[2];
+        let button = fixed_bytes[3];
+        let device = fixed_bytes[4];
         let type_ = type_.into();
         let result = SADeviceBtn { type_, flags, count, button, device };
         Ok((result, remaining))
@@ -5253,30 +4443,7 @@ impl From<LockDeviceFlags> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<LockDeviceFlags> for u16 {
-    #[inline]
-    fn from(input: LockDeviceFlags) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<LockDeviceFlags> for Option<u16> {
-    #[inline]
-    fn from(input: LockDeviceFlags) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<LockDeviceFlags> for u32 {
-    #[inline]
-    fn from(input: LockDeviceFlags) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<LockDeviceFlags> for Option<u32> {
-    #[inline]
-    fn from(input: LockDeviceFlags) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(LockDeviceFlags, u16, u32);
 impl From<u8> for LockDeviceFlags {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5306,12 +4473,11 @@ pub struct SALockDeviceBtn {
 impl_debug_if_no_extra_traits!(SALockDeviceBtn, "SALockDeviceBtn");
 impl TryParse for SALockDeviceBtn {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (button, remaining) = u8::try_parse(remaining)?;
-        let (device, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let flags = fixed_bytes[1];
+        let button = fixed_bytes[3];
+        let device = fixed_bytes[4];
         let type_ = type_.into();
         let flags = flags.into();
         let result = SALockDeviceBtn { type_, flags, button, device };
@@ -5370,30 +4536,7 @@ impl From<SAValWhat> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SAValWhat> for u16 {
-    #[inline]
-    fn from(input: SAValWhat) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SAValWhat> for Option<u16> {
-    #[inline]
-    fn from(input: SAValWhat) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SAValWhat> for u32 {
-    #[inline]
-    fn from(input: SAValWhat) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SAValWhat> for Option<u32> {
-    #[inline]
-    fn from(input: SAValWhat) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SAValWhat, u16, u32);
 impl From<u8> for SAValWhat {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5430,14 +4573,15 @@ pub struct SADeviceValuator {
 impl_debug_if_no_extra_traits!(SADeviceValuator, "SADeviceValuator");
 impl TryParse for SADeviceValuator {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (device, remaining) = u8::try_parse(remaining)?;
-        let (val1what, remaining) = u8::try_parse(remaining)?;
-        let (val1index, remaining) = u8::try_parse(remaining)?;
-        let (val1value, remaining) = u8::try_parse(remaining)?;
-        let (val2what, remaining) = u8::try_parse(remaining)?;
-        let (val2index, remaining) = u8::try_parse(remaining)?;
-        let (val2value, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let type_ = fixed_bytes[0];
+        let device = fixed_bytes[1];
+        let val1what = fixed_bytes[2];
+        let val1index = fixed_bytes[3];
+        let val1value = fixed_bytes[4];
+        let val2what = fixed_bytes[5];
+        let val2index = fixed_bytes[6];
+        let val2value = fixed_bytes[7];
         let type_ = type_.into();
         let val1what = val1what.into();
         let val2what = val2what.into();
@@ -5533,11 +4677,12 @@ pub struct SymInterpret {
 impl_debug_if_no_extra_traits!(SymInterpret, "SymInterpret");
 impl TryParse for SymInterpret {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (sym, remaining) = xproto::Keysym::try_parse(remaining)?;
-        let (mods, remaining) = u8::try_parse(remaining)?;
-        let (match_, remaining) = u8::try_parse(remaining)?;
-        let (virtual_mod, remaining) = u8::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let sym = xproto::Keysym::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let mods = fixed_bytes[4];
+        let match_ = fixed_bytes[5];
+        let virtual_mod = fixed_bytes[6];
+        let flags = fixed_bytes[7];
         let (action, remaining) = SIAction::try_parse(remaining)?;
         let mods = mods.into();
         let virtual_mod = virtual_mod.into();
@@ -6057,8 +5202,9 @@ pub struct SelectEventsAuxNewKeyboardNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxNewKeyboardNotify, "SelectEventsAuxNewKeyboardNotify");
 impl TryParse for SelectEventsAuxNewKeyboardNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_new_keyboard, remaining) = u16::try_parse(remaining)?;
-        let (new_keyboard_details, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let affect_new_keyboard = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let new_keyboard_details = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let affect_new_keyboard = affect_new_keyboard.into();
         let new_keyboard_details = new_keyboard_details.into();
         let result = SelectEventsAuxNewKeyboardNotify { affect_new_keyboard, new_keyboard_details };
@@ -6093,8 +5239,9 @@ pub struct SelectEventsAuxStateNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxStateNotify, "SelectEventsAuxStateNotify");
 impl TryParse for SelectEventsAuxStateNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_state, remaining) = u16::try_parse(remaining)?;
-        let (state_details, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let affect_state = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let state_details = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let affect_state = affect_state.into();
         let state_details = state_details.into();
         let result = SelectEventsAuxStateNotify { affect_state, state_details };
@@ -6129,8 +5276,9 @@ pub struct SelectEventsAuxControlsNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxControlsNotify, "SelectEventsAuxControlsNotify");
 impl TryParse for SelectEventsAuxControlsNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_ctrls, remaining) = u32::try_parse(remaining)?;
-        let (ctrl_details, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let affect_ctrls = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let ctrl_details = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let affect_ctrls = affect_ctrls.into();
         let ctrl_details = ctrl_details.into();
         let result = SelectEventsAuxControlsNotify { affect_ctrls, ctrl_details };
@@ -6169,8 +5317,9 @@ pub struct SelectEventsAuxIndicatorStateNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxIndicatorStateNotify, "SelectEventsAuxIndicatorStateNotify");
 impl TryParse for SelectEventsAuxIndicatorStateNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_indicator_state, remaining) = u32::try_parse(remaining)?;
-        let (indicator_state_details, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let affect_indicator_state = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let indicator_state_details = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = SelectEventsAuxIndicatorStateNotify { affect_indicator_state, indicator_state_details };
         Ok((result, remaining))
     }
@@ -6207,8 +5356,9 @@ pub struct SelectEventsAuxIndicatorMapNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxIndicatorMapNotify, "SelectEventsAuxIndicatorMapNotify");
 impl TryParse for SelectEventsAuxIndicatorMapNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_indicator_map, remaining) = u32::try_parse(remaining)?;
-        let (indicator_map_details, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let affect_indicator_map = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let indicator_map_details = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = SelectEventsAuxIndicatorMapNotify { affect_indicator_map, indicator_map_details };
         Ok((result, remaining))
     }
@@ -6245,8 +5395,9 @@ pub struct SelectEventsAuxNamesNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxNamesNotify, "SelectEventsAuxNamesNotify");
 impl TryParse for SelectEventsAuxNamesNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_names, remaining) = u16::try_parse(remaining)?;
-        let (names_details, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let affect_names = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let names_details = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let affect_names = affect_names.into();
         let names_details = names_details.into();
         let result = SelectEventsAuxNamesNotify { affect_names, names_details };
@@ -6281,8 +5432,9 @@ pub struct SelectEventsAuxCompatMapNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxCompatMapNotify, "SelectEventsAuxCompatMapNotify");
 impl TryParse for SelectEventsAuxCompatMapNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_compat, remaining) = u8::try_parse(remaining)?;
-        let (compat_details, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let affect_compat = fixed_bytes[0];
+        let compat_details = fixed_bytes[1];
         let affect_compat = affect_compat.into();
         let compat_details = compat_details.into();
         let result = SelectEventsAuxCompatMapNotify { affect_compat, compat_details };
@@ -6315,8 +5467,9 @@ pub struct SelectEventsAuxBellNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxBellNotify, "SelectEventsAuxBellNotify");
 impl TryParse for SelectEventsAuxBellNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_bell, remaining) = u8::try_parse(remaining)?;
-        let (bell_details, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let affect_bell = fixed_bytes[0];
+        let bell_details = fixed_bytes[1];
         let result = SelectEventsAuxBellNotify { affect_bell, bell_details };
         Ok((result, remaining))
     }
@@ -6347,8 +5500,9 @@ pub struct SelectEventsAuxActionMessage {
 impl_debug_if_no_extra_traits!(SelectEventsAuxActionMessage, "SelectEventsAuxActionMessage");
 impl TryParse for SelectEventsAuxActionMessage {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_msg_details, remaining) = u8::try_parse(remaining)?;
-        let (msg_details, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let affect_msg_details = fixed_bytes[0];
+        let msg_details = fixed_bytes[1];
         let result = SelectEventsAuxActionMessage { affect_msg_details, msg_details };
         Ok((result, remaining))
     }
@@ -6379,8 +5533,9 @@ pub struct SelectEventsAuxAccessXNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxAccessXNotify, "SelectEventsAuxAccessXNotify");
 impl TryParse for SelectEventsAuxAccessXNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_access_x, remaining) = u16::try_parse(remaining)?;
-        let (access_x_details, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let affect_access_x = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let access_x_details = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let affect_access_x = affect_access_x.into();
         let access_x_details = access_x_details.into();
         let result = SelectEventsAuxAccessXNotify { affect_access_x, access_x_details };
@@ -6415,8 +5570,9 @@ pub struct SelectEventsAuxExtensionDeviceNotify {
 impl_debug_if_no_extra_traits!(SelectEventsAuxExtensionDeviceNotify, "SelectEventsAuxExtensionDeviceNotify");
 impl TryParse for SelectEventsAuxExtensionDeviceNotify {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (affect_ext_dev, remaining) = u16::try_parse(remaining)?;
-        let (extdev_details, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let affect_ext_dev = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let extdev_details = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let affect_ext_dev = affect_ext_dev.into();
         let extdev_details = extdev_details.into();
         let result = SelectEventsAuxExtensionDeviceNotify { affect_ext_dev, extdev_details };
@@ -11529,37 +10685,36 @@ pub struct GetKbdByNameRepliesTypes {
 impl_debug_if_no_extra_traits!(GetKbdByNameRepliesTypes, "GetKbdByNameRepliesTypes");
 impl TryParse for GetKbdByNameRepliesTypes {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (getmap_type, remaining) = u8::try_parse(remaining)?;
-        let (type_device_id, remaining) = u8::try_parse(remaining)?;
-        let (getmap_sequence, remaining) = u16::try_parse(remaining)?;
-        let (getmap_length, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (type_min_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (type_max_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (present, remaining) = u16::try_parse(remaining)?;
-        let (first_type, remaining) = u8::try_parse(remaining)?;
-        let (n_types, remaining) = u8::try_parse(remaining)?;
-        let (total_types, remaining) = u8::try_parse(remaining)?;
-        let (first_key_sym, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (total_syms, remaining) = u16::try_parse(remaining)?;
-        let (n_key_syms, remaining) = u8::try_parse(remaining)?;
-        let (first_key_action, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (total_actions, remaining) = u16::try_parse(remaining)?;
-        let (n_key_actions, remaining) = u8::try_parse(remaining)?;
-        let (first_key_behavior, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_key_behaviors, remaining) = u8::try_parse(remaining)?;
-        let (total_key_behaviors, remaining) = u8::try_parse(remaining)?;
-        let (first_key_explicit, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_key_explicit, remaining) = u8::try_parse(remaining)?;
-        let (total_key_explicit, remaining) = u8::try_parse(remaining)?;
-        let (first_mod_map_key, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_mod_map_keys, remaining) = u8::try_parse(remaining)?;
-        let (total_mod_map_keys, remaining) = u8::try_parse(remaining)?;
-        let (first_v_mod_map_key, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_v_mod_map_keys, remaining) = u8::try_parse(remaining)?;
-        let (total_v_mod_map_keys, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (virtual_mods, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let getmap_type = fixed_bytes[0];
+        let type_device_id = fixed_bytes[1];
+        let getmap_sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let getmap_length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let type_min_key_code = fixed_bytes[10];
+        let type_max_key_code = fixed_bytes[11];
+        let present = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let first_type = fixed_bytes[14];
+        let n_types = fixed_bytes[15];
+        let total_types = fixed_bytes[16];
+        let first_key_sym = fixed_bytes[17];
+        let total_syms = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let n_key_syms = fixed_bytes[20];
+        let first_key_action = fixed_bytes[21];
+        let total_actions = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let n_key_actions = fixed_bytes[24];
+        let first_key_behavior = fixed_bytes[25];
+        let n_key_behaviors = fixed_bytes[26];
+        let total_key_behaviors = fixed_bytes[27];
+        let first_key_explicit = fixed_bytes[28];
+        let n_key_explicit = fixed_bytes[29];
+        let total_key_explicit = fixed_bytes[30];
+        let first_mod_map_key = fixed_bytes[31];
+        let n_mod_map_keys = fixed_bytes[32];
+        let total_mod_map_keys = fixed_bytes[33];
+        let first_v_mod_map_key = fixed_bytes[34];
+        let n_v_mod_map_keys = fixed_bytes[35];
+        let total_v_mod_map_keys = fixed_bytes[36];
+        let virtual_mods = u16::from_ne_bytes([fixed_bytes[38], fixed_bytes[39]]);
         let (map, remaining) = GetKbdByNameRepliesTypesMap::try_parse(remaining, u16::from(present), u8::from(n_types), u8::from(n_key_syms), u8::from(n_key_actions), u16::from(total_actions), u8::from(total_key_behaviors), u16::from(virtual_mods), u8::from(total_key_explicit), u8::from(total_mod_map_keys), u8::from(total_v_mod_map_keys))?;
         let virtual_mods = virtual_mods.into();
         let result = GetKbdByNameRepliesTypes { getmap_type, type_device_id, getmap_sequence, getmap_length, type_min_key_code, type_max_key_code, first_type, n_types, total_types, first_key_sym, total_syms, n_key_syms, first_key_action, total_actions, n_key_actions, first_key_behavior, n_key_behaviors, total_key_behaviors, first_key_explicit, n_key_explicit, total_key_explicit, first_mod_map_key, n_mod_map_keys, total_mod_map_keys, first_v_mod_map_key, n_v_mod_map_keys, total_v_mod_map_keys, virtual_mods, map };
@@ -11627,16 +10782,15 @@ pub struct GetKbdByNameRepliesCompatMap {
 impl_debug_if_no_extra_traits!(GetKbdByNameRepliesCompatMap, "GetKbdByNameRepliesCompatMap");
 impl TryParse for GetKbdByNameRepliesCompatMap {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (compatmap_type, remaining) = u8::try_parse(remaining)?;
-        let (compat_device_id, remaining) = u8::try_parse(remaining)?;
-        let (compatmap_sequence, remaining) = u16::try_parse(remaining)?;
-        let (compatmap_length, remaining) = u32::try_parse(remaining)?;
-        let (groups_rtrn, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (first_si_rtrn, remaining) = u16::try_parse(remaining)?;
-        let (n_si_rtrn, remaining) = u16::try_parse(remaining)?;
-        let (n_total_si, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(16..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let compatmap_type = fixed_bytes[0];
+        let compat_device_id = fixed_bytes[1];
+        let compatmap_sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let compatmap_length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let groups_rtrn = fixed_bytes[8];
+        let first_si_rtrn = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let n_si_rtrn = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let n_total_si = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
         let (si_rtrn, remaining) = crate::x11_utils::parse_list::<SymInterpret>(remaining, n_si_rtrn.try_to_usize()?)?;
         let (group_rtrn, remaining) = crate::x11_utils::parse_list::<ModDef>(remaining, u32::from(groups_rtrn).count_ones().try_to_usize()?)?;
         let groups_rtrn = groups_rtrn.into();
@@ -11699,14 +10853,14 @@ pub struct GetKbdByNameRepliesIndicatorMaps {
 impl_debug_if_no_extra_traits!(GetKbdByNameRepliesIndicatorMaps, "GetKbdByNameRepliesIndicatorMaps");
 impl TryParse for GetKbdByNameRepliesIndicatorMaps {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (indicatormap_type, remaining) = u8::try_parse(remaining)?;
-        let (indicator_device_id, remaining) = u8::try_parse(remaining)?;
-        let (indicatormap_sequence, remaining) = u16::try_parse(remaining)?;
-        let (indicatormap_length, remaining) = u32::try_parse(remaining)?;
-        let (which, remaining) = u32::try_parse(remaining)?;
-        let (real_indicators, remaining) = u32::try_parse(remaining)?;
-        let (n_indicators, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(15..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let indicatormap_type = fixed_bytes[0];
+        let indicator_device_id = fixed_bytes[1];
+        let indicatormap_sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let indicatormap_length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let which = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let real_indicators = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let n_indicators = fixed_bytes[16];
         let (maps, remaining) = crate::x11_utils::parse_list::<IndicatorMap>(remaining, n_indicators.try_to_usize()?)?;
         let result = GetKbdByNameRepliesIndicatorMaps { indicatormap_type, indicator_device_id, indicatormap_sequence, indicatormap_length, which, real_indicators, maps };
         Ok((result, remaining))
@@ -12058,23 +11212,23 @@ pub struct GetKbdByNameRepliesKeyNames {
 impl_debug_if_no_extra_traits!(GetKbdByNameRepliesKeyNames, "GetKbdByNameRepliesKeyNames");
 impl TryParse for GetKbdByNameRepliesKeyNames {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (keyname_type, remaining) = u8::try_parse(remaining)?;
-        let (key_device_id, remaining) = u8::try_parse(remaining)?;
-        let (keyname_sequence, remaining) = u16::try_parse(remaining)?;
-        let (keyname_length, remaining) = u32::try_parse(remaining)?;
-        let (which, remaining) = u32::try_parse(remaining)?;
-        let (key_min_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (key_max_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_types, remaining) = u8::try_parse(remaining)?;
-        let (group_names, remaining) = u8::try_parse(remaining)?;
-        let (virtual_mods, remaining) = u16::try_parse(remaining)?;
-        let (first_key, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_keys, remaining) = u8::try_parse(remaining)?;
-        let (indicators, remaining) = u32::try_parse(remaining)?;
-        let (n_radio_groups, remaining) = u8::try_parse(remaining)?;
-        let (n_key_aliases, remaining) = u8::try_parse(remaining)?;
-        let (n_kt_levels, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let keyname_type = fixed_bytes[0];
+        let key_device_id = fixed_bytes[1];
+        let keyname_sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let keyname_length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let which = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let key_min_key_code = fixed_bytes[12];
+        let key_max_key_code = fixed_bytes[13];
+        let n_types = fixed_bytes[14];
+        let group_names = fixed_bytes[15];
+        let virtual_mods = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let first_key = fixed_bytes[18];
+        let n_keys = fixed_bytes[19];
+        let indicators = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let n_radio_groups = fixed_bytes[24];
+        let n_key_aliases = fixed_bytes[25];
+        let n_kt_levels = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
         let (value_list, remaining) = GetKbdByNameRepliesKeyNamesValueList::try_parse(remaining, u32::from(which), u8::from(n_types), u32::from(indicators), u16::from(virtual_mods), u8::from(group_names), u8::from(n_keys), u8::from(n_key_aliases), u8::from(n_radio_groups))?;
         let group_names = group_names.into();
         let virtual_mods = virtual_mods.into();
@@ -12137,23 +11291,23 @@ pub struct GetKbdByNameRepliesGeometry {
 impl_debug_if_no_extra_traits!(GetKbdByNameRepliesGeometry, "GetKbdByNameRepliesGeometry");
 impl TryParse for GetKbdByNameRepliesGeometry {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (geometry_type, remaining) = u8::try_parse(remaining)?;
-        let (geometry_device_id, remaining) = u8::try_parse(remaining)?;
-        let (geometry_sequence, remaining) = u16::try_parse(remaining)?;
-        let (geometry_length, remaining) = u32::try_parse(remaining)?;
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (geometry_found, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (width_mm, remaining) = u16::try_parse(remaining)?;
-        let (height_mm, remaining) = u16::try_parse(remaining)?;
-        let (n_properties, remaining) = u16::try_parse(remaining)?;
-        let (n_colors, remaining) = u16::try_parse(remaining)?;
-        let (n_shapes, remaining) = u16::try_parse(remaining)?;
-        let (n_sections, remaining) = u16::try_parse(remaining)?;
-        let (n_doodads, remaining) = u16::try_parse(remaining)?;
-        let (n_key_aliases, remaining) = u16::try_parse(remaining)?;
-        let (base_color_ndx, remaining) = u8::try_parse(remaining)?;
-        let (label_color_ndx, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let geometry_type = fixed_bytes[0];
+        let geometry_device_id = fixed_bytes[1];
+        let geometry_sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let geometry_length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let geometry_found = fixed_bytes[12] != 0;
+        let width_mm = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let height_mm = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let n_properties = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let n_colors = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let n_shapes = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let n_sections = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let n_doodads = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let n_key_aliases = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let base_color_ndx = fixed_bytes[30];
+        let label_color_ndx = fixed_bytes[31];
         let (label_font, remaining) = CountedString16::try_parse(remaining)?;
         let result = GetKbdByNameRepliesGeometry { geometry_type, geometry_device_id, geometry_sequence, geometry_length, name, geometry_found, width_mm, height_mm, n_properties, n_colors, n_shapes, n_sections, n_doodads, n_key_aliases, base_color_ndx, label_color_ndx, label_font };
         Ok((result, remaining))
@@ -12897,20 +12051,20 @@ impl_debug_if_no_extra_traits!(NewKeyboardNotifyEvent, "NewKeyboardNotifyEvent")
 impl TryParse for NewKeyboardNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (old_device_id, remaining) = u8::try_parse(remaining)?;
-        let (min_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (max_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (old_min_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (old_max_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (request_major, remaining) = u8::try_parse(remaining)?;
-        let (request_minor, remaining) = u8::try_parse(remaining)?;
-        let (changed, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(14..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let old_device_id = fixed_bytes[9];
+        let min_key_code = fixed_bytes[10];
+        let max_key_code = fixed_bytes[11];
+        let old_min_key_code = fixed_bytes[12];
+        let old_max_key_code = fixed_bytes[13];
+        let request_major = fixed_bytes[14];
+        let request_minor = fixed_bytes[15];
+        let changed = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
         let changed = changed.into();
         let result = NewKeyboardNotifyEvent { response_type, xkb_type, sequence, time, device_id, old_device_id, min_key_code, max_key_code, old_min_key_code, old_max_key_code, request_major, request_minor, changed };
         let _ = remaining;
@@ -13080,31 +12234,31 @@ impl_debug_if_no_extra_traits!(MapNotifyEvent, "MapNotifyEvent");
 impl TryParse for MapNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (ptr_btn_actions, remaining) = u8::try_parse(remaining)?;
-        let (changed, remaining) = u16::try_parse(remaining)?;
-        let (min_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (max_key_code, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (first_type, remaining) = u8::try_parse(remaining)?;
-        let (n_types, remaining) = u8::try_parse(remaining)?;
-        let (first_key_sym, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_key_syms, remaining) = u8::try_parse(remaining)?;
-        let (first_key_act, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_key_acts, remaining) = u8::try_parse(remaining)?;
-        let (first_key_behavior, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_key_behavior, remaining) = u8::try_parse(remaining)?;
-        let (first_key_explicit, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_key_explicit, remaining) = u8::try_parse(remaining)?;
-        let (first_mod_map_key, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_mod_map_keys, remaining) = u8::try_parse(remaining)?;
-        let (first_v_mod_map_key, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_v_mod_map_keys, remaining) = u8::try_parse(remaining)?;
-        let (virtual_mods, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let ptr_btn_actions = fixed_bytes[9];
+        let changed = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let min_key_code = fixed_bytes[12];
+        let max_key_code = fixed_bytes[13];
+        let first_type = fixed_bytes[14];
+        let n_types = fixed_bytes[15];
+        let first_key_sym = fixed_bytes[16];
+        let n_key_syms = fixed_bytes[17];
+        let first_key_act = fixed_bytes[18];
+        let n_key_acts = fixed_bytes[19];
+        let first_key_behavior = fixed_bytes[20];
+        let n_key_behavior = fixed_bytes[21];
+        let first_key_explicit = fixed_bytes[22];
+        let n_key_explicit = fixed_bytes[23];
+        let first_mod_map_key = fixed_bytes[24];
+        let n_mod_map_keys = fixed_bytes[25];
+        let first_v_mod_map_key = fixed_bytes[26];
+        let n_v_mod_map_keys = fixed_bytes[27];
+        let virtual_mods = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
         let changed = changed.into();
         let virtual_mods = virtual_mods.into();
         let result = MapNotifyEvent { response_type, xkb_type, sequence, time, device_id, ptr_btn_actions, changed, min_key_code, max_key_code, first_type, n_types, first_key_sym, n_key_syms, first_key_act, n_key_acts, first_key_behavior, n_key_behavior, first_key_explicit, n_key_explicit, first_mod_map_key, n_mod_map_keys, first_v_mod_map_key, n_v_mod_map_keys, virtual_mods };
@@ -13308,30 +12462,31 @@ impl_debug_if_no_extra_traits!(StateNotifyEvent, "StateNotifyEvent");
 impl TryParse for StateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (mods, remaining) = u8::try_parse(remaining)?;
-        let (base_mods, remaining) = u8::try_parse(remaining)?;
-        let (latched_mods, remaining) = u8::try_parse(remaining)?;
-        let (locked_mods, remaining) = u8::try_parse(remaining)?;
-        let (group, remaining) = u8::try_parse(remaining)?;
-        let (base_group, remaining) = i16::try_parse(remaining)?;
-        let (latched_group, remaining) = i16::try_parse(remaining)?;
-        let (locked_group, remaining) = u8::try_parse(remaining)?;
-        let (compat_state, remaining) = u8::try_parse(remaining)?;
-        let (grab_mods, remaining) = u8::try_parse(remaining)?;
-        let (compat_grab_mods, remaining) = u8::try_parse(remaining)?;
-        let (lookup_mods, remaining) = u8::try_parse(remaining)?;
-        let (compat_loockup_mods, remaining) = u8::try_parse(remaining)?;
-        let (ptr_btn_state, remaining) = u16::try_parse(remaining)?;
-        let (changed, remaining) = u16::try_parse(remaining)?;
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (event_type, remaining) = u8::try_parse(remaining)?;
-        let (request_major, remaining) = u8::try_parse(remaining)?;
-        let (request_minor, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let mods = fixed_bytes[9];
+        let base_mods = fixed_bytes[10];
+        let latched_mods = fixed_bytes[11];
+        let locked_mods = fixed_bytes[12];
+        let group = fixed_bytes[13];
+        let base_group = i16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let latched_group = i16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let locked_group = fixed_bytes[18];
+        let compat_state = fixed_bytes[19];
+        let grab_mods = fixed_bytes[20];
+        let compat_grab_mods = fixed_bytes[21];
+        let lookup_mods = fixed_bytes[22];
+        let compat_loockup_mods = fixed_bytes[23];
+        let ptr_btn_state = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let changed = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let keycode = fixed_bytes[28];
+        let event_type = fixed_bytes[29];
+        let request_major = fixed_bytes[30];
+        let request_minor = fixed_bytes[31];
         let mods = mods.into();
         let base_mods = base_mods.into();
         let latched_mods = latched_mods.into();
@@ -13534,21 +12689,20 @@ impl_debug_if_no_extra_traits!(ControlsNotifyEvent, "ControlsNotifyEvent");
 impl TryParse for ControlsNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (num_groups, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
-        let (changed_controls, remaining) = u32::try_parse(remaining)?;
-        let (enabled_controls, remaining) = u32::try_parse(remaining)?;
-        let (enabled_control_changes, remaining) = u32::try_parse(remaining)?;
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (event_type, remaining) = u8::try_parse(remaining)?;
-        let (request_major, remaining) = u8::try_parse(remaining)?;
-        let (request_minor, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let num_groups = fixed_bytes[9];
+        let changed_controls = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let enabled_controls = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let enabled_control_changes = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let keycode = fixed_bytes[24];
+        let event_type = fixed_bytes[25];
+        let request_major = fixed_bytes[26];
+        let request_minor = fixed_bytes[27];
         let changed_controls = changed_controls.into();
         let enabled_controls = enabled_controls.into();
         let enabled_control_changes = enabled_control_changes.into();
@@ -13704,15 +12858,14 @@ impl_debug_if_no_extra_traits!(IndicatorStateNotifyEvent, "IndicatorStateNotifyE
 impl TryParse for IndicatorStateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (state, remaining) = u32::try_parse(remaining)?;
-        let (state_changed, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(12..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let state = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let state_changed = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let result = IndicatorStateNotifyEvent { response_type, xkb_type, sequence, time, device_id, state, state_changed };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -13847,15 +13000,14 @@ impl_debug_if_no_extra_traits!(IndicatorMapNotifyEvent, "IndicatorMapNotifyEvent
 impl TryParse for IndicatorMapNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
-        let (state, remaining) = u32::try_parse(remaining)?;
-        let (map_changed, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(12..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let state = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let map_changed = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let result = IndicatorMapNotifyEvent { response_type, xkb_type, sequence, time, device_id, state, map_changed };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -14000,26 +13152,24 @@ impl_debug_if_no_extra_traits!(NamesNotifyEvent, "NamesNotifyEvent");
 impl TryParse for NamesNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (changed, remaining) = u16::try_parse(remaining)?;
-        let (first_type, remaining) = u8::try_parse(remaining)?;
-        let (n_types, remaining) = u8::try_parse(remaining)?;
-        let (first_level_name, remaining) = u8::try_parse(remaining)?;
-        let (n_level_names, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (n_radio_groups, remaining) = u8::try_parse(remaining)?;
-        let (n_key_aliases, remaining) = u8::try_parse(remaining)?;
-        let (changed_group_names, remaining) = u8::try_parse(remaining)?;
-        let (changed_virtual_mods, remaining) = u16::try_parse(remaining)?;
-        let (first_key, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (n_keys, remaining) = u8::try_parse(remaining)?;
-        let (changed_indicators, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let changed = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let first_type = fixed_bytes[12];
+        let n_types = fixed_bytes[13];
+        let first_level_name = fixed_bytes[14];
+        let n_level_names = fixed_bytes[15];
+        let n_radio_groups = fixed_bytes[17];
+        let n_key_aliases = fixed_bytes[18];
+        let changed_group_names = fixed_bytes[19];
+        let changed_virtual_mods = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let first_key = fixed_bytes[22];
+        let n_keys = fixed_bytes[23];
+        let changed_indicators = u32::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let changed = changed.into();
         let changed_group_names = changed_group_names.into();
         let changed_virtual_mods = changed_virtual_mods.into();
@@ -14190,16 +13340,16 @@ impl_debug_if_no_extra_traits!(CompatMapNotifyEvent, "CompatMapNotifyEvent");
 impl TryParse for CompatMapNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (changed_groups, remaining) = u8::try_parse(remaining)?;
-        let (first_si, remaining) = u16::try_parse(remaining)?;
-        let (n_si, remaining) = u16::try_parse(remaining)?;
-        let (n_total_si, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(16..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let changed_groups = fixed_bytes[9];
+        let first_si = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let n_si = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let n_total_si = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
         let changed_groups = changed_groups.into();
         let result = CompatMapNotifyEvent { response_type, xkb_type, sequence, time, device_id, changed_groups, first_si, n_si, n_total_si };
         let _ = remaining;
@@ -14346,20 +13496,20 @@ impl_debug_if_no_extra_traits!(BellNotifyEvent, "BellNotifyEvent");
 impl TryParse for BellNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (bell_class, remaining) = u8::try_parse(remaining)?;
-        let (bell_id, remaining) = u8::try_parse(remaining)?;
-        let (percent, remaining) = u8::try_parse(remaining)?;
-        let (pitch, remaining) = u16::try_parse(remaining)?;
-        let (duration, remaining) = u16::try_parse(remaining)?;
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (window, remaining) = xproto::Window::try_parse(remaining)?;
-        let (event_only, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(7..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let bell_class = fixed_bytes[9];
+        let bell_id = fixed_bytes[10];
+        let percent = fixed_bytes[11];
+        let pitch = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let duration = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let window = xproto::Window::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let event_only = fixed_bytes[24] != 0;
         let bell_class = bell_class.into();
         let result = BellNotifyEvent { response_type, xkb_type, sequence, time, device_id, bell_class, bell_id, percent, pitch, duration, name, window, event_only };
         let _ = remaining;
@@ -14516,16 +13666,17 @@ impl_debug_if_no_extra_traits!(ActionMessageEvent, "ActionMessageEvent");
 impl TryParse for ActionMessageEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (press, remaining) = bool::try_parse(remaining)?;
-        let (key_event_follows, remaining) = bool::try_parse(remaining)?;
-        let (mods, remaining) = u8::try_parse(remaining)?;
-        let (group, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<14>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let keycode = fixed_bytes[9];
+        let press = fixed_bytes[10] != 0;
+        let key_event_follows = fixed_bytes[11] != 0;
+        let mods = fixed_bytes[12];
+        let group = fixed_bytes[13];
         let (message, remaining) = crate::x11_utils::parse_u8_array::<8>(remaining)?;
         let remaining = remaining.get(10..).ok_or(ParseError::InsufficientData)?;
         let mods = mods.into();
@@ -14675,16 +13826,16 @@ impl_debug_if_no_extra_traits!(AccessXNotifyEvent, "AccessXNotifyEvent");
 impl TryParse for AccessXNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let (keycode, remaining) = xproto::Keycode::try_parse(remaining)?;
-        let (detailt, remaining) = u16::try_parse(remaining)?;
-        let (slow_keys_delay, remaining) = u16::try_parse(remaining)?;
-        let (debounce_delay, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(16..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let keycode = fixed_bytes[9];
+        let detailt = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let slow_keys_delay = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let debounce_delay = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
         let detailt = detailt.into();
         let result = AccessXNotifyEvent { response_type, xkb_type, sequence, time, device_id, keycode, detailt, slow_keys_delay, debounce_delay };
         let _ = remaining;
@@ -14832,22 +13983,21 @@ impl_debug_if_no_extra_traits!(ExtensionDeviceNotifyEvent, "ExtensionDeviceNotif
 impl TryParse for ExtensionDeviceNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (xkb_type, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (device_id, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (reason, remaining) = u16::try_parse(remaining)?;
-        let (led_class, remaining) = u16::try_parse(remaining)?;
-        let (led_id, remaining) = u16::try_parse(remaining)?;
-        let (leds_defined, remaining) = u32::try_parse(remaining)?;
-        let (led_state, remaining) = u32::try_parse(remaining)?;
-        let (first_button, remaining) = u8::try_parse(remaining)?;
-        let (n_buttons, remaining) = u8::try_parse(remaining)?;
-        let (supported, remaining) = u16::try_parse(remaining)?;
-        let (unsupported, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let xkb_type = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let device_id = fixed_bytes[8];
+        let reason = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let led_class = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let led_id = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let leds_defined = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let led_state = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let first_button = fixed_bytes[24];
+        let n_buttons = fixed_bytes[25];
+        let supported = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let unsupported = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
         let reason = reason.into();
         let led_class = led_class.into();
         let supported = supported.into();
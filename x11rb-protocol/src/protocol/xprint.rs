@@ -135,42 +135,7 @@ impl From<GetDoc> for Option<bool> {
         Some(input.0)
     }
 }
-impl From<GetDoc> for u8 {
-    #[inline]
-    fn from(input: GetDoc) -> Self {
-        u8::from(input.0)
-    }
-}
-impl From<GetDoc> for Option<u8> {
-    #[inline]
-    fn from(input: GetDoc) -> Self {
-        Some(u8::from(input.0))
-    }
-}
-impl From<GetDoc> for u16 {
-    #[inline]
-    fn from(input: GetDoc) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GetDoc> for Option<u16> {
-    #[inline]
-    fn from(input: GetDoc) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GetDoc> for u32 {
-    #[inline]
-    fn from(input: GetDoc) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GetDoc> for Option<u32> {
-    #[inline]
-    fn from(input: GetDoc) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GetDoc, u8, u16, u32);
 impl From<bool> for GetDoc {
     #[inline]
     fn from(value: bool) -> Self {
@@ -207,30 +172,7 @@ impl From<EvMask> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<EvMask> for u16 {
-    #[inline]
-    fn from(input: EvMask) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<EvMask> for Option<u16> {
-    #[inline]
-    fn from(input: EvMask) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<EvMask> for u32 {
-    #[inline]
-    fn from(input: EvMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<EvMask> for Option<u32> {
-    #[inline]
-    fn from(input: EvMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(EvMask, u16, u32);
 impl From<u8> for EvMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -272,30 +214,7 @@ impl From<Detail> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Detail> for u16 {
-    #[inline]
-    fn from(input: Detail) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Detail> for Option<u16> {
-    #[inline]
-    fn from(input: Detail) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Detail> for u32 {
-    #[inline]
-    fn from(input: Detail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Detail> for Option<u32> {
-    #[inline]
-    fn from(input: Detail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Detail, u16, u32);
 impl From<u8> for Detail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -340,30 +259,7 @@ impl From<Attr> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Attr> for u16 {
-    #[inline]
-    fn from(input: Attr) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Attr> for Option<u16> {
-    #[inline]
-    fn from(input: Attr) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Attr> for u32 {
-    #[inline]
-    fn from(input: Attr) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Attr> for Option<u32> {
-    #[inline]
-    fn from(input: Attr) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Attr, u16, u32);
 impl From<u8> for Attr {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2780,11 +2676,12 @@ impl_debug_if_no_extra_traits!(NotifyEvent, "NotifyEvent");
 impl TryParse for NotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (context, remaining) = Pcontext::try_parse(remaining)?;
-        let (cancel, remaining) = bool::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<9>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let context = Pcontext::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let cancel = fixed_bytes[8] != 0;
         let result = NotifyEvent { response_type, detail, sequence, context, cancel };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -2886,10 +2783,11 @@ impl_debug_if_no_extra_traits!(AttributNotifyEvent, "AttributNotifyEvent");
 impl TryParse for AttributNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (context, remaining) = Pcontext::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let context = Pcontext::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = AttributNotifyEvent { response_type, detail, sequence, context };
         let _ = remaining;
         let remaining = initial_value.get(32..)
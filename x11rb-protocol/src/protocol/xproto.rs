@@ -38,8 +38,9 @@ pub struct Char2b {
 impl_debug_if_no_extra_traits!(Char2b, "Char2b");
 impl TryParse for Char2b {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (byte1, remaining) = u8::try_parse(remaining)?;
-        let (byte2, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<2>(remaining)?;
+        let byte1 = fixed_bytes[0];
+        let byte2 = fixed_bytes[1];
         let result = Char2b { byte1, byte2 };
         Ok((result, remaining))
     }
@@ -103,8 +104,9 @@ pub struct Point {
 impl_debug_if_no_extra_traits!(Point, "Point");
 impl TryParse for Point {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let x = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let y = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let result = Point { x, y };
         Ok((result, remaining))
     }
@@ -140,10 +142,11 @@ pub struct Rectangle {
 impl_debug_if_no_extra_traits!(Rectangle, "Rectangle");
 impl TryParse for Rectangle {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let x = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let y = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let width = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let height = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = Rectangle { x, y, width, height };
         Ok((result, remaining))
     }
@@ -189,12 +192,13 @@ pub struct Arc {
 impl_debug_if_no_extra_traits!(Arc, "Arc");
 impl TryParse for Arc {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (angle1, remaining) = i16::try_parse(remaining)?;
-        let (angle2, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let x = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let y = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let width = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let height = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let angle1 = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let angle2 = i16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let result = Arc { x, y, width, height, angle1, angle2 };
         Ok((result, remaining))
     }
@@ -245,10 +249,10 @@ pub struct Format {
 impl_debug_if_no_extra_traits!(Format, "Format");
 impl TryParse for Format {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (depth, remaining) = u8::try_parse(remaining)?;
-        let (bits_per_pixel, remaining) = u8::try_parse(remaining)?;
-        let (scanline_pad, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(5..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let depth = fixed_bytes[0];
+        let bits_per_pixel = fixed_bytes[1];
+        let scanline_pad = fixed_bytes[2];
         let result = Format { depth, bits_per_pixel, scanline_pad };
         Ok((result, remaining))
     }
@@ -302,30 +306,7 @@ impl From<VisualClass> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<VisualClass> for u16 {
-    #[inline]
-    fn from(input: VisualClass) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<VisualClass> for Option<u16> {
-    #[inline]
-    fn from(input: VisualClass) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<VisualClass> for u32 {
-    #[inline]
-    fn from(input: VisualClass) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<VisualClass> for Option<u32> {
-    #[inline]
-    fn from(input: VisualClass) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(VisualClass, u16, u32);
 impl From<u8> for VisualClass {
     #[inline]
     fn from(value: u8) -> Self {
@@ -361,14 +342,14 @@ pub struct Visualtype {
 impl_debug_if_no_extra_traits!(Visualtype, "Visualtype");
 impl TryParse for Visualtype {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (visual_id, remaining) = Visualid::try_parse(remaining)?;
-        let (class, remaining) = u8::try_parse(remaining)?;
-        let (bits_per_rgb_value, remaining) = u8::try_parse(remaining)?;
-        let (colormap_entries, remaining) = u16::try_parse(remaining)?;
-        let (red_mask, remaining) = u32::try_parse(remaining)?;
-        let (green_mask, remaining) = u32::try_parse(remaining)?;
-        let (blue_mask, remaining) = u32::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let visual_id = Visualid::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let class = fixed_bytes[4];
+        let bits_per_rgb_value = fixed_bytes[5];
+        let colormap_entries = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let red_mask = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let green_mask = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let blue_mask = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let class = class.into();
         let result = Visualtype { visual_id, class, bits_per_rgb_value, colormap_entries, red_mask, green_mask, blue_mask };
         Ok((result, remaining))
@@ -434,10 +415,9 @@ pub struct Depth {
 impl_debug_if_no_extra_traits!(Depth, "Depth");
 impl TryParse for Depth {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (depth, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (visuals_len, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let depth = fixed_bytes[0];
+        let visuals_len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (visuals, remaining) = crate::x11_utils::parse_list::<Visualtype>(remaining, visuals_len.try_to_usize()?)?;
         let result = Depth { depth, visuals };
         Ok((result, remaining))
@@ -645,22 +625,23 @@ pub struct Screen {
 impl_debug_if_no_extra_traits!(Screen, "Screen");
 impl TryParse for Screen {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (root, remaining) = Window::try_parse(remaining)?;
-        let (default_colormap, remaining) = Colormap::try_parse(remaining)?;
-        let (white_pixel, remaining) = u32::try_parse(remaining)?;
-        let (black_pixel, remaining) = u32::try_parse(remaining)?;
-        let (current_input_masks, remaining) = u32::try_parse(remaining)?;
-        let (width_in_pixels, remaining) = u16::try_parse(remaining)?;
-        let (height_in_pixels, remaining) = u16::try_parse(remaining)?;
-        let (width_in_millimeters, remaining) = u16::try_parse(remaining)?;
-        let (height_in_millimeters, remaining) = u16::try_parse(remaining)?;
-        let (min_installed_maps, remaining) = u16::try_parse(remaining)?;
-        let (max_installed_maps, remaining) = u16::try_parse(remaining)?;
-        let (root_visual, remaining) = Visualid::try_parse(remaining)?;
-        let (backing_stores, remaining) = u8::try_parse(remaining)?;
-        let (save_unders, remaining) = bool::try_parse(remaining)?;
-        let (root_depth, remaining) = u8::try_parse(remaining)?;
-        let (allowed_depths_len, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let root = Window::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let default_colormap = Colormap::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let white_pixel = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let black_pixel = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let current_input_masks = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let width_in_pixels = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let height_in_pixels = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let width_in_millimeters = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let height_in_millimeters = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let min_installed_maps = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let max_installed_maps = u16::from_ne_bytes([fixed_bytes[30], fixed_bytes[31]]);
+        let root_visual = Visualid::from_ne_bytes([fixed_bytes[32], fixed_bytes[33], fixed_bytes[34], fixed_bytes[35]]);
+        let backing_stores = fixed_bytes[36];
+        let save_unders = fixed_bytes[37] != 0;
+        let root_depth = fixed_bytes[38];
+        let allowed_depths_len = fixed_bytes[39];
         let (allowed_depths, remaining) = crate::x11_utils::parse_list::<Depth>(remaining, allowed_depths_len.try_to_usize()?)?;
         let current_input_masks = current_input_masks.into();
         let backing_stores = backing_stores.into();
@@ -727,13 +708,12 @@ impl_debug_if_no_extra_traits!(SetupRequest, "SetupRequest");
 impl TryParse for SetupRequest {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (byte_order, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (protocol_major_version, remaining) = u16::try_parse(remaining)?;
-        let (protocol_minor_version, remaining) = u16::try_parse(remaining)?;
-        let (authorization_protocol_name_len, remaining) = u16::try_parse(remaining)?;
-        let (authorization_protocol_data_len, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let byte_order = fixed_bytes[0];
+        let protocol_major_version = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let protocol_minor_version = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let authorization_protocol_name_len = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let authorization_protocol_data_len = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
         let (authorization_protocol_name, remaining) = crate::x11_utils::parse_u8_list(remaining, authorization_protocol_name_len.try_to_usize()?)?;
         let authorization_protocol_name = authorization_protocol_name.to_vec();
         // Align offset to multiple of 4
@@ -816,11 +796,12 @@ pub struct SetupFailed {
 impl_debug_if_no_extra_traits!(SetupFailed, "SetupFailed");
 impl TryParse for SetupFailed {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let (reason_len, remaining) = u8::try_parse(remaining)?;
-        let (protocol_major_version, remaining) = u16::try_parse(remaining)?;
-        let (protocol_minor_version, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let status = fixed_bytes[0];
+        let reason_len = fixed_bytes[1];
+        let protocol_major_version = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let protocol_minor_version = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let length = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let (reason, remaining) = crate::x11_utils::parse_u8_list(remaining, reason_len.try_to_usize()?)?;
         let reason = reason.to_vec();
         let result = SetupFailed { status, protocol_major_version, protocol_minor_version, length, reason };
@@ -871,9 +852,9 @@ pub struct SetupAuthenticate {
 impl_debug_if_no_extra_traits!(SetupAuthenticate, "SetupAuthenticate");
 impl TryParse for SetupAuthenticate {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(5..).ok_or(ParseError::InsufficientData)?;
-        let (length, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let status = fixed_bytes[0];
+        let length = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let (reason, remaining) = crate::x11_utils::parse_u8_list(remaining, u32::from(length).checked_mul(4u32).ok_or(ParseError::InvalidExpression)?.try_to_usize()?)?;
         let reason = reason.to_vec();
         let result = SetupAuthenticate { status, reason };
@@ -933,30 +914,7 @@ impl From<ImageOrder> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ImageOrder> for u16 {
-    #[inline]
-    fn from(input: ImageOrder) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ImageOrder> for Option<u16> {
-    #[inline]
-    fn from(input: ImageOrder) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ImageOrder> for u32 {
-    #[inline]
-    fn from(input: ImageOrder) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ImageOrder> for Option<u32> {
-    #[inline]
-    fn from(input: ImageOrder) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ImageOrder, u16, u32);
 impl From<u8> for ImageOrder {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1000,26 +958,25 @@ impl_debug_if_no_extra_traits!(Setup, "Setup");
 impl TryParse for Setup {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (status, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (protocol_major_version, remaining) = u16::try_parse(remaining)?;
-        let (protocol_minor_version, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u16::try_parse(remaining)?;
-        let (release_number, remaining) = u32::try_parse(remaining)?;
-        let (resource_id_base, remaining) = u32::try_parse(remaining)?;
-        let (resource_id_mask, remaining) = u32::try_parse(remaining)?;
-        let (motion_buffer_size, remaining) = u32::try_parse(remaining)?;
-        let (vendor_len, remaining) = u16::try_parse(remaining)?;
-        let (maximum_request_length, remaining) = u16::try_parse(remaining)?;
-        let (roots_len, remaining) = u8::try_parse(remaining)?;
-        let (pixmap_formats_len, remaining) = u8::try_parse(remaining)?;
-        let (image_byte_order, remaining) = u8::try_parse(remaining)?;
-        let (bitmap_format_bit_order, remaining) = u8::try_parse(remaining)?;
-        let (bitmap_format_scanline_unit, remaining) = u8::try_parse(remaining)?;
-        let (bitmap_format_scanline_pad, remaining) = u8::try_parse(remaining)?;
-        let (min_keycode, remaining) = Keycode::try_parse(remaining)?;
-        let (max_keycode, remaining) = Keycode::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<40>(remaining)?;
+        let status = fixed_bytes[0];
+        let protocol_major_version = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let protocol_minor_version = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let length = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let release_number = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let resource_id_base = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let resource_id_mask = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let motion_buffer_size = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let vendor_len = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let maximum_request_length = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let roots_len = fixed_bytes[28];
+        let pixmap_formats_len = fixed_bytes[29];
+        let image_byte_order = fixed_bytes[30];
+        let bitmap_format_bit_order = fixed_bytes[31];
+        let bitmap_format_scanline_unit = fixed_bytes[32];
+        let bitmap_format_scanline_pad = fixed_bytes[33];
+        let min_keycode = fixed_bytes[34];
+        let max_keycode = fixed_bytes[35];
         let (vendor, remaining) = crate::x11_utils::parse_u8_list(remaining, vendor_len.try_to_usize()?)?;
         let vendor = vendor.to_vec();
         // Align offset to multiple of 4
@@ -1140,18 +1097,7 @@ impl From<ModMask> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<ModMask> for u32 {
-    #[inline]
-    fn from(input: ModMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ModMask> for Option<u32> {
-    #[inline]
-    fn from(input: ModMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ModMask, u32);
 impl From<u8> for ModMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1212,18 +1158,7 @@ impl From<KeyButMask> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<KeyButMask> for u32 {
-    #[inline]
-    fn from(input: KeyButMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<KeyButMask> for Option<u32> {
-    #[inline]
-    fn from(input: KeyButMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(KeyButMask, u32);
 impl From<u8> for KeyButMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1276,30 +1211,7 @@ impl From<WindowEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<WindowEnum> for u16 {
-    #[inline]
-    fn from(input: WindowEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<WindowEnum> for Option<u16> {
-    #[inline]
-    fn from(input: WindowEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<WindowEnum> for u32 {
-    #[inline]
-    fn from(input: WindowEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<WindowEnum> for Option<u32> {
-    #[inline]
-    fn from(input: WindowEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(WindowEnum, u16, u32);
 impl From<u8> for WindowEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1363,20 +1275,20 @@ impl_debug_if_no_extra_traits!(KeyPressEvent, "KeyPressEvent");
 impl TryParse for KeyPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = Keycode::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (root, remaining) = Window::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (child, remaining) = Window::try_parse(remaining)?;
-        let (root_x, remaining) = i16::try_parse(remaining)?;
-        let (root_y, remaining) = i16::try_parse(remaining)?;
-        let (event_x, remaining) = i16::try_parse(remaining)?;
-        let (event_y, remaining) = i16::try_parse(remaining)?;
-        let (state, remaining) = u16::try_parse(remaining)?;
-        let (same_screen, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let root = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let event = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let child = Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root_x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let root_y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let event_x = i16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let event_y = i16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let state = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let same_screen = fixed_bytes[30] != 0;
         let state = state.into();
         let result = KeyPressEvent { response_type, detail, sequence, time, root, event, child, root_x, root_y, event_x, event_y, state, same_screen };
         let _ = remaining;
@@ -1538,18 +1450,7 @@ impl From<ButtonMask> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<ButtonMask> for u32 {
-    #[inline]
-    fn from(input: ButtonMask) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ButtonMask> for Option<u32> {
-    #[inline]
-    fn from(input: ButtonMask) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ButtonMask, u32);
 impl From<u8> for ButtonMask {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1625,20 +1526,20 @@ impl_debug_if_no_extra_traits!(ButtonPressEvent, "ButtonPressEvent");
 impl TryParse for ButtonPressEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = Button::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (root, remaining) = Window::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (child, remaining) = Window::try_parse(remaining)?;
-        let (root_x, remaining) = i16::try_parse(remaining)?;
-        let (root_y, remaining) = i16::try_parse(remaining)?;
-        let (event_x, remaining) = i16::try_parse(remaining)?;
-        let (event_y, remaining) = i16::try_parse(remaining)?;
-        let (state, remaining) = u16::try_parse(remaining)?;
-        let (same_screen, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let root = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let event = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let child = Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root_x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let root_y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let event_x = i16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let event_y = i16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let state = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let same_screen = fixed_bytes[30] != 0;
         let state = state.into();
         let result = ButtonPressEvent { response_type, detail, sequence, time, root, event, child, root_x, root_y, event_x, event_y, state, same_screen };
         let _ = remaining;
@@ -1796,30 +1697,7 @@ impl From<Motion> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Motion> for u16 {
-    #[inline]
-    fn from(input: Motion) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Motion> for Option<u16> {
-    #[inline]
-    fn from(input: Motion) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Motion> for u32 {
-    #[inline]
-    fn from(input: Motion) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Motion> for Option<u32> {
-    #[inline]
-    fn from(input: Motion) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Motion, u16, u32);
 impl From<u8> for Motion {
     #[inline]
     fn from(value: u8) -> Self {
@@ -1884,20 +1762,20 @@ impl_debug_if_no_extra_traits!(MotionNotifyEvent, "MotionNotifyEvent");
 impl TryParse for MotionNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (root, remaining) = Window::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (child, remaining) = Window::try_parse(remaining)?;
-        let (root_x, remaining) = i16::try_parse(remaining)?;
-        let (root_y, remaining) = i16::try_parse(remaining)?;
-        let (event_x, remaining) = i16::try_parse(remaining)?;
-        let (event_y, remaining) = i16::try_parse(remaining)?;
-        let (state, remaining) = u16::try_parse(remaining)?;
-        let (same_screen, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let root = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let event = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let child = Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root_x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let root_y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let event_x = i16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let event_y = i16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let state = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let same_screen = fixed_bytes[30] != 0;
         let detail = detail.into();
         let state = state.into();
         let result = MotionNotifyEvent { response_type, detail, sequence, time, root, event, child, root_x, root_y, event_x, event_y, state, same_screen };
@@ -2058,30 +1936,7 @@ impl From<NotifyDetail> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<NotifyDetail> for u16 {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<NotifyDetail> for Option<u16> {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<NotifyDetail> for u32 {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<NotifyDetail> for Option<u32> {
-    #[inline]
-    fn from(input: NotifyDetail) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(NotifyDetail, u16, u32);
 impl From<u8> for NotifyDetail {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2125,30 +1980,7 @@ impl From<NotifyMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<NotifyMode> for u16 {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<NotifyMode> for Option<u16> {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<NotifyMode> for u32 {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<NotifyMode> for Option<u32> {
-    #[inline]
-    fn from(input: NotifyMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(NotifyMode, u16, u32);
 impl From<u8> for NotifyMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -2207,20 +2039,21 @@ impl_debug_if_no_extra_traits!(EnterNotifyEvent, "EnterNotifyEvent");
 impl TryParse for EnterNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (root, remaining) = Window::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (child, remaining) = Window::try_parse(remaining)?;
-        let (root_x, remaining) = i16::try_parse(remaining)?;
-        let (root_y, remaining) = i16::try_parse(remaining)?;
-        let (event_x, remaining) = i16::try_parse(remaining)?;
-        let (event_y, remaining) = i16::try_parse(remaining)?;
-        let (state, remaining) = u16::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let (same_screen_focus, remaining) = u8::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let root = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let event = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let child = Window::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let root_x = i16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let root_y = i16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let event_x = i16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let event_y = i16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
+        let state = u16::from_ne_bytes([fixed_bytes[28], fixed_bytes[29]]);
+        let mode = fixed_bytes[30];
+        let same_screen_focus = fixed_bytes[31];
         let detail = detail.into();
         let state = state.into();
         let mode = mode.into();
@@ -2387,12 +2220,12 @@ impl_debug_if_no_extra_traits!(FocusInEvent, "FocusInEvent");
 impl TryParse for FocusInEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (detail, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (mode, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let detail = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let mode = fixed_bytes[8];
         let detail = detail.into();
         let mode = mode.into();
         let result = FocusInEvent { response_type, detail, sequence, event, mode };
@@ -2635,16 +2468,15 @@ impl_debug_if_no_extra_traits!(ExposeEvent, "ExposeEvent");
 impl TryParse for ExposeEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (x, remaining) = u16::try_parse(remaining)?;
-        let (y, remaining) = u16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (count, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let x = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let y = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let width = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let height = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let count = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
         let result = ExposeEvent { response_type, sequence, window, x, y, width, height, count };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -2774,18 +2606,17 @@ impl_debug_if_no_extra_traits!(GraphicsExposureEvent, "GraphicsExposureEvent");
 impl TryParse for GraphicsExposureEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (drawable, remaining) = Drawable::try_parse(remaining)?;
-        let (x, remaining) = u16::try_parse(remaining)?;
-        let (y, remaining) = u16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (minor_opcode, remaining) = u16::try_parse(remaining)?;
-        let (count, remaining) = u16::try_parse(remaining)?;
-        let (major_opcode, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let drawable = Drawable::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let x = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let y = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let width = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let height = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let minor_opcode = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let count = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let major_opcode = fixed_bytes[20];
         let result = GraphicsExposureEvent { response_type, sequence, drawable, x, y, width, height, minor_opcode, count, major_opcode };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -2920,13 +2751,12 @@ impl_debug_if_no_extra_traits!(NoExposureEvent, "NoExposureEvent");
 impl TryParse for NoExposureEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (drawable, remaining) = Drawable::try_parse(remaining)?;
-        let (minor_opcode, remaining) = u16::try_parse(remaining)?;
-        let (major_opcode, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let drawable = Drawable::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let minor_opcode = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let major_opcode = fixed_bytes[10];
         let result = NoExposureEvent { response_type, sequence, drawable, minor_opcode, major_opcode };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -3038,30 +2868,7 @@ impl From<Visibility> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Visibility> for u16 {
-    #[inline]
-    fn from(input: Visibility) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Visibility> for Option<u16> {
-    #[inline]
-    fn from(input: Visibility) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Visibility> for u32 {
-    #[inline]
-    fn from(input: Visibility) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Visibility> for Option<u32> {
-    #[inline]
-    fn from(input: Visibility) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Visibility, u16, u32);
 impl From<u8> for Visibility {
     #[inline]
     fn from(value: u8) -> Self {
@@ -3094,12 +2901,11 @@ impl_debug_if_no_extra_traits!(VisibilityNotifyEvent, "VisibilityNotifyEvent");
 impl TryParse for VisibilityNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (state, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let state = fixed_bytes[8];
         let state = state.into();
         let result = VisibilityNotifyEvent { response_type, sequence, window, state };
         let _ = remaining;
@@ -3210,18 +3016,17 @@ impl_debug_if_no_extra_traits!(CreateNotifyEvent, "CreateNotifyEvent");
 impl TryParse for CreateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (parent, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (border_width, remaining) = u16::try_parse(remaining)?;
-        let (override_redirect, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let parent = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let x = i16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let y = i16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let width = u16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let height = u16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let border_width = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let override_redirect = fixed_bytes[22] != 0;
         let result = CreateNotifyEvent { response_type, sequence, parent, window, x, y, width, height, border_width, override_redirect };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -3366,11 +3171,11 @@ impl_debug_if_no_extra_traits!(DestroyNotifyEvent, "DestroyNotifyEvent");
 impl TryParse for DestroyNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = DestroyNotifyEvent { response_type, sequence, event, window };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -3487,13 +3292,12 @@ impl_debug_if_no_extra_traits!(UnmapNotifyEvent, "UnmapNotifyEvent");
 impl TryParse for UnmapNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (from_configure, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let from_configure = fixed_bytes[12] != 0;
         let result = UnmapNotifyEvent { response_type, sequence, event, window, from_configure };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -3617,13 +3421,12 @@ impl_debug_if_no_extra_traits!(MapNotifyEvent, "MapNotifyEvent");
 impl TryParse for MapNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (override_redirect, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let override_redirect = fixed_bytes[12] != 0;
         let result = MapNotifyEvent { response_type, sequence, event, window, override_redirect };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -3744,11 +3547,11 @@ impl_debug_if_no_extra_traits!(MapRequestEvent, "MapRequestEvent");
 impl TryParse for MapRequestEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (parent, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let parent = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let result = MapRequestEvent { response_type, sequence, parent, window };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -3855,16 +3658,15 @@ impl_debug_if_no_extra_traits!(ReparentNotifyEvent, "ReparentNotifyEvent");
 impl TryParse for ReparentNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (parent, remaining) = Window::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (override_redirect, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let parent = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let x = i16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let y = i16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let override_redirect = fixed_bytes[20] != 0;
         let result = ReparentNotifyEvent { response_type, sequence, event, window, parent, x, y, override_redirect };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -4021,19 +3823,18 @@ impl_debug_if_no_extra_traits!(ConfigureNotifyEvent, "ConfigureNotifyEvent");
 impl TryParse for ConfigureNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (above_sibling, remaining) = Window::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (border_width, remaining) = u16::try_parse(remaining)?;
-        let (override_redirect, remaining) = bool::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let above_sibling = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let x = i16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let y = i16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let width = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let height = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let border_width = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let override_redirect = fixed_bytes[26] != 0;
         let result = ConfigureNotifyEvent { response_type, sequence, event, window, above_sibling, x, y, width, height, border_width, override_redirect };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -4182,18 +3983,19 @@ impl_debug_if_no_extra_traits!(ConfigureRequestEvent, "ConfigureRequestEvent");
 impl TryParse for ConfigureRequestEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (stack_mode, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (parent, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (sibling, remaining) = Window::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (border_width, remaining) = u16::try_parse(remaining)?;
-        let (value_mask, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let stack_mode = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let parent = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let sibling = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let x = i16::from_ne_bytes([fixed_bytes[16], fixed_bytes[17]]);
+        let y = i16::from_ne_bytes([fixed_bytes[18], fixed_bytes[19]]);
+        let width = u16::from_ne_bytes([fixed_bytes[20], fixed_bytes[21]]);
+        let height = u16::from_ne_bytes([fixed_bytes[22], fixed_bytes[23]]);
+        let border_width = u16::from_ne_bytes([fixed_bytes[24], fixed_bytes[25]]);
+        let value_mask = u16::from_ne_bytes([fixed_bytes[26], fixed_bytes[27]]);
         let stack_mode = stack_mode.into();
         let value_mask = value_mask.into();
         let result = ConfigureRequestEvent { response_type, stack_mode, sequence, parent, window, sibling, x, y, width, height, border_width, value_mask };
@@ -4339,13 +4141,13 @@ impl_debug_if_no_extra_traits!(GravityNotifyEvent, "GravityNotifyEvent");
 impl TryParse for GravityNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let x = i16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let y = i16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
         let result = GravityNotifyEvent { response_type, sequence, event, window, x, y };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -4459,12 +4261,12 @@ impl_debug_if_no_extra_traits!(ResizeRequestEvent, "ResizeRequestEvent");
 impl TryParse for ResizeRequestEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let width = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let height = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let result = ResizeRequestEvent { response_type, sequence, window, width, height };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -4555,53 +4357,30 @@ impl From<ResizeRequestEvent> for [u8; 32] {
     }
 }
 
-/// # Fields
-///
-/// * `OnTop` - The window is now on top of all siblings.
-/// * `OnBottom` - The window is now below all siblings.
-#[derive(Clone, Copy, Default, PartialEq, Eq, PartialOrd, Ord, Hash)]
-#[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
-pub struct Place(u8);
-impl Place {
-    pub const ON_TOP: Self = Self(0);
-    pub const ON_BOTTOM: Self = Self(1);
-}
-impl From<Place> for u8 {
-    #[inline]
-    fn from(input: Place) -> Self {
-        input.0
-    }
-}
-impl From<Place> for Option<u8> {
-    #[inline]
-    fn from(input: Place) -> Self {
-        Some(input.0)
-    }
-}
-impl From<Place> for u16 {
-    #[inline]
-    fn from(input: Place) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Place> for Option<u16> {
-    #[inline]
-    fn from(input: Place) -> Self {
-        Some(u16::from(input.0))
-    }
+/// # Fields
+///
+/// * `OnTop` - The window is now on top of all siblings.
+/// * `OnBottom` - The window is now below all siblings.
+#[derive(Clone, Copy, Default, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
+pub struct Place(u8);
+impl Place {
+    pub const ON_TOP: Self = Self(0);
+    pub const ON_BOTTOM: Self = Self(1);
 }
-impl From<Place> for u32 {
+impl From<Place> for u8 {
     #[inline]
     fn from(input: Place) -> Self {
-        u32::from(input.0)
+        input.0
     }
 }
-impl From<Place> for Option<u32> {
+impl From<Place> for Option<u8> {
     #[inline]
     fn from(input: Place) -> Self {
-        Some(u32::from(input.0))
+        Some(input.0)
     }
 }
+enum_into_larger!(Place, u16, u32);
 impl From<u8> for Place {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4646,14 +4425,12 @@ impl_debug_if_no_extra_traits!(CirculateNotifyEvent, "CirculateNotifyEvent");
 impl TryParse for CirculateNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (event, remaining) = Window::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let remaining = remaining.get(4..).ok_or(ParseError::InsufficientData)?;
-        let (place, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let event = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let window = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let place = fixed_bytes[16];
         let place = place.into();
         let result = CirculateNotifyEvent { response_type, sequence, event, window, place };
         let _ = remaining;
@@ -4778,30 +4555,7 @@ impl From<Property> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Property> for u16 {
-    #[inline]
-    fn from(input: Property) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Property> for Option<u16> {
-    #[inline]
-    fn from(input: Property) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Property> for u32 {
-    #[inline]
-    fn from(input: Property) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Property> for Option<u32> {
-    #[inline]
-    fn from(input: Property) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Property, u16, u32);
 impl From<u8> for Property {
     #[inline]
     fn from(value: u8) -> Self {
@@ -4847,14 +4601,13 @@ impl_debug_if_no_extra_traits!(PropertyNotifyEvent, "PropertyNotifyEvent");
 impl TryParse for PropertyNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (atom, remaining) = Atom::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (state, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let atom = Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let state = fixed_bytes[16];
         let state = state.into();
         let result = PropertyNotifyEvent { response_type, sequence, window, atom, time, state };
         let _ = remaining;
@@ -4974,12 +4727,12 @@ impl_debug_if_no_extra_traits!(SelectionClearEvent, "SelectionClearEvent");
 impl TryParse for SelectionClearEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (owner, remaining) = Window::try_parse(remaining)?;
-        let (selection, remaining) = Atom::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let owner = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let selection = Atom::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let result = SelectionClearEvent { response_type, sequence, time, owner, selection };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -5092,30 +4845,7 @@ impl From<Time> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Time> for u16 {
-    #[inline]
-    fn from(input: Time) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Time> for Option<u16> {
-    #[inline]
-    fn from(input: Time) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Time> for u32 {
-    #[inline]
-    fn from(input: Time) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Time> for Option<u32> {
-    #[inline]
-    fn from(input: Time) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Time, u16, u32);
 impl From<u8> for Time {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5218,30 +4948,7 @@ impl From<AtomEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<AtomEnum> for u16 {
-    #[inline]
-    fn from(input: AtomEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<AtomEnum> for Option<u16> {
-    #[inline]
-    fn from(input: AtomEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<AtomEnum> for u32 {
-    #[inline]
-    fn from(input: AtomEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<AtomEnum> for Option<u32> {
-    #[inline]
-    fn from(input: AtomEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(AtomEnum, u16, u32);
 impl From<u8> for AtomEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5345,15 +5052,15 @@ impl_debug_if_no_extra_traits!(SelectionRequestEvent, "SelectionRequestEvent");
 impl TryParse for SelectionRequestEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (owner, remaining) = Window::try_parse(remaining)?;
-        let (requestor, remaining) = Window::try_parse(remaining)?;
-        let (selection, remaining) = Atom::try_parse(remaining)?;
-        let (target, remaining) = Atom::try_parse(remaining)?;
-        let (property, remaining) = Atom::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<28>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let owner = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let requestor = Window::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let selection = Atom::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let target = Atom::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
+        let property = Atom::from_ne_bytes([fixed_bytes[24], fixed_bytes[25], fixed_bytes[26], fixed_bytes[27]]);
         let result = SelectionRequestEvent { response_type, sequence, time, owner, requestor, selection, target, property };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -5487,14 +5194,14 @@ impl_debug_if_no_extra_traits!(SelectionNotifyEvent, "SelectionNotifyEvent");
 impl TryParse for SelectionNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (requestor, remaining) = Window::try_parse(remaining)?;
-        let (selection, remaining) = Atom::try_parse(remaining)?;
-        let (target, remaining) = Atom::try_parse(remaining)?;
-        let (property, remaining) = Atom::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let requestor = Window::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let selection = Atom::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let target = Atom::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let property = Atom::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
         let result = SelectionNotifyEvent { response_type, sequence, time, requestor, selection, target, property };
         let _ = remaining;
         let remaining = initial_value.get(32..)
@@ -5626,30 +5333,7 @@ impl From<ColormapState> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ColormapState> for u16 {
-    #[inline]
-    fn from(input: ColormapState) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ColormapState> for Option<u16> {
-    #[inline]
-    fn from(input: ColormapState) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ColormapState> for u32 {
-    #[inline]
-    fn from(input: ColormapState) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ColormapState> for Option<u32> {
-    #[inline]
-    fn from(input: ColormapState) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ColormapState, u16, u32);
 impl From<u8> for ColormapState {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5684,30 +5368,7 @@ impl From<ColormapEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ColormapEnum> for u16 {
-    #[inline]
-    fn from(input: ColormapEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ColormapEnum> for Option<u16> {
-    #[inline]
-    fn from(input: ColormapEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ColormapEnum> for u32 {
-    #[inline]
-    fn from(input: ColormapEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ColormapEnum> for Option<u32> {
-    #[inline]
-    fn from(input: ColormapEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ColormapEnum, u16, u32);
 impl From<u8> for ColormapEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -5753,14 +5414,13 @@ impl_debug_if_no_extra_traits!(ColormapNotifyEvent, "ColormapNotifyEvent");
 impl TryParse for ColormapNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (colormap, remaining) = Colormap::try_parse(remaining)?;
-        let (new, remaining) = bool::try_parse(remaining)?;
-        let (state, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let colormap = Colormap::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let new = fixed_bytes[12] != 0;
+        let state = fixed_bytes[13];
         let state = state.into();
         let result = ColormapNotifyEvent { response_type, sequence, window, colormap, new, state };
         let _ = remaining;
@@ -5874,28 +5534,7 @@ impl ClientMessageData {
     }
     pub fn as_data16(&self) -> [u16; 10] {
         fn do_the_parse(remaining: &[u8]) -> Result<[u16; 10], ParseError> {
-            let (data16_0, remaining) = u16::try_parse(remaining)?;
-            let (data16_1, remaining) = u16::try_parse(remaining)?;
-            let (data16_2, remaining) = u16::try_parse(remaining)?;
-            let (data16_3, remaining) = u16::try_parse(remaining)?;
-            let (data16_4, remaining) = u16::try_parse(remaining)?;
-            let (data16_5, remaining) = u16::try_parse(remaining)?;
-            let (data16_6, remaining) = u16::try_parse(remaining)?;
-            let (data16_7, remaining) = u16::try_parse(remaining)?;
-            let (data16_8, remaining) = u16::try_parse(remaining)?;
-            let (data16_9, remaining) = u16::try_parse(remaining)?;
-            let data16 = [
-                data16_0,
-                data16_1,
-                data16_2,
-                data16_3,
-                data16_4,
-                data16_5,
-                data16_6,
-                data16_7,
-                data16_8,
-                data16_9,
-            ];
+            let (data16, remaining) = crate::x11_utils::parse_array::<u16, 10>(remaining)?;
             let _ = remaining;
             Ok(data16)
         }
@@ -5903,18 +5542,7 @@ impl ClientMessageData {
     }
     pub fn as_data32(&self) -> [u32; 5] {
         fn do_the_parse(remaining: &[u8]) -> Result<[u32; 5], ParseError> {
-            let (data32_0, remaining) = u32::try_parse(remaining)?;
-            let (data32_1, remaining) = u32::try_parse(remaining)?;
-            let (data32_2, remaining) = u32::try_parse(remaining)?;
-            let (data32_3, remaining) = u32::try_parse(remaining)?;
-            let (data32_4, remaining) = u32::try_parse(remaining)?;
-            let data32 = [
-                data32_0,
-                data32_1,
-                data32_2,
-                data32_3,
-                data32_4,
-            ];
+            let (data32, remaining) = crate::x11_utils::parse_array::<u32, 5>(remaining)?;
             let _ = remaining;
             Ok(data32)
         }
@@ -6049,11 +5677,12 @@ impl_debug_if_no_extra_traits!(ClientMessageEvent, "ClientMessageEvent");
 impl TryParse for ClientMessageEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (format, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (window, remaining) = Window::try_parse(remaining)?;
-        let (type_, remaining) = Atom::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let format = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let window = Window::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let type_ = Atom::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let (data, remaining) = ClientMessageData::try_parse(remaining)?;
         let result = ClientMessageEvent { response_type, format, sequence, window, type_, data };
         let _ = remaining;
@@ -6206,30 +5835,7 @@ impl From<Mapping> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Mapping> for u16 {
-    #[inline]
-    fn from(input: Mapping) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Mapping> for Option<u16> {
-    #[inline]
-    fn from(input: Mapping) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Mapping> for u32 {
-    #[inline]
-    fn from(input: Mapping) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Mapping> for Option<u32> {
-    #[inline]
-    fn from(input: Mapping) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Mapping, u16, u32);
 impl From<u8> for Mapping {
     #[inline]
     fn from(value: u8) -> Self {
@@ -6270,13 +5876,12 @@ impl_debug_if_no_extra_traits!(MappingNotifyEvent, "MappingNotifyEvent");
 impl TryParse for MappingNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (request, remaining) = u8::try_parse(remaining)?;
-        let (first_keycode, remaining) = Keycode::try_parse(remaining)?;
-        let (count, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let request = fixed_bytes[4];
+        let first_keycode = fixed_bytes[5];
+        let count = fixed_bytes[6];
         let request = request.into();
         let result = MappingNotifyEvent { response_type, sequence, request, first_keycode, count };
         let _ = remaining;
@@ -6388,12 +5993,12 @@ impl_debug_if_no_extra_traits!(GeGenericEvent, "GeGenericEvent");
 impl TryParse for GeGenericEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (extension, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (length, remaining) = u32::try_parse(remaining)?;
-        let (event_type, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(22..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<32>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let extension = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let length = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let event_type = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
         let result = GeGenericEvent { response_type, extension, sequence, length, event_type };
         let _ = remaining;
         let remaining = initial_value.get(32 + length as usize * 4..)
@@ -6526,18 +6131,7 @@ impl From<WindowClass> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<WindowClass> for u32 {
-    #[inline]
-    fn from(input: WindowClass) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<WindowClass> for Option<u32> {
-    #[inline]
-    fn from(input: WindowClass) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(WindowClass, u32);
 impl From<u8> for WindowClass {
     #[inline]
     fn from(value: u8) -> Self {
@@ -6724,42 +6318,7 @@ impl From<BackPixmap> for Option<bool> {
         Some(input.0)
     }
 }
-impl From<BackPixmap> for u8 {
-    #[inline]
-    fn from(input: BackPixmap) -> Self {
-        u8::from(input.0)
-    }
-}
-impl From<BackPixmap> for Option<u8> {
-    #[inline]
-    fn from(input: BackPixmap) -> Self {
-        Some(u8::from(input.0))
-    }
-}
-impl From<BackPixmap> for u16 {
-    #[inline]
-    fn from(input: BackPixmap) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<BackPixmap> for Option<u16> {
-    #[inline]
-    fn from(input: BackPixmap) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<BackPixmap> for u32 {
-    #[inline]
-    fn from(input: BackPixmap) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<BackPixmap> for Option<u32> {
-    #[inline]
-    fn from(input: BackPixmap) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(BackPixmap, u8, u16, u32);
 impl From<bool> for BackPixmap {
     #[inline]
     fn from(value: bool) -> Self {
@@ -7882,30 +7441,7 @@ impl From<MapState> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<MapState> for u16 {
-    #[inline]
-    fn from(input: MapState) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<MapState> for Option<u16> {
-    #[inline]
-    fn from(input: MapState) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<MapState> for u32 {
-    #[inline]
-    fn from(input: MapState) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<MapState> for Option<u32> {
-    #[inline]
-    fn from(input: MapState) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(MapState, u16, u32);
 impl From<u8> for MapState {
     #[inline]
     fn from(value: u8) -> Self {
@@ -8326,30 +7862,7 @@ impl From<SetMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<SetMode> for u16 {
-    #[inline]
-    fn from(input: SetMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SetMode> for Option<u16> {
-    #[inline]
-    fn from(input: SetMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SetMode> for u32 {
-    #[inline]
-    fn from(input: SetMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SetMode> for Option<u32> {
-    #[inline]
-    fn from(input: SetMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SetMode, u16, u32);
 impl From<u8> for SetMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -8472,11 +7985,11 @@ pub const REPARENT_WINDOW_REQUEST: u8 = 7;
 /// # Errors
 ///
 /// * `Match` - The new parent window is not on the same screen as the old parent window.
-///   
+///
 ///   The new parent window is the specified window or an inferior of the specified window.
-///   
+///
 ///   The new parent is InputOnly and the window is not.
-///   
+///
 ///   The specified window has a ParentRelative background and the new parent window is not the same depth as the specified window.
 /// * `Window` - The specified window does not exist.
 ///
@@ -8878,18 +8391,7 @@ impl From<ConfigWindow> for Option<u16> {
         Some(input.0)
     }
 }
-impl From<ConfigWindow> for u32 {
-    #[inline]
-    fn from(input: ConfigWindow) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ConfigWindow> for Option<u32> {
-    #[inline]
-    fn from(input: ConfigWindow) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ConfigWindow, u32);
 impl From<u8> for ConfigWindow {
     #[inline]
     fn from(value: u8) -> Self {
@@ -9338,33 +8840,10 @@ impl From<Circulate> for u8 {
 impl From<Circulate> for Option<u8> {
     #[inline]
     fn from(input: Circulate) -> Self {
-        Some(input.0)
-    }
-}
-impl From<Circulate> for u16 {
-    #[inline]
-    fn from(input: Circulate) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Circulate> for Option<u16> {
-    #[inline]
-    fn from(input: Circulate) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Circulate> for u32 {
-    #[inline]
-    fn from(input: Circulate) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Circulate> for Option<u32> {
-    #[inline]
-    fn from(input: Circulate) -> Self {
-        Some(u32::from(input.0))
+        Some(input.0)
     }
 }
+enum_into_larger!(Circulate, u16, u32);
 impl From<u8> for Circulate {
     #[inline]
     fn from(value: u8) -> Self {
@@ -10173,30 +9652,7 @@ impl From<PropMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PropMode> for u16 {
-    #[inline]
-    fn from(input: PropMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PropMode> for Option<u16> {
-    #[inline]
-    fn from(input: PropMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PropMode> for u32 {
-    #[inline]
-    fn from(input: PropMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PropMode> for Option<u32> {
-    #[inline]
-    fn from(input: PropMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PropMode, u16, u32);
 impl From<u8> for PropMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -10465,30 +9921,7 @@ impl From<GetPropertyType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GetPropertyType> for u16 {
-    #[inline]
-    fn from(input: GetPropertyType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GetPropertyType> for Option<u16> {
-    #[inline]
-    fn from(input: GetPropertyType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GetPropertyType> for u32 {
-    #[inline]
-    fn from(input: GetPropertyType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GetPropertyType> for Option<u32> {
-    #[inline]
-    fn from(input: GetPropertyType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GetPropertyType, u16, u32);
 impl From<u8> for GetPropertyType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -11372,42 +10805,7 @@ impl From<SendEventDest> for Option<bool> {
         Some(input.0)
     }
 }
-impl From<SendEventDest> for u8 {
-    #[inline]
-    fn from(input: SendEventDest) -> Self {
-        u8::from(input.0)
-    }
-}
-impl From<SendEventDest> for Option<u8> {
-    #[inline]
-    fn from(input: SendEventDest) -> Self {
-        Some(u8::from(input.0))
-    }
-}
-impl From<SendEventDest> for u16 {
-    #[inline]
-    fn from(input: SendEventDest) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<SendEventDest> for Option<u16> {
-    #[inline]
-    fn from(input: SendEventDest) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<SendEventDest> for u32 {
-    #[inline]
-    fn from(input: SendEventDest) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<SendEventDest> for Option<u32> {
-    #[inline]
-    fn from(input: SendEventDest) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(SendEventDest, u8, u16, u32);
 impl From<bool> for SendEventDest {
     #[inline]
     fn from(value: bool) -> Self {
@@ -11606,30 +11004,7 @@ impl From<GrabMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GrabMode> for u16 {
-    #[inline]
-    fn from(input: GrabMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GrabMode> for Option<u16> {
-    #[inline]
-    fn from(input: GrabMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GrabMode> for u32 {
-    #[inline]
-    fn from(input: GrabMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GrabMode> for Option<u32> {
-    #[inline]
-    fn from(input: GrabMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GrabMode, u16, u32);
 impl From<u8> for GrabMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -11668,30 +11043,7 @@ impl From<GrabStatus> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GrabStatus> for u16 {
-    #[inline]
-    fn from(input: GrabStatus) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GrabStatus> for Option<u16> {
-    #[inline]
-    fn from(input: GrabStatus) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GrabStatus> for u32 {
-    #[inline]
-    fn from(input: GrabStatus) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GrabStatus> for Option<u32> {
-    #[inline]
-    fn from(input: GrabStatus) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GrabStatus, u16, u32);
 impl From<u8> for GrabStatus {
     #[inline]
     fn from(value: u8) -> Self {
@@ -11729,30 +11081,7 @@ impl From<CursorEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<CursorEnum> for u16 {
-    #[inline]
-    fn from(input: CursorEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CursorEnum> for Option<u16> {
-    #[inline]
-    fn from(input: CursorEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CursorEnum> for u32 {
-    #[inline]
-    fn from(input: CursorEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CursorEnum> for Option<u32> {
-    #[inline]
-    fn from(input: CursorEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CursorEnum, u16, u32);
 impl From<u8> for CursorEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -12113,30 +11442,7 @@ impl From<ButtonIndex> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ButtonIndex> for u16 {
-    #[inline]
-    fn from(input: ButtonIndex) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ButtonIndex> for Option<u16> {
-    #[inline]
-    fn from(input: ButtonIndex) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ButtonIndex> for u32 {
-    #[inline]
-    fn from(input: ButtonIndex) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ButtonIndex> for Option<u32> {
-    #[inline]
-    fn from(input: ButtonIndex) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ButtonIndex, u16, u32);
 impl From<u8> for ButtonIndex {
     #[inline]
     fn from(value: u8) -> Self {
@@ -12766,30 +12072,7 @@ impl From<Grab> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Grab> for u16 {
-    #[inline]
-    fn from(input: Grab) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Grab> for Option<u16> {
-    #[inline]
-    fn from(input: Grab) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Grab> for u32 {
-    #[inline]
-    fn from(input: Grab) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Grab> for Option<u32> {
-    #[inline]
-    fn from(input: Grab) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Grab, u16, u32);
 impl From<u8> for Grab {
     #[inline]
     fn from(value: u8) -> Self {
@@ -13135,30 +12418,7 @@ impl From<Allow> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Allow> for u16 {
-    #[inline]
-    fn from(input: Allow) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Allow> for Option<u16> {
-    #[inline]
-    fn from(input: Allow) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Allow> for u32 {
-    #[inline]
-    fn from(input: Allow) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Allow> for Option<u32> {
-    #[inline]
-    fn from(input: Allow) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Allow, u16, u32);
 impl From<u8> for Allow {
     #[inline]
     fn from(value: u8) -> Self {
@@ -13570,9 +12830,10 @@ pub struct Timecoord {
 impl_debug_if_no_extra_traits!(Timecoord, "Timecoord");
 impl TryParse for Timecoord {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (time, remaining) = Timestamp::try_parse(remaining)?;
-        let (x, remaining) = i16::try_parse(remaining)?;
-        let (y, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let time = Timestamp::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let x = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let y = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = Timecoord { time, x, y };
         Ok((result, remaining))
     }
@@ -14062,30 +13323,7 @@ impl From<InputFocus> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<InputFocus> for u16 {
-    #[inline]
-    fn from(input: InputFocus) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<InputFocus> for Option<u16> {
-    #[inline]
-    fn from(input: InputFocus) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<InputFocus> for u32 {
-    #[inline]
-    fn from(input: InputFocus) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<InputFocus> for Option<u32> {
-    #[inline]
-    fn from(input: InputFocus) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(InputFocus, u16, u32);
 impl From<u8> for InputFocus {
     #[inline]
     fn from(value: u8) -> Self {
@@ -14639,30 +13877,7 @@ impl From<FontDraw> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<FontDraw> for u16 {
-    #[inline]
-    fn from(input: FontDraw) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<FontDraw> for Option<u16> {
-    #[inline]
-    fn from(input: FontDraw) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<FontDraw> for u32 {
-    #[inline]
-    fn from(input: FontDraw) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<FontDraw> for Option<u32> {
-    #[inline]
-    fn from(input: FontDraw) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(FontDraw, u16, u32);
 impl From<u8> for FontDraw {
     #[inline]
     fn from(value: u8) -> Self {
@@ -14689,8 +13904,9 @@ pub struct Fontprop {
 impl_debug_if_no_extra_traits!(Fontprop, "Fontprop");
 impl TryParse for Fontprop {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (name, remaining) = Atom::try_parse(remaining)?;
-        let (value, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let name = Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let value = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Fontprop { name, value };
         Ok((result, remaining))
     }
@@ -14732,12 +13948,13 @@ pub struct Charinfo {
 impl_debug_if_no_extra_traits!(Charinfo, "Charinfo");
 impl TryParse for Charinfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (left_side_bearing, remaining) = i16::try_parse(remaining)?;
-        let (right_side_bearing, remaining) = i16::try_parse(remaining)?;
-        let (character_width, remaining) = i16::try_parse(remaining)?;
-        let (ascent, remaining) = i16::try_parse(remaining)?;
-        let (descent, remaining) = i16::try_parse(remaining)?;
-        let (attributes, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let left_side_bearing = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let right_side_bearing = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let character_width = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let ascent = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let descent = i16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let attributes = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
         let result = Charinfo { left_side_bearing, right_side_bearing, character_width, ascent, descent, attributes };
         Ok((result, remaining))
     }
@@ -18077,30 +17294,7 @@ impl From<ClipOrdering> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ClipOrdering> for u16 {
-    #[inline]
-    fn from(input: ClipOrdering) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ClipOrdering> for Option<u16> {
-    #[inline]
-    fn from(input: ClipOrdering) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ClipOrdering> for u32 {
-    #[inline]
-    fn from(input: ClipOrdering) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ClipOrdering> for Option<u32> {
-    #[inline]
-    fn from(input: ClipOrdering) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ClipOrdering, u16, u32);
 impl From<u8> for ClipOrdering {
     #[inline]
     fn from(value: u8) -> Self {
@@ -18648,30 +17842,7 @@ impl From<CoordMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<CoordMode> for u16 {
-    #[inline]
-    fn from(input: CoordMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CoordMode> for Option<u16> {
-    #[inline]
-    fn from(input: CoordMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CoordMode> for u32 {
-    #[inline]
-    fn from(input: CoordMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CoordMode> for Option<u32> {
-    #[inline]
-    fn from(input: CoordMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CoordMode, u16, u32);
 impl From<u8> for CoordMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -18927,10 +18098,11 @@ pub struct Segment {
 impl_debug_if_no_extra_traits!(Segment, "Segment");
 impl TryParse for Segment {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (x1, remaining) = i16::try_parse(remaining)?;
-        let (y1, remaining) = i16::try_parse(remaining)?;
-        let (x2, remaining) = i16::try_parse(remaining)?;
-        let (y2, remaining) = i16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let x1 = i16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let y1 = i16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let x2 = i16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let y2 = i16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
         let result = Segment { x1, y1, x2, y2 };
         Ok((result, remaining))
     }
@@ -19275,30 +18447,7 @@ impl From<PolyShape> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PolyShape> for u16 {
-    #[inline]
-    fn from(input: PolyShape) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PolyShape> for Option<u16> {
-    #[inline]
-    fn from(input: PolyShape) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PolyShape> for u32 {
-    #[inline]
-    fn from(input: PolyShape) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PolyShape> for Option<u32> {
-    #[inline]
-    fn from(input: PolyShape) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PolyShape, u16, u32);
 impl From<u8> for PolyShape {
     #[inline]
     fn from(value: u8) -> Self {
@@ -19633,42 +18782,19 @@ impl ImageFormat {
     pub const XY_PIXMAP: Self = Self(1);
     pub const Z_PIXMAP: Self = Self(2);
 }
-impl From<ImageFormat> for u8 {
-    #[inline]
-    fn from(input: ImageFormat) -> Self {
-        input.0
-    }
-}
-impl From<ImageFormat> for Option<u8> {
-    #[inline]
-    fn from(input: ImageFormat) -> Self {
-        Some(input.0)
-    }
-}
-impl From<ImageFormat> for u16 {
-    #[inline]
-    fn from(input: ImageFormat) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ImageFormat> for Option<u16> {
-    #[inline]
-    fn from(input: ImageFormat) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ImageFormat> for u32 {
+impl From<ImageFormat> for u8 {
     #[inline]
     fn from(input: ImageFormat) -> Self {
-        u32::from(input.0)
+        input.0
     }
 }
-impl From<ImageFormat> for Option<u32> {
+impl From<ImageFormat> for Option<u8> {
     #[inline]
     fn from(input: ImageFormat) -> Self {
-        Some(u32::from(input.0))
+        Some(input.0)
     }
 }
+enum_into_larger!(ImageFormat, u16, u32);
 impl From<u8> for ImageFormat {
     #[inline]
     fn from(value: u8) -> Self {
@@ -20449,30 +19575,7 @@ impl From<ColormapAlloc> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ColormapAlloc> for u16 {
-    #[inline]
-    fn from(input: ColormapAlloc) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ColormapAlloc> for Option<u16> {
-    #[inline]
-    fn from(input: ColormapAlloc) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ColormapAlloc> for u32 {
-    #[inline]
-    fn from(input: ColormapAlloc) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ColormapAlloc> for Option<u32> {
-    #[inline]
-    fn from(input: ColormapAlloc) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ColormapAlloc, u16, u32);
 impl From<u8> for ColormapAlloc {
     #[inline]
     fn from(value: u8) -> Self {
@@ -21726,30 +20829,7 @@ impl From<ColorFlag> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ColorFlag> for u16 {
-    #[inline]
-    fn from(input: ColorFlag) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ColorFlag> for Option<u16> {
-    #[inline]
-    fn from(input: ColorFlag) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ColorFlag> for u32 {
-    #[inline]
-    fn from(input: ColorFlag) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ColorFlag> for Option<u32> {
-    #[inline]
-    fn from(input: ColorFlag) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ColorFlag, u16, u32);
 impl From<u8> for ColorFlag {
     #[inline]
     fn from(value: u8) -> Self {
@@ -21781,12 +20861,12 @@ pub struct Coloritem {
 impl_debug_if_no_extra_traits!(Coloritem, "Coloritem");
 impl TryParse for Coloritem {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (pixel, remaining) = u32::try_parse(remaining)?;
-        let (red, remaining) = u16::try_parse(remaining)?;
-        let (green, remaining) = u16::try_parse(remaining)?;
-        let (blue, remaining) = u16::try_parse(remaining)?;
-        let (flags, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let pixel = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let red = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let green = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let blue = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let flags = fixed_bytes[10];
         let flags = flags.into();
         let result = Coloritem { pixel, red, green, blue, flags };
         Ok((result, remaining))
@@ -22011,10 +21091,10 @@ pub struct Rgb {
 impl_debug_if_no_extra_traits!(Rgb, "Rgb");
 impl TryParse for Rgb {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (red, remaining) = u16::try_parse(remaining)?;
-        let (green, remaining) = u16::try_parse(remaining)?;
-        let (blue, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let red = u16::from_ne_bytes([fixed_bytes[0], fixed_bytes[1]]);
+        let green = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let blue = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
         let result = Rgb { red, green, blue };
         Ok((result, remaining))
     }
@@ -22378,30 +21458,7 @@ impl From<PixmapEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<PixmapEnum> for u16 {
-    #[inline]
-    fn from(input: PixmapEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<PixmapEnum> for Option<u16> {
-    #[inline]
-    fn from(input: PixmapEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<PixmapEnum> for u32 {
-    #[inline]
-    fn from(input: PixmapEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<PixmapEnum> for Option<u32> {
-    #[inline]
-    fn from(input: PixmapEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(PixmapEnum, u16, u32);
 impl From<u8> for PixmapEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -22558,30 +21615,7 @@ impl From<FontEnum> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<FontEnum> for u16 {
-    #[inline]
-    fn from(input: FontEnum) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<FontEnum> for Option<u16> {
-    #[inline]
-    fn from(input: FontEnum) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<FontEnum> for u32 {
-    #[inline]
-    fn from(input: FontEnum) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<FontEnum> for Option<u32> {
-    #[inline]
-    fn from(input: FontEnum) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(FontEnum, u16, u32);
 impl From<u8> for FontEnum {
     #[inline]
     fn from(value: u8) -> Self {
@@ -22939,30 +21973,7 @@ impl From<QueryShapeOf> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<QueryShapeOf> for u16 {
-    #[inline]
-    fn from(input: QueryShapeOf) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<QueryShapeOf> for Option<u16> {
-    #[inline]
-    fn from(input: QueryShapeOf) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<QueryShapeOf> for u32 {
-    #[inline]
-    fn from(input: QueryShapeOf) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<QueryShapeOf> for Option<u32> {
-    #[inline]
-    fn from(input: QueryShapeOf) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(QueryShapeOf, u16, u32);
 impl From<u8> for QueryShapeOf {
     #[inline]
     fn from(value: u8) -> Self {
@@ -24522,30 +23533,7 @@ impl From<Blanking> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Blanking> for u16 {
-    #[inline]
-    fn from(input: Blanking) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Blanking> for Option<u16> {
-    #[inline]
-    fn from(input: Blanking) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Blanking> for u32 {
-    #[inline]
-    fn from(input: Blanking) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Blanking> for Option<u32> {
-    #[inline]
-    fn from(input: Blanking) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Blanking, u16, u32);
 impl From<u8> for Blanking {
     #[inline]
     fn from(value: u8) -> Self {
@@ -24583,30 +23571,7 @@ impl From<Exposures> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Exposures> for u16 {
-    #[inline]
-    fn from(input: Exposures) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Exposures> for Option<u16> {
-    #[inline]
-    fn from(input: Exposures) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Exposures> for u32 {
-    #[inline]
-    fn from(input: Exposures) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Exposures> for Option<u32> {
-    #[inline]
-    fn from(input: Exposures) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Exposures, u16, u32);
 impl From<u8> for Exposures {
     #[inline]
     fn from(value: u8) -> Self {
@@ -24867,30 +23832,7 @@ impl From<HostMode> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<HostMode> for u16 {
-    #[inline]
-    fn from(input: HostMode) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<HostMode> for Option<u16> {
-    #[inline]
-    fn from(input: HostMode) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<HostMode> for u32 {
-    #[inline]
-    fn from(input: HostMode) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<HostMode> for Option<u32> {
-    #[inline]
-    fn from(input: HostMode) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(HostMode, u16, u32);
 impl From<u8> for HostMode {
     #[inline]
     fn from(value: u8) -> Self {
@@ -24929,30 +23871,7 @@ impl From<Family> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Family> for u16 {
-    #[inline]
-    fn from(input: Family) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Family> for Option<u16> {
-    #[inline]
-    fn from(input: Family) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Family> for u32 {
-    #[inline]
-    fn from(input: Family) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Family> for Option<u32> {
-    #[inline]
-    fn from(input: Family) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Family, u16, u32);
 impl From<u8> for Family {
     #[inline]
     fn from(value: u8) -> Self {
@@ -25065,9 +23984,9 @@ impl_debug_if_no_extra_traits!(Host, "Host");
 impl TryParse for Host {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (family, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (address_len, remaining) = u16::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<4>(remaining)?;
+        let family = fixed_bytes[0];
+        let address_len = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
         let (address, remaining) = crate::x11_utils::parse_u8_list(remaining, address_len.try_to_usize()?)?;
         let address = address.to_vec();
         // Align offset to multiple of 4
@@ -25249,30 +24168,7 @@ impl From<AccessControl> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<AccessControl> for u16 {
-    #[inline]
-    fn from(input: AccessControl) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<AccessControl> for Option<u16> {
-    #[inline]
-    fn from(input: AccessControl) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<AccessControl> for u32 {
-    #[inline]
-    fn from(input: AccessControl) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<AccessControl> for Option<u32> {
-    #[inline]
-    fn from(input: AccessControl) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(AccessControl, u16, u32);
 impl From<u8> for AccessControl {
     #[inline]
     fn from(value: u8) -> Self {
@@ -25364,30 +24260,7 @@ impl From<CloseDown> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<CloseDown> for u16 {
-    #[inline]
-    fn from(input: CloseDown) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<CloseDown> for Option<u16> {
-    #[inline]
-    fn from(input: CloseDown) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<CloseDown> for u32 {
-    #[inline]
-    fn from(input: CloseDown) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<CloseDown> for Option<u32> {
-    #[inline]
-    fn from(input: CloseDown) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(CloseDown, u16, u32);
 impl From<u8> for CloseDown {
     #[inline]
     fn from(value: u8) -> Self {
@@ -25478,30 +24351,7 @@ impl From<Kill> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Kill> for u16 {
-    #[inline]
-    fn from(input: Kill) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Kill> for Option<u16> {
-    #[inline]
-    fn from(input: Kill) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Kill> for u32 {
-    #[inline]
-    fn from(input: Kill) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Kill> for Option<u32> {
-    #[inline]
-    fn from(input: Kill) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Kill, u16, u32);
 impl From<u8> for Kill {
     #[inline]
     fn from(value: u8) -> Self {
@@ -25699,30 +24549,7 @@ impl From<ScreenSaver> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ScreenSaver> for u16 {
-    #[inline]
-    fn from(input: ScreenSaver) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ScreenSaver> for Option<u16> {
-    #[inline]
-    fn from(input: ScreenSaver) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ScreenSaver> for u32 {
-    #[inline]
-    fn from(input: ScreenSaver) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ScreenSaver> for Option<u32> {
-    #[inline]
-    fn from(input: ScreenSaver) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ScreenSaver, u16, u32);
 impl From<u8> for ScreenSaver {
     #[inline]
     fn from(value: u8) -> Self {
@@ -25814,30 +24641,7 @@ impl From<MappingStatus> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<MappingStatus> for u16 {
-    #[inline]
-    fn from(input: MappingStatus) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<MappingStatus> for Option<u16> {
-    #[inline]
-    fn from(input: MappingStatus) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<MappingStatus> for u32 {
-    #[inline]
-    fn from(input: MappingStatus) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<MappingStatus> for Option<u32> {
-    #[inline]
-    fn from(input: MappingStatus) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(MappingStatus, u16, u32);
 impl From<u8> for MappingStatus {
     #[inline]
     fn from(value: u8) -> Self {
@@ -26116,30 +24920,7 @@ impl From<MapIndex> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<MapIndex> for u16 {
-    #[inline]
-    fn from(input: MapIndex) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<MapIndex> for Option<u16> {
-    #[inline]
-    fn from(input: MapIndex) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<MapIndex> for u32 {
-    #[inline]
-    fn from(input: MapIndex) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<MapIndex> for Option<u32> {
-    #[inline]
-    fn from(input: MapIndex) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(MapIndex, u16, u32);
 impl From<u8> for MapIndex {
     #[inline]
     fn from(value: u8) -> Self {
@@ -857,9 +857,10 @@ impl_debug_if_no_extra_traits!(ListItem, "ListItem");
 impl TryParse for ListItem {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (name, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (object_context_len, remaining) = u32::try_parse(remaining)?;
-        let (data_context_len, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let name = xproto::Atom::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let object_context_len = u32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let data_context_len = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
         let (object_context, remaining) = crate::x11_utils::parse_u8_list(remaining, object_context_len.try_to_usize()?)?;
         let object_context = object_context.to_vec();
         // Align offset to multiple of 4
@@ -64,30 +64,7 @@ impl From<Type> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<Type> for u16 {
-    #[inline]
-    fn from(input: Type) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<Type> for Option<u16> {
-    #[inline]
-    fn from(input: Type) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<Type> for u32 {
-    #[inline]
-    fn from(input: Type) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<Type> for Option<u32> {
-    #[inline]
-    fn from(input: Type) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(Type, u16, u32);
 impl From<u8> for Type {
     #[inline]
     fn from(value: u8) -> Self {
@@ -127,30 +104,7 @@ impl From<ImageFormatInfoType> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ImageFormatInfoType> for u16 {
-    #[inline]
-    fn from(input: ImageFormatInfoType) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ImageFormatInfoType> for Option<u16> {
-    #[inline]
-    fn from(input: ImageFormatInfoType) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ImageFormatInfoType> for u32 {
-    #[inline]
-    fn from(input: ImageFormatInfoType) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ImageFormatInfoType> for Option<u32> {
-    #[inline]
-    fn from(input: ImageFormatInfoType) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ImageFormatInfoType, u16, u32);
 impl From<u8> for ImageFormatInfoType {
     #[inline]
     fn from(value: u8) -> Self {
@@ -186,30 +140,7 @@ impl From<ImageFormatInfoFormat> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ImageFormatInfoFormat> for u16 {
-    #[inline]
-    fn from(input: ImageFormatInfoFormat) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ImageFormatInfoFormat> for Option<u16> {
-    #[inline]
-    fn from(input: ImageFormatInfoFormat) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ImageFormatInfoFormat> for u32 {
-    #[inline]
-    fn from(input: ImageFormatInfoFormat) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ImageFormatInfoFormat> for Option<u32> {
-    #[inline]
-    fn from(input: ImageFormatInfoFormat) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ImageFormatInfoFormat, u16, u32);
 impl From<u8> for ImageFormatInfoFormat {
     #[inline]
     fn from(value: u8) -> Self {
@@ -296,30 +227,7 @@ impl From<VideoNotifyReason> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<VideoNotifyReason> for u16 {
-    #[inline]
-    fn from(input: VideoNotifyReason) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<VideoNotifyReason> for Option<u16> {
-    #[inline]
-    fn from(input: VideoNotifyReason) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<VideoNotifyReason> for u32 {
-    #[inline]
-    fn from(input: VideoNotifyReason) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<VideoNotifyReason> for Option<u32> {
-    #[inline]
-    fn from(input: VideoNotifyReason) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(VideoNotifyReason, u16, u32);
 impl From<u8> for VideoNotifyReason {
     #[inline]
     fn from(value: u8) -> Self {
@@ -358,30 +266,7 @@ impl From<ScanlineOrder> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<ScanlineOrder> for u16 {
-    #[inline]
-    fn from(input: ScanlineOrder) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<ScanlineOrder> for Option<u16> {
-    #[inline]
-    fn from(input: ScanlineOrder) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<ScanlineOrder> for u32 {
-    #[inline]
-    fn from(input: ScanlineOrder) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<ScanlineOrder> for Option<u32> {
-    #[inline]
-    fn from(input: ScanlineOrder) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(ScanlineOrder, u16, u32);
 impl From<u8> for ScanlineOrder {
     #[inline]
     fn from(value: u8) -> Self {
@@ -421,30 +306,7 @@ impl From<GrabPortStatus> for Option<u8> {
         Some(input.0)
     }
 }
-impl From<GrabPortStatus> for u16 {
-    #[inline]
-    fn from(input: GrabPortStatus) -> Self {
-        u16::from(input.0)
-    }
-}
-impl From<GrabPortStatus> for Option<u16> {
-    #[inline]
-    fn from(input: GrabPortStatus) -> Self {
-        Some(u16::from(input.0))
-    }
-}
-impl From<GrabPortStatus> for u32 {
-    #[inline]
-    fn from(input: GrabPortStatus) -> Self {
-        u32::from(input.0)
-    }
-}
-impl From<GrabPortStatus> for Option<u32> {
-    #[inline]
-    fn from(input: GrabPortStatus) -> Self {
-        Some(u32::from(input.0))
-    }
-}
+enum_into_larger!(GrabPortStatus, u16, u32);
 impl From<u8> for GrabPortStatus {
     #[inline]
     fn from(value: u8) -> Self {
@@ -475,8 +337,9 @@ pub struct Rational {
 impl_debug_if_no_extra_traits!(Rational, "Rational");
 impl TryParse for Rational {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (numerator, remaining) = i32::try_parse(remaining)?;
-        let (denominator, remaining) = i32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let numerator = i32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let denominator = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
         let result = Rational { numerator, denominator };
         Ok((result, remaining))
     }
@@ -514,9 +377,9 @@ pub struct Format {
 impl_debug_if_no_extra_traits!(Format, "Format");
 impl TryParse for Format {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (visual, remaining) = xproto::Visualid::try_parse(remaining)?;
-        let (depth, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(3..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let visual = xproto::Visualid::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let depth = fixed_bytes[4];
         let result = Format { visual, depth };
         Ok((result, remaining))
     }
@@ -559,12 +422,12 @@ impl_debug_if_no_extra_traits!(AdaptorInfo, "AdaptorInfo");
 impl TryParse for AdaptorInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (base_id, remaining) = Port::try_parse(remaining)?;
-        let (name_size, remaining) = u16::try_parse(remaining)?;
-        let (num_ports, remaining) = u16::try_parse(remaining)?;
-        let (num_formats, remaining) = u16::try_parse(remaining)?;
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let base_id = Port::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let name_size = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let num_ports = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let num_formats = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let type_ = fixed_bytes[10];
         let (name, remaining) = crate::x11_utils::parse_u8_list(remaining, name_size.try_to_usize()?)?;
         let name = name.to_vec();
         // Align offset to multiple of 4
@@ -642,11 +505,11 @@ impl_debug_if_no_extra_traits!(EncodingInfo, "EncodingInfo");
 impl TryParse for EncodingInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (encoding, remaining) = Encoding::try_parse(remaining)?;
-        let (name_size, remaining) = u16::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<12>(remaining)?;
+        let encoding = Encoding::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let name_size = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let width = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let height = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
         let (rate, remaining) = Rational::try_parse(remaining)?;
         let (name, remaining) = crate::x11_utils::parse_u8_list(remaining, name_size.try_to_usize()?)?;
         let name = name.to_vec();
@@ -708,11 +571,12 @@ pub struct Image {
 impl_debug_if_no_extra_traits!(Image, "Image");
 impl TryParse for Image {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (id, remaining) = u32::try_parse(remaining)?;
-        let (width, remaining) = u16::try_parse(remaining)?;
-        let (height, remaining) = u16::try_parse(remaining)?;
-        let (data_size, remaining) = u32::try_parse(remaining)?;
-        let (num_planes, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let id = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let width = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let height = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let data_size = u32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let num_planes = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let (pitches, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_planes.try_to_usize()?)?;
         let (offsets, remaining) = crate::x11_utils::parse_list::<u32>(remaining, num_planes.try_to_usize()?)?;
         let (data, remaining) = crate::x11_utils::parse_u8_list(remaining, data_size.try_to_usize()?)?;
@@ -785,10 +649,11 @@ impl_debug_if_no_extra_traits!(AttributeInfo, "AttributeInfo");
 impl TryParse for AttributeInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let value = remaining;
-        let (flags, remaining) = u32::try_parse(remaining)?;
-        let (min, remaining) = i32::try_parse(remaining)?;
-        let (max, remaining) = i32::try_parse(remaining)?;
-        let (size, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let flags = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let min = i32::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let max = i32::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let size = u32::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let (name, remaining) = crate::x11_utils::parse_u8_list(remaining, size.try_to_usize()?)?;
         let name = name.to_vec();
         // Align offset to multiple of 4
@@ -864,10 +729,10 @@ pub struct ImageFormatInfo {
 impl_debug_if_no_extra_traits!(ImageFormatInfo, "ImageFormatInfo");
 impl TryParse for ImageFormatInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (id, remaining) = u32::try_parse(remaining)?;
-        let (type_, remaining) = u8::try_parse(remaining)?;
-        let (byte_order, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(2..).ok_or(ParseError::InsufficientData)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<8>(remaining)?;
+        let id = u32::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let type_ = fixed_bytes[4];
+        let byte_order = fixed_bytes[5];
         let (guid, remaining) = crate::x11_utils::parse_u8_array::<16>(remaining)?;
         let (bpp, remaining) = u8::try_parse(remaining)?;
         let (num_planes, remaining) = u8::try_parse(remaining)?;
@@ -1111,12 +976,13 @@ impl_debug_if_no_extra_traits!(VideoNotifyEvent, "VideoNotifyEvent");
 impl TryParse for VideoNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let (reason, remaining) = u8::try_parse(remaining)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (drawable, remaining) = xproto::Drawable::try_parse(remaining)?;
-        let (port, remaining) = Port::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<16>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let reason = fixed_bytes[1];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let drawable = xproto::Drawable::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let port = Port::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
         let reason = reason.into();
         let result = VideoNotifyEvent { response_type, reason, sequence, time, drawable, port };
         let _ = remaining;
@@ -1231,13 +1097,13 @@ impl_debug_if_no_extra_traits!(PortNotifyEvent, "PortNotifyEvent");
 impl TryParse for PortNotifyEvent {
     fn try_parse(initial_value: &[u8]) -> Result<(Self, &[u8]), ParseError> {
         let remaining = initial_value;
-        let (response_type, remaining) = u8::try_parse(remaining)?;
-        let remaining = remaining.get(1..).ok_or(ParseError::InsufficientData)?;
-        let (sequence, remaining) = u16::try_parse(remaining)?;
-        let (time, remaining) = xproto::Timestamp::try_parse(remaining)?;
-        let (port, remaining) = Port::try_parse(remaining)?;
-        let (attribute, remaining) = xproto::Atom::try_parse(remaining)?;
-        let (value, remaining) = i32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<20>(remaining)?;
+        let response_type = fixed_bytes[0];
+        let sequence = u16::from_ne_bytes([fixed_bytes[2], fixed_bytes[3]]);
+        let time = xproto::Timestamp::from_ne_bytes([fixed_bytes[4], fixed_bytes[5], fixed_bytes[6], fixed_bytes[7]]);
+        let port = Port::from_ne_bytes([fixed_bytes[8], fixed_bytes[9], fixed_bytes[10], fixed_bytes[11]]);
+        let attribute = xproto::Atom::from_ne_bytes([fixed_bytes[12], fixed_bytes[13], fixed_bytes[14], fixed_bytes[15]]);
+        let value = i32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
         let result = PortNotifyEvent { response_type, sequence, time, port, attribute, value };
         let _ = remaining;
         let remaining = initial_value.get(32..)
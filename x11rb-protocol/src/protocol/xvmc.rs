@@ -59,15 +59,16 @@ pub struct SurfaceInfo {
 impl_debug_if_no_extra_traits!(SurfaceInfo, "SurfaceInfo");
 impl TryParse for SurfaceInfo {
     fn try_parse(remaining: &[u8]) -> Result<(Self, &[u8]), ParseError> {
-        let (id, remaining) = Surface::try_parse(remaining)?;
-        let (chroma_format, remaining) = u16::try_parse(remaining)?;
-        let (pad0, remaining) = u16::try_parse(remaining)?;
-        let (max_width, remaining) = u16::try_parse(remaining)?;
-        let (max_height, remaining) = u16::try_parse(remaining)?;
-        let (subpicture_max_width, remaining) = u16::try_parse(remaining)?;
-        let (subpicture_max_height, remaining) = u16::try_parse(remaining)?;
-        let (mc_type, remaining) = u32::try_parse(remaining)?;
-        let (flags, remaining) = u32::try_parse(remaining)?;
+        let (fixed_bytes, remaining) = crate::x11_utils::parse_u8_array_ref::<24>(remaining)?;
+        let id = Surface::from_ne_bytes([fixed_bytes[0], fixed_bytes[1], fixed_bytes[2], fixed_bytes[3]]);
+        let chroma_format = u16::from_ne_bytes([fixed_bytes[4], fixed_bytes[5]]);
+        let pad0 = u16::from_ne_bytes([fixed_bytes[6], fixed_bytes[7]]);
+        let max_width = u16::from_ne_bytes([fixed_bytes[8], fixed_bytes[9]]);
+        let max_height = u16::from_ne_bytes([fixed_bytes[10], fixed_bytes[11]]);
+        let subpicture_max_width = u16::from_ne_bytes([fixed_bytes[12], fixed_bytes[13]]);
+        let subpicture_max_height = u16::from_ne_bytes([fixed_bytes[14], fixed_bytes[15]]);
+        let mc_type = u32::from_ne_bytes([fixed_bytes[16], fixed_bytes[17], fixed_bytes[18], fixed_bytes[19]]);
+        let flags = u32::from_ne_bytes([fixed_bytes[20], fixed_bytes[21], fixed_bytes[22], fixed_bytes[23]]);
         let result = SurfaceInfo { id, chroma_format, pad0, max_width, max_height, subpicture_max_width, subpicture_max_height, mc_type, flags };
         Ok((result, remaining))
     }
@@ -548,6 +548,24 @@ where
     Ok((result, remaining))
 }
 
+/// Parse an array of objects from the given data.
+///
+/// This is the fixed-length counterpart of [`parse_list`] for types that are cheap to copy,
+/// like the primitive integer types.
+pub(crate) fn parse_array<T, const N: usize>(data: &[u8]) -> Result<([T; N], &[u8]), ParseError>
+where
+    T: TryParse + Copy + Default,
+{
+    let mut remaining = data;
+    let mut result = [T::default(); N];
+    for entry in result.iter_mut() {
+        let (value, new_remaining) = T::try_parse(remaining)?;
+        *entry = value;
+        remaining = new_remaining;
+    }
+    Ok((result, remaining))
+}
+
 /// Parse a list of `u8` from the given data.
 #[inline]
 pub(crate) fn parse_u8_list(data: &[u8], list_length: usize) -> Result<(&[u8], &[u8]), ParseError> {
@@ -694,6 +712,27 @@ macro_rules! bitmask_binop {
     };
 }
 
+// This macro is used by the generated code to convert an enum into the integer types that
+// are larger than its underlying type, both directly and wrapped in an `Option`.
+macro_rules! enum_into_larger {
+    ($t:ty, $($larger:ty),+) => {
+        $(
+            impl From<$t> for $larger {
+                #[inline]
+                fn from(input: $t) -> Self {
+                    <$larger>::from(input.0)
+                }
+            }
+            impl From<$t> for core::option::Option<$larger> {
+                #[inline]
+                fn from(input: $t) -> Self {
+                    Some(<$larger>::from(input.0))
+                }
+            }
+        )+
+    };
+}
+
 macro_rules! impl_debug_if_no_extra_traits {
     ($type:ty, $name:literal) => {
         #[cfg(not(feature = "extra-traits"))]
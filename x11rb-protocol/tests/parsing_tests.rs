@@ -168,3 +168,139 @@ fn parse_xi_get_property_reply_format_0() {
         )),
     );
 }
+
+#[cfg(feature = "render")]
+#[test]
+fn error_kind_from_extension_error_code() {
+    use x11rb_protocol::protocol::{render, ErrorKind};
+    use x11rb_protocol::x11_utils::{ExtInfoProvider, ExtensionInformation};
+
+    struct Provider;
+
+    impl ExtInfoProvider for Provider {
+        fn get_from_major_opcode(&self, _major_opcode: u8) -> Option<(&str, ExtensionInformation)> {
+            unimplemented!()
+        }
+        fn get_from_event_code(&self, _event_code: u8) -> Option<(&str, ExtensionInformation)> {
+            unimplemented!()
+        }
+        fn get_from_error_code(&self, error_code: u8) -> Option<(&str, ExtensionInformation)> {
+            let info = ExtensionInformation {
+                major_opcode: 140,
+                first_event: 0,
+                first_error: 150,
+            };
+            Some((render::X11_EXTENSION_NAME, info)).filter(|_| error_code >= 150)
+        }
+    }
+
+    let expected = [
+        (render::PICT_FORMAT_ERROR, ErrorKind::RenderPictFormat),
+        (render::PICTURE_ERROR, ErrorKind::RenderPicture),
+        (render::PICT_OP_ERROR, ErrorKind::RenderPictOp),
+        (render::GLYPH_SET_ERROR, ErrorKind::RenderGlyphSet),
+        (render::GLYPH_ERROR, ErrorKind::RenderGlyph),
+    ];
+    for (code, kind) in expected {
+        assert_eq!(ErrorKind::from_wire_error_code(150 + code, &Provider), kind);
+    }
+    assert_eq!(
+        ErrorKind::from_wire_error_code(155, &Provider),
+        ErrorKind::Unknown(155)
+    );
+}
+
+#[test]
+fn parse_client_message_data_arrays() {
+    use x11rb_protocol::protocol::xproto::ClientMessageData;
+
+    let data32 = [1, 0x0203_0405, 6, 7, 0xffff_ffff];
+    let bytes: Vec<u8> = data32.iter().flat_map(|x: &u32| x.to_ne_bytes()).collect();
+    let (data, remaining) = ClientMessageData::try_parse(&bytes).unwrap();
+    assert!(remaining.is_empty());
+    assert_eq!(data.as_data32(), data32);
+
+    let data16: Vec<u16> = bytes
+        .chunks(2)
+        .map(|b| u16::from_ne_bytes([b[0], b[1]]))
+        .collect();
+    assert_eq!(data.as_data16()[..], data16[..]);
+}
+
+#[test]
+fn parse_event_with_fixed_prefix() {
+    use x11rb_protocol::protocol::xproto::MapNotifyEvent;
+
+    let mut bytes = vec![19, 0xaa];
+    bytes.extend_from_slice(&0x1234u16.to_ne_bytes());
+    bytes.extend_from_slice(&0x0040_0001u32.to_ne_bytes());
+    bytes.extend_from_slice(&0x0060_0002u32.to_ne_bytes());
+    bytes.push(1);
+    bytes.resize(32, 0xbb);
+
+    let (event, remaining) = MapNotifyEvent::try_parse(&bytes).unwrap();
+    assert!(remaining.is_empty());
+    assert_eq!(event.response_type, 19);
+    assert_eq!(event.sequence, 0x1234);
+    assert_eq!(event.event, 0x0040_0001);
+    assert_eq!(event.window, 0x0060_0002);
+    assert!(event.override_redirect);
+
+    // Short inputs are rejected both within the fixed prefix and after it
+    for len in [15, 31] {
+        assert_eq!(
+            MapNotifyEvent::try_parse(&bytes[..len]).unwrap_err(),
+            ParseError::InsufficientData
+        );
+    }
+}
+
+#[cfg(feature = "xfixes")]
+#[test]
+fn parse_event_from_dense_extension() {
+    use x11rb_protocol::protocol::{xfixes, Event};
+    use x11rb_protocol::x11_utils::{ExtInfoProvider, ExtensionInformation};
+
+    struct Provider;
+
+    impl ExtInfoProvider for Provider {
+        fn get_from_major_opcode(&self, _major_opcode: u8) -> Option<(&str, ExtensionInformation)> {
+            unimplemented!()
+        }
+        fn get_from_event_code(&self, event_code: u8) -> Option<(&str, ExtensionInformation)> {
+            let info = ExtensionInformation {
+                major_opcode: 140,
+                first_event: 90,
+                first_error: 0,
+            };
+            Some((xfixes::X11_EXTENSION_NAME, info)).filter(|_| event_code >= 90)
+        }
+        fn get_from_error_code(&self, _error_code: u8) -> Option<(&str, ExtensionInformation)> {
+            unimplemented!()
+        }
+    }
+
+    let event_bytes = |code: u8| {
+        let mut bytes = vec![0; 32];
+        bytes[0] = 90 + code;
+        bytes
+    };
+
+    let event = Event::parse(&event_bytes(xfixes::SELECTION_NOTIFY_EVENT), &Provider).unwrap();
+    match event {
+        Event::XfixesSelectionNotify(event) => assert_eq!(event.response_type, 90),
+        _ => panic!("Unexpected event {:?}", event),
+    }
+
+    let event = Event::parse(&event_bytes(xfixes::CURSOR_NOTIFY_EVENT), &Provider).unwrap();
+    match event {
+        Event::XfixesCursorNotify(event) => assert_eq!(event.response_type, 91),
+        _ => panic!("Unexpected event {:?}", event),
+    }
+
+    let bytes = event_bytes(2);
+    match Event::parse(&bytes, &Provider).unwrap() {
+        Event::Unknown(unknown) => assert_eq!(unknown, bytes),
+        event => panic!("Unexpected event {:?}", event),
+    }
+}